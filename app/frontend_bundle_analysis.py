@@ -17,6 +17,7 @@ from app.utils.github_utils import (
     fetch_workflow_runs,
     fetch_workflow_runs_for_commit,
 )
+from app.utils.workflow_metrics import BUNDLE_ENTRY_GZIP, BUNDLE_TOTAL_GZIP, record_run_metrics
 
 st.set_page_config(page_title="Frontend bundle analysis", page_icon="📦", layout="wide")
 
@@ -552,6 +553,7 @@ if not data:
 df = pd.DataFrame(data)
 df["created_at"] = pd.to_datetime(df["created_at"])
 df = df.sort_values("created_at")
+record_run_metrics("pr-preview.yml", df, {BUNDLE_TOTAL_GZIP: "total_gzip", BUNDLE_ENTRY_GZIP: "entry_gzip"})
 
 # Display metrics (Latest run)
 latest = df.iloc[-1]
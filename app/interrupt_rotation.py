@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any
 
 import humanize
 import pandas as pd
@@ -22,6 +23,10 @@ from app.utils.interrupt_data import (
     get_reported_bugs,
     get_wheel_size_metrics,
 )
+from app.utils.workflow_metrics import start_workflow_metrics_sync
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 # Set page configuration
 st.set_page_config(page_title="Interrupt rotation", page_icon="🩺", layout="wide")
@@ -33,95 +38,112 @@ HIGH_PRIORITY_SLA_LABELS = {
     "priority:P1": "≤ 1 week",
     "priority:P2": "≤ 2 weeks",
 }
+# How often the CI metrics reload while the workflow metrics sync is running.
+CI_METRICS_SYNC_POLL_SECONDS = 5
+
+
+def render_ci_metric(
+    label: str,
+    window: tuple[Any, Any] | None,
+    format_value: Callable[[Any], str],
+    format_delta: Callable[[Any], str],
+    **kwargs: Any,
+) -> None:
+    """Render a CI metric, or a placeholder if it isn't in the workflow metrics table yet."""
+    if window is None:
+        st.metric(label, "—", border=True, **kwargs)
+        return
+    value, change = window
+    st.metric(label, format_value(value), format_delta(change), border=True, **kwargs)
+
+
+def _naturalsize(size: int) -> str:
+    return humanize.naturalsize(size, binary=True)
+
+
+def render_ci_metrics_row(selected_since: date) -> None:
+    syncing = start_workflow_metrics_sync()
+    if st.session_state.get("ci_metrics_syncing") and not syncing:
+        # The sync finished, rerun the whole page to render the metrics without polling.
+        st.session_state.ci_metrics_syncing = False
+        st.rerun()
+    if syncing:
+        st.caption(
+            ":material/sync: The CI metrics of recent workflow runs are being collected in the background, "
+            "they are updated as they come in."
+        )
 
-
-@st.fragment(parallel=True)
-def render_ci_metrics(selected_since: date, selected_refresh_nonce: int) -> None:
     col1, col2, col3 = st.columns(3)
-    with col1, st.skeleton(height=110):
-        py_coverage, py_coverage_change = get_python_test_coverage_metrics(
-            selected_since,
-            refresh_nonce=selected_refresh_nonce,
-        )
-        st.metric(
+    with col1:
+        render_ci_metric(
             "Python Test Coverage",
-            f"{py_coverage:.2f}%",
-            f"{py_coverage_change:+.2f}%",
+            get_python_test_coverage_metrics(selected_since),
+            lambda value: f"{value:.2f}%",
+            lambda change: f"{change:+.2f}%",
             delta_color="normal",
-            border=True,
             help="Percentage of lines covered by tests in the Python codebase.",
         )
-    with col2, st.skeleton(height=110):
-        fe_coverage, fe_coverage_change = get_frontend_test_coverage_metrics(
-            selected_since,
-            refresh_nonce=selected_refresh_nonce,
-        )
-        st.metric(
+    with col2:
+        render_ci_metric(
             "Frontend Test Coverage",
-            f"{fe_coverage:.2f}%",
-            f"{fe_coverage_change:+.2f}%",
+            get_frontend_test_coverage_metrics(selected_since),
+            lambda value: f"{value:.2f}%",
+            lambda change: f"{change:+.2f}%",
             delta_color="normal",
-            border=True,
             help="Percentage of lines covered by tests in the Frontend codebase.",
         )
-    with col3, st.skeleton(height=110):
-        wheel_size, wheel_size_change = get_wheel_size_metrics(
-            selected_since,
-            refresh_nonce=selected_refresh_nonce,
-        )
-        st.metric(
+    with col3:
+        render_ci_metric(
             "Wheel Size",
-            humanize.naturalsize(wheel_size, binary=True),
-            humanize.naturalsize(wheel_size_change, binary=True),
+            get_wheel_size_metrics(selected_since),
+            _naturalsize,
+            _naturalsize,
             delta_color="inverse",
-            border=True,
             help="Size of the Streamlit Python package (wheel file).",
         )
 
+    total_gzip, entry_gzip = get_bundle_size_metrics(selected_since)
     col1, col2, col3 = st.columns(3)
-    with col1, st.skeleton(height=110):
-        (
-            total_gzip,
-            total_gzip_change,
-            entry_gzip,
-            entry_gzip_change,
-        ) = get_bundle_size_metrics(
-            selected_since,
-            refresh_nonce=selected_refresh_nonce,
-        )
-
-        st.metric(
+    with col1:
+        render_ci_metric(
             "Total Bundle (gzip)",
-            humanize.naturalsize(total_gzip, binary=True),
-            humanize.naturalsize(total_gzip_change, binary=True),
+            total_gzip,
+            _naturalsize,
+            _naturalsize,
             delta_color="inverse",
-            border=True,
             help="Total size of all JavaScript files after Gzip compression.",
         )
-    with col2, st.skeleton(height=110):
-        st.metric(
+    with col2:
+        render_ci_metric(
             "Entry Bundle (gzip)",
-            humanize.naturalsize(entry_gzip, binary=True),
-            humanize.naturalsize(entry_gzip_change, binary=True),
+            entry_gzip,
+            _naturalsize,
+            _naturalsize,
             delta_color="inverse",
-            border=True,
             help="Size of the entry point chunks (initial load) after Gzip compression.",
         )
-    with col3, st.skeleton(height=110):
-        pw_count, pw_count_change = get_playwright_test_count_metrics(
-            selected_since,
-            refresh_nonce=selected_refresh_nonce,
-        )
-        st.metric(
+    with col3:
+        render_ci_metric(
             "Playwright Tests",
-            f"{pw_count:,}",
-            f"{pw_count_change:+,}",
+            get_playwright_test_count_metrics(selected_since),
+            lambda value: f"{value:,}",
+            lambda change: f"{change:+,}",
             delta_color="off",
-            border=True,
             help="Total number of Playwright E2E tests (across all browsers).",
         )
 
 
+def render_ci_metrics(selected_since: date) -> None:
+    # The metrics are read from the workflow metrics table, new runs are added to it in the
+    # background. While that sync runs, the row reloads itself to pick up new values.
+    syncing = start_workflow_metrics_sync()
+    st.session_state.ci_metrics_syncing = syncing
+    st.fragment(
+        render_ci_metrics_row,
+        run_every=CI_METRICS_SYNC_POLL_SECONDS if syncing else None,
+    )(selected_since)
+
+
 @st.fragment(parallel=True)
 def render_issue_action_items(selected_since: date, selected_refresh_nonce: int) -> None:
     """Render the issue-focused action-item tables (top of the Action Items list).
@@ -718,6 +740,7 @@ timeframe = st.sidebar.selectbox(
 )
 if st.sidebar.button(":material/refresh: Refresh data", width="stretch"):
     st.session_state.interrupt_refresh_nonce += 1
+    start_workflow_metrics_sync(force=True)
 
 days = 14 if timeframe == "Last 14 days" else 7
 since = date.today() - timedelta(days=days)
@@ -725,9 +748,9 @@ refresh_nonce = st.session_state.interrupt_refresh_nonce
 
 # All slow sections are `parallel=True` fragments dispatched here. During a full
 # rerun they run concurrently in the coordinator thread pool, so the issue/PR
-# snapshot, CI-artifact downloads, flaky-test annotations, and monitored-repo PR
-# fetches overlap instead of running one after another on the main thread.
-render_ci_metrics(since, refresh_nonce)
+# snapshot, flaky-test annotations, and monitored-repo PR fetches overlap
+# instead of running one after another on the main thread.
+render_ci_metrics(since)
 
 with st.expander("Helpful processes", icon=":material/menu_book:"):
     st.markdown("""
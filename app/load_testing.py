@@ -19,6 +19,19 @@ from app.utils.github_utils import (
     fetch_workflow_runs_for_commit,
     get_headers,
 )
+from app.utils.load_test_data import (
+    MIN_BASELINE_RUNS,
+    REGRESSION_Z_THRESHOLD,
+    compare_with_baseline,
+    histogram_percentiles,
+    leak_slope_mb_per_session,
+    merge_latency_histograms,
+    parse_latency_histogram,
+    parse_server_samples,
+    server_samples_frame,
+    steady_state_cpu_per_user,
+)
+from app.utils.load_test_history import is_expired_run, load_runs_concurrently, mark_expired_run
 
 st.set_page_config(page_title="Load testing", page_icon="⚡", layout="wide")
 
@@ -37,7 +50,7 @@ with title_row:
 if pr_number:
     st.caption(
         f"Comparing load test stats for [PR #{pr_number}](https://github.com/streamlit/streamlit/pull/{pr_number}) "
-        "against the latest develop run."
+        "against the distribution of recent develop runs."
     )
 else:
     st.caption(
@@ -48,7 +61,13 @@ else:
 # Sidebar controls
 if pr_number:
     since_date: datetime | None = None
-    workflow_runs_limit = 1
+    workflow_runs_limit = st.sidebar.slider(
+        "Develop baseline runs",
+        min_value=MIN_BASELINE_RUNS,
+        max_value=50,
+        value=20,
+        help="Number of recent develop runs that make up the baseline distribution the PR is compared against.",
+    )
 else:
     time_period = st.sidebar.selectbox(
         "Time period",
@@ -129,6 +148,11 @@ def get_load_test_results(run_id: int) -> dict[str, Any] | None:
     if not results_artifact:
         return None
 
+    # Expired artifacts can't be downloaded anymore, don't try again on the next cold load
+    if results_artifact.get("expired"):
+        mark_expired_run(run_id)
+        return None
+
     # Try the standard zip download first (works for archived artifacts)
     artifact_content = download_artifact(results_artifact["archive_download_url"])
     if artifact_content:
@@ -168,6 +192,7 @@ def flatten_scenario_records(run: dict[str, Any], results: dict[str, Any]) -> li
         session = scenario.get("session_metrics", {})
         initial_load = session.get("initial_load_time_ms", {})
         rerun = session.get("rerun_time_ms", {})
+        server_samples = parse_server_samples(server)
 
         records.append(
             {
@@ -187,6 +212,10 @@ def flatten_scenario_records(run: dict[str, Any], results: dict[str, Any]) -> li
                 "cpu_avg_pct": server.get("cpu_percent_avg", 0),
                 "cpu_peak_pct": server.get("cpu_percent_peak", 0),
                 "thread_count_max": server.get("thread_count_max", 0),
+                # Time-resolved server metrics (only if the harness emitted samples)
+                "server_samples": server_samples,
+                "leak_mb_per_session": leak_slope_mb_per_session(server_samples),
+                "cpu_per_user_pct": steady_state_cpu_per_user(server_samples, scenario.get("concurrent_users", 0)),
                 # Session metrics
                 "total_sessions": session.get("total_sessions", 0),
                 "sessions_completed": session.get("sessions_completed", 0),
@@ -206,6 +235,9 @@ def flatten_scenario_records(run: dict[str, Any], results: dict[str, Any]) -> li
                 "rerun_mean_ms": rerun.get("mean", 0),
                 "rerun_min_ms": rerun.get("min", 0),
                 "rerun_max_ms": rerun.get("max", 0),
+                # Latency histograms (only if the harness emitted them)
+                "initial_load_histogram": parse_latency_histogram(initial_load),
+                "rerun_histogram": parse_latency_histogram(rerun),
             }
         )
 
@@ -229,19 +261,21 @@ def get_load_test_run_data(run: dict[str, Any]) -> dict[str, Any] | None:
     }
 
 
-def get_latest_develop_load_test() -> dict[str, Any] | None:
-    """Get load test data for the latest successful workflow run on develop."""
-    latest_runs = fetch_workflow_runs(LOAD_TESTING_WORKFLOW, limit=1)
-    if not latest_runs:
+def get_develop_baseline_load_tests(limit: int) -> list[dict[str, Any]]:
+    """Get load test data for the latest successful workflow runs on develop, newest first."""
+    develop_runs = fetch_workflow_runs(LOAD_TESTING_WORKFLOW, limit=limit)
+    if not develop_runs:
         st.error(f"No recent successful `{LOAD_TESTING_WORKFLOW}` runs found on develop.")
-        return None
+        return []
 
-    load_test_data = get_load_test_run_data(latest_runs[0])
-    if not load_test_data:
-        st.error("Could not fetch load test results for the latest develop run.")
-        return None
+    baseline_data_by_run, _failures = load_runs_concurrently(
+        [run for run in develop_runs if not is_expired_run(run["id"])], get_load_test_run_data
+    )
+    baseline_data = [baseline_data_by_run[run["id"]] for run in develop_runs if run["id"] in baseline_data_by_run]
+    if not baseline_data:
+        st.error("Could not fetch load test results for the latest develop runs.")
 
-    return load_test_data
+    return baseline_data
 
 
 def get_pr_load_test(pr_info: dict[str, Any]) -> dict[str, Any] | None:
@@ -274,7 +308,7 @@ def summarize_load_test_records(records: list[dict[str, Any]]) -> dict[str, floa
             "total_failed_sessions": 0.0,
         }
 
-    return {
+    summary = {
         "avg_initial_load_p50_s": run_df["initial_load_p50_ms"].mean() / 1000,
         "avg_initial_load_p95_s": run_df["initial_load_p95_ms"].mean() / 1000,
         "avg_rerun_p50_ms": run_df["rerun_p50_ms"].mean(),
@@ -282,6 +316,18 @@ def summarize_load_test_records(records: list[dict[str, Any]]) -> dict[str, floa
         "total_failed_sessions": run_df["sessions_failed"].sum(),
     }
 
+    # Percentiles can't be averaged across scenarios, use the merged histograms if all scenarios have them.
+    if run_df["initial_load_histogram"].notna().all():
+        initial_load = histogram_percentiles(merge_latency_histograms(run_df["initial_load_histogram"]), (50, 95))
+        summary["avg_initial_load_p50_s"] = initial_load[50] / 1000
+        summary["avg_initial_load_p95_s"] = initial_load[95] / 1000
+    if run_df["rerun_histogram"].notna().all():
+        summary["avg_rerun_p50_ms"] = histogram_percentiles(merge_latency_histograms(run_df["rerun_histogram"]), (50,))[
+            50
+        ]
+
+    return summary
+
 
 def format_metric_delta(delta: float, unit: str, precision: int) -> str:
     """Format a signed metric delta for st.metric."""
@@ -303,111 +349,60 @@ def get_comparison_metric_definitions() -> list[tuple[str, str, float, str]]:
         ("Memory growth", "memory_growth_mb", 1, "MB"),
         ("CPU avg", "cpu_avg_pct", 1, "%"),
         ("CPU peak", "cpu_peak_pct", 1, "%"),
+        ("Leak slope", "leak_mb_per_session", 1, "MB/session"),
+        ("CPU per user", "cpu_per_user_pct", 1, "%"),
         ("Failed sessions", "sessions_failed", 1, "count"),
         ("Errors", "error_count", 1, "count"),
     ]
 
 
-def scale_metric_value(value: Any, scale: float) -> float | None:
-    """Scale a raw metric value for display."""
-    if pd.isna(value):
-        return None
-
-    return float(value) / scale
-
-
 def build_scenario_comparison_df(
-    pr_records: list[dict[str, Any]], develop_records: list[dict[str, Any]]
+    pr_records: list[dict[str, Any]], baseline_records: list[dict[str, Any]]
 ) -> pd.DataFrame:
-    """Build a long-form scenario comparison table."""
-    pr_df = pd.DataFrame(pr_records)
-    develop_df = pd.DataFrame(develop_records)
-    if pr_df.empty and develop_df.empty:
-        return pd.DataFrame()
-
-    merged_df = pr_df.merge(
-        develop_df,
-        on="scenario",
-        how="outer",
-        suffixes=("_pr", "_develop"),
-    )
-
-    comparison_records = []
-    for _, row in merged_df.iterrows():
-        for label, key, scale, unit in get_comparison_metric_definitions():
-            pr_display_value = scale_metric_value(row.get(f"{key}_pr"), scale)
-            develop_display_value = scale_metric_value(row.get(f"{key}_develop"), scale)
-
-            if pr_display_value is None:
-                comparison_records.append(
-                    {
-                        "Scenario": row["scenario"],
-                        "Metric": label,
-                        "Unit": unit,
-                        "PR": None,
-                        "Develop": develop_display_value,
-                        "Delta": None,
-                        "Delta %": None,
-                        "Impact": "Develop only",
-                    }
-                )
-                continue
-
-            if develop_display_value is None:
-                comparison_records.append(
-                    {
-                        "Scenario": row["scenario"],
-                        "Metric": label,
-                        "Unit": unit,
-                        "PR": pr_display_value,
-                        "Develop": None,
-                        "Delta": None,
-                        "Delta %": None,
-                        "Impact": "PR only",
-                    }
-                )
-                continue
-
-            delta = pr_display_value - develop_display_value
-            delta_pct = (delta / develop_display_value * 100) if develop_display_value else None
-            impact = "Regression" if delta > 0 else "Improvement" if delta < 0 else "No change"
-
-            comparison_records.append(
-                {
-                    "Scenario": row["scenario"],
-                    "Metric": label,
-                    "Unit": unit,
-                    "PR": pr_display_value,
-                    "Develop": develop_display_value,
-                    "Delta": delta,
-                    "Delta %": delta_pct,
-                    "Impact": impact,
-                }
-            )
+    """Build a long-form scenario comparison table of the PR against the develop baseline distribution."""
+    definitions = {key: (label, scale, unit) for label, key, scale, unit in get_comparison_metric_definitions()}
+    comparison_df = compare_with_baseline(pd.DataFrame(pr_records), pd.DataFrame(baseline_records), definitions)
+    if comparison_df.empty:
+        return comparison_df
 
-    return pd.DataFrame(comparison_records)
+    # Show the metrics in the order of their definitions, with display units.
+    comparison_df["order"] = comparison_df["metric"].map(list(definitions).index)
+    comparison_df = comparison_df.sort_values(["scenario", "order"])
+    scales = comparison_df["metric"].map(lambda key: definitions[key][1])
+    return pd.DataFrame(
+        {
+            "Scenario": comparison_df["scenario"],
+            "Metric": comparison_df["metric"].map(lambda key: definitions[key][0]),
+            "Unit": comparison_df["metric"].map(lambda key: definitions[key][2]),
+            "PR": comparison_df["pr"] / scales,
+            "Develop median": comparison_df["baseline_median"] / scales,
+            "Band low": comparison_df["band_low"] / scales,
+            "Band high": comparison_df["band_high"] / scales,
+            "z-score": comparison_df["z_score"],
+            "Percentile": comparison_df["percentile"],
+            "Develop runs": comparison_df["baseline_runs"],
+            "Impact": comparison_df["verdict"],
+        }
+    )
 
 
-def display_load_test_comparison(pr_data: dict[str, Any], develop_data: dict[str, Any]) -> None:
-    """Display a PR load test comparison against latest develop."""
+def display_load_test_comparison(pr_data: dict[str, Any], baseline_data: list[dict[str, Any]]) -> None:
+    """Display a PR load test comparison against the distribution of recent develop runs."""
     st.subheader("PR Load Test Comparison")
 
     pr_run = pr_data["run"]
-    develop_run = develop_data["run"]
-    pr_results = pr_data["results"]
-    develop_results = develop_data["results"]
-    pr_sha = pr_results.get("metadata", {}).get("git_sha", pr_run["head_sha"])
-    develop_sha = develop_results.get("metadata", {}).get("git_sha", develop_run["head_sha"])
+    latest_develop_run = baseline_data[0]["run"]
+    pr_sha = pr_data["results"].get("metadata", {}).get("git_sha", pr_run["head_sha"])
 
     st.markdown(
         f"**PR Commit:** [{pr_sha[:7]}](https://github.com/streamlit/streamlit/commit/{pr_sha}) | "
-        f"**Develop Commit:** [{develop_sha[:7]}](https://github.com/streamlit/streamlit/commit/{develop_sha})  \n"
-        f"**PR Workflow Run:** [View Run]({pr_run['html_url']}) | "
-        f"**Develop Workflow Run:** [View Run]({develop_run['html_url']})"
+        f"**PR Workflow Run:** [View Run]({pr_run['html_url']})  \n"
+        f"**Develop baseline:** {len(baseline_data)} runs, latest "
+        f"[{latest_develop_run['head_sha'][:7]}](https://github.com/streamlit/streamlit/commit/{latest_develop_run['head_sha']})"
     )
 
     pr_summary = summarize_load_test_records(pr_data["records"])
-    develop_summary = summarize_load_test_records(develop_data["records"])
+    baseline_summary = pd.DataFrame([summarize_load_test_records(data["records"]) for data in baseline_data]).median()
     summary_metrics = [
         ("Avg initial load p50", "avg_initial_load_p50_s", "s", 2),
         ("Avg initial load p95", "avg_initial_load_p95_s", "s", 2),
@@ -416,10 +411,11 @@ def display_load_test_comparison(pr_data: dict[str, Any], develop_data: dict[str
         ("Failed sessions", "total_failed_sessions", "", 0),
     ]
 
+    st.caption("Deltas are PR minus the median of the develop baseline runs.")
     cols = st.columns(len(summary_metrics))
     for col, (label, key, unit, precision) in zip(cols, summary_metrics, strict=False):
         pr_value = pr_summary[key]
-        delta = pr_value - develop_summary[key]
+        delta = pr_value - baseline_summary[key]
         separator = "" if not unit else " "
         with col:
             st.metric(
@@ -431,15 +427,31 @@ def display_load_test_comparison(pr_data: dict[str, Any], develop_data: dict[str
             )
 
     st.subheader("Scenario comparison")
-    st.caption("Deltas are PR minus develop. Lower values are better for the metrics shown here.")
+    st.caption(
+        "Every PR metric is placed within the distribution of the develop baseline runs. The z-score uses the "
+        "median and the median absolute deviation, so a single noisy develop run doesn't hide a regression. "
+        f"Metrics outside the band of ±{REGRESSION_Z_THRESHOLD:g} standard deviations are flagged, given at least "
+        f"{MIN_BASELINE_RUNS} develop runs. Lower values are better for the metrics shown here."
+    )
 
-    comparison_df = build_scenario_comparison_df(pr_data["records"], develop_data["records"])
+    baseline_records = [record for data in baseline_data for record in data["records"]]
+    comparison_df = build_scenario_comparison_df(pr_data["records"], baseline_records)
     if comparison_df.empty:
         st.warning("No comparable scenario metrics found.")
         return
 
+    flagged_df = comparison_df[comparison_df["Impact"] == "Regression"]
+    if flagged_df.empty:
+        st.success("No regressions beyond the noise of the develop baseline.")
+    else:
+        st.error(
+            f"{len(flagged_df)} metric(s) regressed beyond the noise of the develop baseline: "
+            + ", ".join(f"{row.Scenario} · {row.Metric}" for row in flagged_df.itertuples())
+        )
+
+    show_all = st.toggle("Show metrics within noise", value=False)
     st.dataframe(
-        comparison_df,
+        comparison_df if show_all else comparison_df[comparison_df["Impact"] != "Within noise"],
         width="stretch",
         hide_index=True,
         column_config={
@@ -447,15 +459,45 @@ def display_load_test_comparison(pr_data: dict[str, Any], develop_data: dict[str
             "Metric": st.column_config.TextColumn("Metric"),
             "Unit": st.column_config.TextColumn("Unit"),
             "PR": st.column_config.NumberColumn("PR", format="%.2f"),
-            "Develop": st.column_config.NumberColumn("Develop", format="%.2f"),
-            "Delta": st.column_config.NumberColumn("Delta", format="%.2f"),
-            "Delta %": st.column_config.NumberColumn("Delta %", format="%.1f%%"),
+            "Develop median": st.column_config.NumberColumn("Develop median", format="%.2f"),
+            "Band low": st.column_config.NumberColumn("Band low", format="%.2f"),
+            "Band high": st.column_config.NumberColumn("Band high", format="%.2f"),
+            "z-score": st.column_config.NumberColumn("z-score", format="%.1f"),
+            "Percentile": st.column_config.NumberColumn("Percentile", format="%.0f"),
+            "Develop runs": st.column_config.NumberColumn("Develop runs"),
             "Impact": st.column_config.TextColumn("Impact"),
         },
     )
 
+    metric_label = st.selectbox("Distribution of", comparison_df["Metric"].unique())
+    metric_df = comparison_df[comparison_df["Metric"] == metric_label]
+    metric_key = next(key for label, key, _, _ in get_comparison_metric_definitions() if label == metric_label)
+    scale = next(scale for label, _, scale, _ in get_comparison_metric_definitions() if label == metric_label)
+    baseline_df = pd.DataFrame(baseline_records)
+    fig = px.box(
+        x=baseline_df["scenario"],
+        y=pd.to_numeric(baseline_df[metric_key], errors="coerce") / scale,
+        points="all",
+        labels={"x": "Scenario", "y": f"{metric_label} ({metric_df['Unit'].iloc[0]})"},
+    )
+    fig.add_scatter(
+        x=metric_df["Scenario"],
+        y=metric_df["PR"],
+        mode="markers",
+        marker={"symbol": "x", "size": 12, "color": "red"},
+        name="PR",
+        error_y={
+            "type": "data",
+            "symmetric": False,
+            "array": metric_df["Band high"] - metric_df["PR"],
+            "arrayminus": metric_df["PR"] - metric_df["Band low"],
+            "color": "rgba(0, 0, 0, 0)",
+        },
+    )
+    st.plotly_chart(fig, width="stretch")
+
 
-def handle_pr_mode(pr_number: str) -> None:
+def handle_pr_mode(pr_number: str, baseline_runs: int) -> None:
     """Fetch and display load test comparison for a PR number."""
     normalized_pr_number = pr_number.strip()
     if not normalized_pr_number.isdigit():
@@ -472,18 +514,164 @@ def handle_pr_mode(pr_number: str) -> None:
     with st.spinner("Fetching PR load test data..."):
         pr_data = get_pr_load_test(pr_info)
 
-    with st.spinner("Fetching latest develop load test data..."):
-        develop_data = get_latest_develop_load_test()
+    with st.spinner(f"Fetching load test data of the last {baseline_runs} develop runs..."):
+        baseline_data = get_develop_baseline_load_tests(baseline_runs)
 
-    if not pr_data or not develop_data:
+    if not pr_data or not baseline_data:
         st.error("Could not fetch load test data for comparison.")
         return
 
-    display_load_test_comparison(pr_data, develop_data)
+    display_load_test_comparison(pr_data, baseline_data)
 
 
+def display_run_details(results: dict[str, Any]) -> None:
+    """Render detailed results for a single load test run."""
+    metadata = results.get("metadata", {})
+    scenario_list = results.get("scenarios", [])
+
+    st.header(f"Details for commit {metadata.get('git_sha', '')[:7]}")
+
+    cols = st.columns(3)
+    cols[0].metric("Git branch", metadata.get("git_branch", "N/A"), border=True)
+    cols[1].metric("Runner", metadata.get("runner", "N/A"), border=True)
+    cols[2].metric("Scenarios", len(scenario_list), border=True)
+
+    for scenario in scenario_list:
+        server = scenario.get("server_metrics", {})
+        session = scenario.get("session_metrics", {})
+        initial_load = session.get("initial_load_time_ms", {})
+        rerun = session.get("rerun_time_ms", {})
+
+        st.subheader(scenario.get("scenario", "unknown"))
+
+        cols = st.columns(4)
+        cols[0].metric(
+            "Concurrent users",
+            scenario.get("concurrent_users", 0),
+            border=True,
+        )
+        cols[1].metric(
+            "Duration",
+            f"{scenario.get('duration_seconds', 0):.1f}s",
+            border=True,
+        )
+        cols[2].metric(
+            "Sessions completed",
+            f"{session.get('sessions_completed', 0)}/{session.get('total_sessions', 0)}",
+            border=True,
+        )
+        cols[3].metric(
+            "Failed",
+            session.get("sessions_failed", 0),
+            border=True,
+        )
+
+        tab_timing, tab_server = st.tabs(["Session timing", "Server metrics"])
+
+        with tab_timing:
+            timing_data = {
+                "Metric": [
+                    "Initial load",
+                    "Rerun",
+                ],
+                "Min (ms)": [
+                    initial_load.get("min", 0),
+                    rerun.get("min", 0),
+                ],
+                "Mean (ms)": [
+                    initial_load.get("mean", 0),
+                    rerun.get("mean", 0),
+                ],
+                "p50 (ms)": [
+                    initial_load.get("p50", 0),
+                    rerun.get("p50", 0),
+                ],
+                "p95 (ms)": [
+                    initial_load.get("p95", 0),
+                    rerun.get("p95", 0),
+                ],
+                "p99 (ms)": [
+                    initial_load.get("p99", 0),
+                    rerun.get("p99", 0),
+                ],
+                "Max (ms)": [
+                    initial_load.get("max", 0),
+                    rerun.get("max", 0),
+                ],
+            }
+            timing_df = pd.DataFrame(timing_data)
+            st.dataframe(
+                timing_df,
+                column_config={
+                    "Metric": st.column_config.TextColumn("Metric", pinned=True),
+                    "Min (ms)": st.column_config.NumberColumn(format="%.1f"),
+                    "Mean (ms)": st.column_config.NumberColumn(format="%.1f"),
+                    "p50 (ms)": st.column_config.NumberColumn(format="%.1f"),
+                    "p95 (ms)": st.column_config.NumberColumn(format="%.1f"),
+                    "p99 (ms)": st.column_config.NumberColumn(format="%.1f"),
+                    "Max (ms)": st.column_config.NumberColumn(format="%.1f"),
+                },
+                hide_index=True,
+                width="stretch",
+            )
+
+        with tab_server:
+            server_cols = st.columns(3)
+            server_cols[0].metric(
+                "Memory peak",
+                f"{server.get('memory_rss_mb_peak', 0):.1f} MB",
+                border=True,
+            )
+            server_cols[1].metric(
+                "Memory growth",
+                f"{server.get('memory_rss_mb_growth', 0):.1f} MB",
+                border=True,
+            )
+            server_cols[2].metric(
+                "Memory avg",
+                f"{server.get('memory_rss_mb_avg', 0):.1f} MB",
+                border=True,
+            )
+
+            server_cols = st.columns(3)
+            server_cols[0].metric(
+                "CPU avg",
+                f"{server.get('cpu_percent_avg', 0):.1f}%",
+                border=True,
+            )
+            server_cols[1].metric(
+                "CPU peak",
+                f"{server.get('cpu_percent_peak', 0):.1f}%",
+                border=True,
+            )
+            server_cols[2].metric(
+                "Max threads",
+                server.get("thread_count_max", 0),
+                border=True,
+            )
+
+        errors = session.get("errors", [])
+        if errors:
+            st.error(f"{len(errors)} error(s) recorded")
+            for err in errors:
+                st.code(str(err))
+
+
+uploaded_results = st.sidebar.file_uploader(
+    "Local results",
+    type=["json"],
+    help="Results JSON of the local load-test harness (`python -m app.utils.load_test_harness <app.py>`).",
+)
+if uploaded_results:
+    local_results = _parse_load_test_payload(uploaded_results.getvalue())
+    if local_results is None:
+        st.error("The uploaded file doesn't contain load test results.")
+    else:
+        display_run_details(local_results)
+    st.stop()
+
 if pr_number:
-    handle_pr_mode(str(pr_number))
+    handle_pr_mode(str(pr_number), workflow_runs_limit)
     st.stop()
 
 
@@ -496,23 +684,37 @@ with st.spinner("Fetching data..."):
         st.warning("No workflow runs found for the specified criteria.")
         st.stop()
 
-    all_records: list[dict[str, Any]] = []
-    raw_results: dict[int, dict[str, Any]] = {}
+    runs_to_load = [run for run in workflow_runs if not is_expired_run(run["id"])]
     progress_bar = st.progress(0)
 
-    for i, run in enumerate(workflow_runs):
-        progress_bar.progress(
-            (i + 1) / len(workflow_runs),
-            text=f"Processing run {i + 1}/{len(workflow_runs)}: {run['head_sha'][:7]}",
-        )
-
-        results = get_load_test_results(run["id"])
-        if results:
-            all_records.extend(flatten_scenario_records(run, results))
-            raw_results[run["id"]] = results
+    def show_progress(finished: int, total: int) -> None:
+        progress_bar.progress(finished / total, text=f"Loaded {finished}/{total} runs")
 
+    loaded_results, failed_runs = load_runs_concurrently(
+        runs_to_load, lambda run: get_load_test_results(run["id"]), on_progress=show_progress
+    )
     progress_bar.empty()
 
+    # Runs finish in any order, keep the order of the workflow runs.
+    raw_results: dict[int, dict[str, Any]] = {
+        run["id"]: loaded_results[run["id"]] for run in runs_to_load if run["id"] in loaded_results
+    }
+    all_records: list[dict[str, Any]] = [
+        record
+        for run in runs_to_load
+        if run["id"] in raw_results
+        for record in flatten_scenario_records(run, raw_results[run["id"]])
+    ]
+
+    expired_run_count = len(workflow_runs) - len(runs_to_load)
+    if expired_run_count:
+        st.caption(f"Skipped {expired_run_count} runs with expired load test artifacts.")
+    if failed_runs:
+        with st.expander(f":material/warning: Failed to load {len(failed_runs)} runs"):
+            st.dataframe(
+                pd.DataFrame({"Run ID": list(failed_runs), "Error": list(failed_runs.values())}), hide_index=True
+            )
+
     if not all_records:
         st.warning("No load test results found in the workflow runs.")
         st.stop()
@@ -595,6 +797,37 @@ selected_scenarios = st.sidebar.multiselect(
 
 filtered_df = df[df["scenario"].isin(selected_scenarios)]
 
+# ── Merged latency percentiles ──────────────────────────────────────────────
+
+histogram_df = filtered_df[filtered_df["initial_load_histogram"].notna() | filtered_df["rerun_histogram"].notna()]
+if not histogram_df.empty:
+    st.subheader("Latency over the selected period")
+    st.caption(
+        "Percentiles computed from the merged latency histograms of all runs in the selected time period, "
+        f"{histogram_df['run_id'].nunique()} of {filtered_df['run_id'].nunique()} runs recorded histograms. "
+        "Unlike averaging the per-run percentiles, this is the true percentile over all sessions."
+    )
+    merged_latency_records = []
+    for scenario_name, scenario_df in [("All scenarios", histogram_df), *histogram_df.groupby("scenario")]:
+        record: dict[str, Any] = {"Scenario": scenario_name, "Runs": scenario_df["run_id"].nunique()}
+        for prefix, column in [("Initial load", "initial_load_histogram"), ("Rerun", "rerun_histogram")]:
+            merged_counts = merge_latency_histograms(scenario_df[column])
+            record[f"{prefix} samples"] = int(merged_counts.sum())
+            for percentile, value in histogram_percentiles(merged_counts, (50, 95, 99)).items():
+                record[f"{prefix} p{percentile} (ms)"] = value
+        merged_latency_records.append(record)
+    st.dataframe(
+        pd.DataFrame(merged_latency_records),
+        hide_index=True,
+        width="stretch",
+        column_config={"Scenario": st.column_config.TextColumn("Scenario", pinned=True)}
+        | {
+            f"{prefix} p{percentile} (ms)": st.column_config.NumberColumn(format="%.1f")
+            for prefix in ("Initial load", "Rerun")
+            for percentile in (50, 95, 99)
+        },
+    )
+
 # ── Initial load time over time ─────────────────────────────────────────────
 
 st.subheader("Initial load time over time")
@@ -733,6 +966,75 @@ for tab, metric_col, label in [
         )
         st.plotly_chart(fig, width="stretch")
 
+# ── Server behaviour during the run ─────────────────────────────────────────
+
+samples_df = filtered_df[filtered_df["server_samples"].notna()]
+if not samples_df.empty:
+    st.subheader("Server behaviour during the run")
+    st.caption(
+        "Based on the per-interval server samples of the runs that recorded them. The leak slope is the "
+        "least-squares RSS growth per completed session, CPU per user is the average CPU after the ramp-up "
+        "divided by the number of concurrent users."
+    )
+
+    tab_leak, tab_cpu_per_user, tab_samples = st.tabs(["Leak slope", "CPU per user", "Samples"])
+
+    for tab, metric_col, label in [
+        (tab_leak, "leak_mb_per_session", "RSS growth per session (MB)"),
+        (tab_cpu_per_user, "cpu_per_user_pct", "Steady-state CPU per user (%)"),
+    ]:
+        with tab:
+            trend_df = samples_df[samples_df[metric_col].notna()]
+            fig = px.line(
+                trend_df,
+                x="created_at",
+                y=metric_col,
+                color="scenario",
+                labels={"created_at": "Date", metric_col: label, "scenario": "Scenario"},
+                markers=True,
+            )
+            fig.update_layout(xaxis_title="Date", yaxis_title=label, hovermode="closest")
+            fig.update_traces(
+                hovertemplate=(
+                    "<b>Date:</b> %{x|%Y-%m-%d}<br><b>Commit:</b> %{customdata[0]}<br><b>Value:</b> %{y:.3f}"
+                ),
+                customdata=trend_df[["commit_sha"]],
+            )
+            st.plotly_chart(fig, width="stretch")
+
+    with tab_samples:
+        sample_cols = st.columns(3)
+        sample_scenario = sample_cols[0].selectbox("Scenario", sorted(samples_df["scenario"].unique()))
+        sample_metric = sample_cols[1].selectbox(
+            "Metric",
+            ["rss_mb", "cpu_percent", "thread_count", "active_sessions"],
+            format_func=lambda metric: {
+                "rss_mb": "RSS (MB)",
+                "cpu_percent": "CPU (%)",
+                "thread_count": "Threads",
+                "active_sessions": "Active sessions",
+            }[metric],
+        )
+        sample_runs = sample_cols[2].slider("Latest runs", min_value=1, max_value=20, value=5)
+
+        scenario_samples = samples_df[samples_df["scenario"] == sample_scenario].tail(sample_runs)
+        aligned_df = server_samples_frame(
+            (f"{row.created_at:%Y-%m-%d} · {row.commit_sha}", row.server_samples)
+            for row in scenario_samples.itertuples()
+        )
+        aligned_df = aligned_df[aligned_df["metric"] == sample_metric]
+        if aligned_df.empty:
+            st.info("The selected runs didn't record this metric.")
+        else:
+            fig = px.line(
+                aligned_df,
+                x="elapsed_seconds",
+                y="value",
+                color="run",
+                labels={"elapsed_seconds": "Time since scenario start (s)", "value": sample_metric, "run": "Run"},
+            )
+            st.plotly_chart(fig, width="stretch")
+
 # ── Test duration over time ─────────────────────────────────────────────────
 
 st.subheader("Scenario duration over time")
@@ -840,140 +1142,6 @@ if run_summary_records:
         key="run_history_df",
     )
 
-    # ── Detail view for a selected run ──────────────────────────────────────
-
-    def display_run_details(results: dict[str, Any]) -> None:
-        """Render detailed results for a single load test run."""
-        metadata = results.get("metadata", {})
-        scenario_list = results.get("scenarios", [])
-
-        st.header(f"Details for commit {metadata.get('git_sha', '')[:7]}")
-
-        cols = st.columns(3)
-        cols[0].metric("Git branch", metadata.get("git_branch", "N/A"), border=True)
-        cols[1].metric("Runner", metadata.get("runner", "N/A"), border=True)
-        cols[2].metric("Scenarios", len(scenario_list), border=True)
-
-        for scenario in scenario_list:
-            server = scenario.get("server_metrics", {})
-            session = scenario.get("session_metrics", {})
-            initial_load = session.get("initial_load_time_ms", {})
-            rerun = session.get("rerun_time_ms", {})
-
-            st.subheader(scenario.get("scenario", "unknown"))
-
-            cols = st.columns(4)
-            cols[0].metric(
-                "Concurrent users",
-                scenario.get("concurrent_users", 0),
-                border=True,
-            )
-            cols[1].metric(
-                "Duration",
-                f"{scenario.get('duration_seconds', 0):.1f}s",
-                border=True,
-            )
-            cols[2].metric(
-                "Sessions completed",
-                f"{session.get('sessions_completed', 0)}/{session.get('total_sessions', 0)}",
-                border=True,
-            )
-            cols[3].metric(
-                "Failed",
-                session.get("sessions_failed", 0),
-                border=True,
-            )
-
-            tab_timing, tab_server = st.tabs(["Session timing", "Server metrics"])
-
-            with tab_timing:
-                timing_data = {
-                    "Metric": [
-                        "Initial load",
-                        "Rerun",
-                    ],
-                    "Min (ms)": [
-                        initial_load.get("min", 0),
-                        rerun.get("min", 0),
-                    ],
-                    "Mean (ms)": [
-                        initial_load.get("mean", 0),
-                        rerun.get("mean", 0),
-                    ],
-                    "p50 (ms)": [
-                        initial_load.get("p50", 0),
-                        rerun.get("p50", 0),
-                    ],
-                    "p95 (ms)": [
-                        initial_load.get("p95", 0),
-                        rerun.get("p95", 0),
-                    ],
-                    "p99 (ms)": [
-                        initial_load.get("p99", 0),
-                        rerun.get("p99", 0),
-                    ],
-                    "Max (ms)": [
-                        initial_load.get("max", 0),
-                        rerun.get("max", 0),
-                    ],
-                }
-                timing_df = pd.DataFrame(timing_data)
-                st.dataframe(
-                    timing_df,
-                    column_config={
-                        "Metric": st.column_config.TextColumn("Metric", pinned=True),
-                        "Min (ms)": st.column_config.NumberColumn(format="%.1f"),
-                        "Mean (ms)": st.column_config.NumberColumn(format="%.1f"),
-                        "p50 (ms)": st.column_config.NumberColumn(format="%.1f"),
-                        "p95 (ms)": st.column_config.NumberColumn(format="%.1f"),
-                        "p99 (ms)": st.column_config.NumberColumn(format="%.1f"),
-                        "Max (ms)": st.column_config.NumberColumn(format="%.1f"),
-                    },
-                    hide_index=True,
-                    width="stretch",
-                )
-
-            with tab_server:
-                server_cols = st.columns(3)
-                server_cols[0].metric(
-                    "Memory peak",
-                    f"{server.get('memory_rss_mb_peak', 0):.1f} MB",
-                    border=True,
-                )
-                server_cols[1].metric(
-                    "Memory growth",
-                    f"{server.get('memory_rss_mb_growth', 0):.1f} MB",
-                    border=True,
-                )
-                server_cols[2].metric(
-                    "Memory avg",
-                    f"{server.get('memory_rss_mb_avg', 0):.1f} MB",
-                    border=True,
-                )
-
-                server_cols = st.columns(3)
-                server_cols[0].metric(
-                    "CPU avg",
-                    f"{server.get('cpu_percent_avg', 0):.1f}%",
-                    border=True,
-                )
-                server_cols[1].metric(
-                    "CPU peak",
-                    f"{server.get('cpu_percent_peak', 0):.1f}%",
-                    border=True,
-                )
-                server_cols[2].metric(
-                    "Max threads",
-                    server.get("thread_count_max", 0),
-                    border=True,
-                )
-
-            errors = session.get("errors", [])
-            if errors:
-                st.error(f"{len(errors)} error(s) recorded")
-                for err in errors:
-                    st.code(str(err))
-
     if df_selection["selection"]["rows"]:
         selected_idx = df_selection["selection"]["rows"][0]
         selected_row = history_df.iloc[selected_idx]
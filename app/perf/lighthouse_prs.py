@@ -1,41 +1,113 @@
+import concurrent.futures
+from typing import Any
+
 import streamlit as st
 
-from app.perf.utils.perf_github_artifacts import get_workflow_run_id
+from app.perf.utils.artifacts import get_artifact_results, get_lighthouse_scores_for_run
+from app.perf.utils.perf_comparison import compare_lighthouse_scores
+from app.perf.utils.perf_github_artifacts import get_commit_hashes_for_branch_name, get_workflow_run_id
 from app.utils.github_utils import get_all_github_prs
 
 TITLE = "Lighthouse open PRs"
 
-st.set_page_config(page_title=TITLE)
-
-st.header(TITLE)
-
-token = st.secrets["github"]["token"]
-
-if token is None:
-    st.error("No GitHub token provided")
-    st.stop()
+LIGHTHOUSE_LABEL = "perf:lighthouse"
+LIGHTHOUSE_WORKFLOW_NAME = "Performance - Lighthouse"
 
 
 @st.cache_data(ttl=60 * 60 * 12)
 def get_all_prs() -> list:
     prs = get_all_github_prs(state="open")
-    return [pr for pr in prs if any(lbl.get("name") == "perf:lighthouse" for lbl in pr.get("labels", []))]
+    return [pr for pr in prs if any(lbl.get("name") == LIGHTHOUSE_LABEL for lbl in pr.get("labels", []))]
 
 
-all_prs = get_all_prs()
+@st.cache_data(ttl=60 * 60 * 12)
+def cached_get_workflow_run_id(pr_ref: str) -> int | None:
+    return get_workflow_run_id(pr_ref, LIGHTHOUSE_WORKFLOW_NAME)
 
 
 @st.cache_data(ttl=60 * 60 * 12)
-def cached_get_workflow_run_id(pr_ref: str) -> int | None:
-    return get_workflow_run_id(pr_ref, "Performance - Lighthouse")
+def get_run_scores(run_id: int) -> dict[str, float] | None:
+    return get_lighthouse_scores_for_run(run_id)
+
+
+@st.cache_data(ttl=60 * 60 * 12)
+def get_latest_develop_scores(limit: int = 10) -> tuple[str, dict[str, float]] | None:
+    for commit_hash in get_commit_hashes_for_branch_name("develop", limit=limit):
+        scores, timestamp = get_artifact_results(commit_hash, "lighthouse")
+        if scores and timestamp:
+            return commit_hash, scores
+    return None
+
+
+def _get_pr_scores(pr: dict[str, Any]) -> tuple[int | None, dict[str, float] | None]:
+    run_id = cached_get_workflow_run_id(pr["head"]["ref"])
+    if run_id is None:
+        return None, None
+    return run_id, get_run_scores(run_id)
+
+
+def render_lighthouse_prs() -> None:
+    all_prs = get_all_prs()
+    if not all_prs:
+        st.info(f"No open PRs with the `{LIGHTHOUSE_LABEL}` label.")
+        return
+
+    pr_scores: dict[int, dict[str, float]] = {}
+    run_ids: dict[int, int | None] = {}
+
+    with st.spinner(f"Fetching Lighthouse results for {len(all_prs)} PRs..."):
+        # Resolve the runs and download the artifacts of all PRs in parallel
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            future_mapping = {executor.submit(_get_pr_scores, pr): pr["number"] for pr in all_prs}
+            develop_future = executor.submit(get_latest_develop_scores)
+            for future in concurrent.futures.as_completed(future_mapping):
+                pr_number = future_mapping[future]
+                run_id, scores = future.result()
+                run_ids[pr_number] = run_id
+                if scores:
+                    pr_scores[pr_number] = scores
+            develop = develop_future.result()
+
+    develop_scores: dict[str, float] = {}
+    if develop is None:
+        st.warning("No Lighthouse results found for the latest develop commits, showing PR scores only.")
+    else:
+        develop_sha, develop_scores = develop
+        st.caption(
+            f"Deltas are relative to develop at [`{develop_sha[:7]}`](https://github.com/streamlit/streamlit/commit/{develop_sha})."
+        )
+
+    comparison = compare_lighthouse_scores(pr_scores, develop_scores)
+    prs_by_number = {pr["number"]: pr for pr in all_prs}
+    comparison.insert(1, "title", comparison["pr"].map(lambda number: prs_by_number[number]["title"]))
+    comparison["pr"] = comparison["pr"].map(lambda number: prs_by_number[number]["html_url"])
+
+    st.dataframe(
+        comparison,
+        hide_index=True,
+        column_config={
+            "pr": st.column_config.LinkColumn("PR", display_text=r"https://github.com/streamlit/streamlit/pull/(\d+)"),
+            "title": "Title",
+            "app_name": "App",
+            "pr_score": st.column_config.NumberColumn("PR score", format="%.0f"),
+            "baseline_score": st.column_config.NumberColumn("Develop score", format="%.0f"),
+            "delta": st.column_config.NumberColumn("Delta", format="%+.0f"),
+        },
+    )
+
+    missing = [prs_by_number[number] for number in sorted(prs_by_number) if number not in pr_scores]
+    if missing:
+        with st.expander(f"PRs without Lighthouse results ({len(missing)})"):
+            for pr in missing:
+                reason = "no workflow run" if run_ids.get(pr["number"]) is None else "no Lighthouse artifact"
+                st.markdown(f"- [#{pr['number']}]({pr['html_url']}) {pr['title']} ({reason})")
+
 
+def _standalone() -> None:
+    st.set_page_config(page_title=TITLE, layout="wide")
+    st.header(TITLE)
+    render_lighthouse_prs()
 
-for pr in all_prs:
-    pr_title = pr["title"]
-    pr_url = pr["html_url"]
-    pr_ref = pr["head"]["ref"]
-    st.write(f"PR: {pr_title} ({pr_url})")
 
-    run_id = cached_get_workflow_run_id(pr_ref)
-    st.write(f"Run ID: {run_id}")
-    st.write("---")
+if __name__ == "__main__":
+    _standalone()
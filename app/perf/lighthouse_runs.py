@@ -8,6 +8,7 @@ import streamlit as st
 
 from app.perf import (
     lighthouse_interpreting_results,
+    lighthouse_prs,
     lighthouse_writing_a_test,
 )
 from app.perf.utils.artifacts import get_artifact_results
@@ -16,6 +17,7 @@ from app.perf.utils.commit_details import (
     reset_selection_on_page_change,
     update_selected_commit_from_selection,
 )
+from app.perf.utils.lighthouse_metrics import metric_label
 from app.perf.utils.perf_github_artifacts import (
     append_to_performance_scores,
     get_commit_hashes_for_branch_name,
@@ -31,14 +33,16 @@ with title_row:
     st.title("💡 Lighthouse performance")
 
 tab = segmented_tabs(
-    options=["Runs", "Interpret metrics", "Write a test"],
+    options=["Runs", "Pull requests", "Interpret metrics", "Write a test"],
     key="lighthouse_tab",
     query_param="tab",
     default="Runs",
 )
 
 if tab != "Runs":
-    if tab == "Interpret metrics":
+    if tab == "Pull requests":
+        lighthouse_prs.render_lighthouse_prs()
+    elif tab == "Interpret metrics":
         lighthouse_interpreting_results.render_interpreting_results()
     elif tab == "Write a test":
         lighthouse_writing_a_test.render_writing_a_test()
@@ -61,13 +65,13 @@ def get_commits(branch_name: str, limit: int = 20) -> list[str]:
 
 @st.cache_data(ttl=60 * 60 * 12)
 def get_lighthouse_results(commit_hash: str) -> tuple:
-    return get_artifact_results(commit_hash, "lighthouse")
+    return get_artifact_results(commit_hash, "lighthouse_metrics")
 
 
 commit_hashes = get_commits("develop")
 
 directories: list[str] = []
-run_results: list[tuple[str, str, dict[str, float]]] = []
+run_results: list[tuple[str, str, pd.DataFrame]] = []
 
 # Download all the artifacts for the performance runs in parallel
 with concurrent.futures.ThreadPoolExecutor() as executor:
@@ -76,12 +80,12 @@ with concurrent.futures.ThreadPoolExecutor() as executor:
     }
     for future in concurrent.futures.as_completed(future_mapping):
         commit_hash = future_mapping[future]
-        scores, timestamp = future.result()
+        metrics, timestamp = future.result()
 
-        if not scores or not timestamp:
+        if not isinstance(metrics, pd.DataFrame) or metrics.empty or not timestamp:
             continue
 
-        run_results.append((timestamp, commit_hash, scores))
+        run_results.append((timestamp, commit_hash, metrics))
 
 # Guard: no data found
 if not run_results:
@@ -90,14 +94,27 @@ if not run_results:
 
 # Sort scores and timestamps based on timestamps
 sorted_runs = sorted(run_results, key=operator.itemgetter(0))
-timestamps_sorted, commit_hashes_sorted, scores_by_run_sorted = zip(*sorted_runs, strict=False)
-commit_hash_by_timestamp = {timestamp: commit_hash for timestamp, commit_hash, _scores in sorted_runs}
+commit_hash_by_timestamp = {timestamp: commit_hash for timestamp, commit_hash, _metrics in sorted_runs}
+
+metrics_df = pd.concat(
+    [
+        metrics.assign(
+            run_index=run_index,
+            datetime=datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%SZ"),
+            commit_hash=commit_hash[:7],
+            commit_sha_full=commit_hash,
+        )
+        for run_index, (timestamp, commit_hash, metrics) in enumerate(sorted_runs)
+    ],
+    ignore_index=True,
+)
 
 performance_scores: dict[str, dict] = {}
 
-for idx, scores in enumerate(scores_by_run_sorted):
-    for app_name, score in scores.items():
-        append_to_performance_scores(performance_scores, timestamps_sorted[idx], app_name, score)
+for timestamp, _commit_hash, metrics in sorted_runs:
+    scores = metrics[metrics["metric"] == "score"]
+    for app_name, score in zip(scores["app_name"], scores["value"], strict=True):
+        append_to_performance_scores(performance_scores, timestamp, str(app_name), float(score))
 
 
 # Convert performance_scores to a DataFrame
@@ -182,5 +199,42 @@ selection = st.altair_chart(
 )
 update_selected_commit_from_selection(selection, selection_key="lighthouse-runs")
 
+st.subheader("Metrics")
+
+metric_names = sorted({str(metric) for metric in metrics_df["metric"].unique()} - {"score"})
+if not metric_names:
+    st.info("The Lighthouse reports of these runs don't contain any audit metrics.")
+else:
+    with st.container(width="content"):
+        selected_metric = st.selectbox(
+            "Metric",
+            metric_names,
+            index=metric_names.index("lcp_ms") if "lcp_ms" in metric_names else 0,
+            format_func=metric_label,
+        )
+    metric_df = metrics_df[metrics_df["metric"] == selected_metric].astype({"app_name": str, "value": float})
+
+    metric_points_selection = alt.selection_point(
+        name="points",
+        fields=["commit_sha_full"],
+        on="click",
+        clear="dblclick",
+        toggle=False,
+    )
+    metric_chart = (
+        alt.Chart(metric_df)
+        .mark_line(point=True)
+        .encode(
+            x=alt.X("run_index:Q", title="Run index", axis=alt.Axis(format="d")),
+            y=alt.Y("value:Q", title=metric_label(selected_metric)),
+            color="app_name:N",
+            tooltip=["datetime:T", "value:Q", "app_name:N", "commit_hash:N"],
+        )
+        .properties(title=f"{metric_label(selected_metric)} over time")
+        .add_params(metric_points_selection)
+    )
+    metric_selection = st.altair_chart(metric_chart, width="stretch", on_select="rerun", selection_mode="points")
+    update_selected_commit_from_selection(metric_selection, selection_key="lighthouse-metrics")
+
 with st.expander("Raw Data"):
     st.dataframe(df)
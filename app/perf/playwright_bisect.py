@@ -0,0 +1,116 @@
+import pandas as pd
+import streamlit as st
+
+from app.perf.utils.artifacts import get_cached_playwright_results
+from app.perf.utils.perf_bisect import bisect_commits, get_metric_value
+from app.perf.utils.perf_github_artifacts import get_commit_hashes_between
+from app.perf.utils.test_diff_analyzer import ProcessTestDirectoryOutput, find_and_remove_outliers
+
+TITLE = "Playwright performance bisect"
+
+DOCS = """
+Localise a Playwright performance regression between a known good and a known
+bad `develop` commit. Instead of downloading the performance artifacts for every
+commit in the range, only the midpoint commits are fetched until the change is
+pinned down to a single commit. A commit counts as "bad" if its mean metric
+value is closer to the bad endpoint than to the good endpoint. Commits without a
+performance artifact are skipped.
+"""
+
+
+@st.cache_data(ttl=60 * 60 * 12)
+def get_commits_between(good_commit: str, bad_commit: str) -> list[str]:
+    return get_commit_hashes_between(good_commit, bad_commit)
+
+
+@st.cache_data(ttl=60 * 60 * 12)
+def get_processed_results(commit_hash: str, load_all_metrics: bool) -> ProcessTestDirectoryOutput | None:
+    results, timestamp = get_cached_playwright_results(commit_hash, load_all_metrics)
+    if not isinstance(results, dict) or not timestamp:
+        return None
+    return find_and_remove_outliers(results)
+
+
+def render_bisect() -> None:
+    with st.container(width="content"):
+        st.markdown(DOCS)
+
+    with st.form("playwright_bisect_form"), st.container(width="content"):
+        good_commit = st.text_input("Good commit SHA", help="Last commit known to have good performance.")
+        bad_commit = st.text_input("Bad commit SHA", help="First commit known to show the regression.")
+        test_name = st.text_input("Test name", help="Stable test name as shown on the Runs tab, e.g. `st_dataframe`.")
+        metric_name = st.text_input(
+            "Metric",
+            value="long_animation_frames_duration_ms",
+            help="Metric name without the test prefix, e.g. `stApp__update__duration_ms`.",
+        )
+        load_all_metrics = st.checkbox("Include all metrics", help="Needed to bisect on tracked (non-React) metrics.")
+        submitted = st.form_submit_button("Bisect")
+
+    if not submitted:
+        st.stop()
+
+    if not (good_commit.strip() and bad_commit.strip() and test_name.strip() and metric_name.strip()):
+        st.error("Please provide both commits, a test name and a metric.")
+        st.stop()
+
+    try:
+        commit_hashes = get_commits_between(good_commit.strip(), bad_commit.strip())
+    except Exception as ex:
+        st.error(f"Failed to fetch commits between `{good_commit}` and `{bad_commit}`: {ex}")
+        st.stop()
+
+    if len(commit_hashes) < 2:
+        st.warning("The bad commit needs to come after the good commit.")
+        st.stop()
+
+    def get_value(commit_hash: str) -> float | None:
+        results = get_processed_results(commit_hash, load_all_metrics)
+        return get_metric_value(results, test_name.strip(), metric_name.strip())
+
+    with st.spinner(f"Bisecting {len(commit_hashes)} commits..."):
+        result = bisect_commits(commit_hashes, get_value)
+
+    if result["good_value"] is None or result["bad_value"] is None:
+        st.error(
+            "No value found for this test and metric on one of the endpoints. "
+            "Check the names or choose endpoints with performance artifacts."
+        )
+        st.stop()
+
+    candidates = result["culprit_candidates"]
+    if len(candidates) == 1:
+        st.success(
+            f"The change was introduced in [`{candidates[0][:7]}`](https://github.com/streamlit/streamlit/commit/{candidates[0]})."
+        )
+    else:
+        st.warning(
+            f"Narrowed the change down to {len(candidates)} commits. "
+            "The remaining commits don't have usable performance artifacts."
+        )
+
+    st.caption(
+        f"Downloaded artifacts for {len(result['steps'])} of {len(commit_hashes)} commits in the range. "
+        f"Good value: `{round(result['good_value'], 2)}`, bad value: `{round(result['bad_value'], 2)}`."
+    )
+
+    st.subheader("Candidate commits")
+    st.dataframe(
+        {"Commit": [f"https://github.com/streamlit/streamlit/commit/{h}" for h in candidates]},
+        column_config={
+            "Commit": st.column_config.LinkColumn(display_text="https://github.com/streamlit/streamlit/commit/(.*)")
+        },
+    )
+
+    st.subheader("Bisect steps")
+    st.dataframe(pd.DataFrame(result["steps"]), hide_index=True)
+
+
+def _standalone() -> None:
+    st.set_page_config(page_title=TITLE, layout="wide")
+    st.header(TITLE)
+    render_bisect()
+
+
+if __name__ == "__main__":
+    _standalone()
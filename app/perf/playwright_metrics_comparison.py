@@ -1,13 +1,14 @@
 import json
-from typing import Any
 
 import pandas as pd
 import streamlit as st
 
-from app.perf.utils.perf_traces import (
-    get_phases_for_all_profiles,
-    sum_long_animation_frames,
-)
+from app.perf.utils.artifacts import get_cached_playwright_results
+from app.perf.utils.perf_comparison import compare_long_frames, phases_to_long_frame, results_to_long_frame
+from app.perf.utils.perf_github_artifacts import get_commit_hashes_for_branch_name
+from app.perf.utils.perf_traces import get_phases_for_all_profiles
+from app.perf.utils.test_diff_analyzer import ProcessTestDirectoryOutput
+from app.utils.github_utils import fetch_pr_info
 
 TITLE = "Playwright metrics comparison"
 
@@ -17,123 +18,166 @@ st.header(TITLE)
 
 
 @st.cache_data(ttl=60 * 60 * 12)
-def get_metrics_data(all_phases: list, file_1_calculations: dict, file_2_calculations: dict) -> pd.DataFrame:
-    # Create a DataFrame for the metrics
-    metrics_data: dict[str, list] = {
-        "Profile": [],
-        "Metric": [],
-        "Run 1": [],
-        "Run 2": [],
-        "Difference": [],
-    }
-
-    for profile in all_profiles:
-        for phase in all_phases:
-            metrics_data["Profile"].extend([profile] * 2)
-            metrics_data["Metric"].extend(
-                [
-                    f"{phase} - Duration (ms)",
-                    f"{phase} - Count",
-                ]
-            )
-            metrics_data["Run 1"].extend(
-                [
-                    file_1_calculations["phases"].get(profile, {}).get(phase, {}).get("actualDuration", 0),
-                    file_1_calculations["phases"].get(profile, {}).get(phase, {}).get("count", 0),
-                ]
-            )
-            metrics_data["Run 2"].extend(
-                [
-                    file_2_calculations["phases"].get(profile, {}).get(phase, {}).get("actualDuration", 0),
-                    file_2_calculations["phases"].get(profile, {}).get(phase, {}).get("count", 0),
-                ]
-            )
-            metrics_data["Difference"].extend(
-                [
-                    file_2_calculations["phases"].get(profile, {}).get(phase, {}).get("actualDuration", 0)
-                    - file_1_calculations["phases"].get(profile, {}).get(phase, {}).get("actualDuration", 0),
-                    file_2_calculations["phases"].get(profile, {}).get(phase, {}).get("count", 0)
-                    - file_1_calculations["phases"].get(profile, {}).get(phase, {}).get("count", 0),
-                ]
-            )
-
-    return pd.DataFrame(metrics_data)
-
-
-upload_row = st.container(horizontal=True, gap="medium")
-run1 = upload_row.container(width=500)
-run2 = upload_row.container(width=500)
-
-with run1:
-    file_1 = st.file_uploader("Run 1 (Baseline)", type=["json"])
-
-with run2:
-    file_2 = st.file_uploader("Run 2 (Treatment)", type=["json"])
-
-if not file_1 or not file_2:
-    st.stop()
+def get_latest_develop_commits(limit: int = 10) -> list[str]:
+    return get_commit_hashes_for_branch_name("develop", limit=limit)
 
-file_1_as_dict = json.loads(file_1.getvalue().decode("utf-8"))
-file_2_as_dict = json.loads(file_2.getvalue().decode("utf-8"))
 
-file_1_calculations: dict[str, Any] = {
-    "long_animation_frames": sum_long_animation_frames(file_1_as_dict),
-    "phases": get_phases_for_all_profiles(file_1_as_dict),
-}
+def get_commit_results(commit_hash: str) -> ProcessTestDirectoryOutput | None:
+    results, timestamp = get_cached_playwright_results(commit_hash)
+    if not isinstance(results, dict) or not timestamp:
+        return None
+    return results
 
-file_2_calculations: dict[str, Any] = {
-    "long_animation_frames": sum_long_animation_frames(file_2_as_dict),
-    "phases": get_phases_for_all_profiles(file_2_as_dict),
-}
 
-all_phases = set()
-all_profiles = set(file_1_calculations["phases"].keys()).union(file_2_calculations["phases"].keys())
+def get_latest_develop_results() -> tuple[str, ProcessTestDirectoryOutput] | None:
+    for commit_hash in get_latest_develop_commits():
+        results = get_commit_results(commit_hash)
+        if results:
+            return commit_hash, results
+    return None
 
-for profile in all_profiles:
-    all_phases.update(file_1_calculations["phases"].get(profile, {}).keys())
-    all_phases.update(file_2_calculations["phases"].get(profile, {}).keys())
 
+def compare_uploaded_files() -> pd.DataFrame:
+    upload_row = st.container(horizontal=True, gap="medium")
+    run1 = upload_row.container(width=500)
+    run2 = upload_row.container(width=500)
 
-metrics_data = get_metrics_data(list(all_phases), file_1_calculations, file_2_calculations)
+    with run1:
+        file_1 = st.file_uploader("Run 1 (Baseline)", type=["json"])
 
-data_view = st.segmented_control("Comparison View", ["Breakdown", "Table"], default="Breakdown")
+    with run2:
+        file_2 = st.file_uploader("Run 2 (Treatment)", type=["json"])
 
-if data_view == "Table":
-    st.dataframe(pd.DataFrame(metrics_data))
+    if not file_1 or not file_2:
+        st.stop()
 
-if data_view == "Breakdown":
-    total_duration_run1 = round(
-        sum(
-            file_1_calculations["phases"].get(profile, {}).get(phase, {}).get("actualDuration", 0)
-            for profile in all_profiles
-            for phase in all_phases
-        ),
-        2,
-    )
-    total_duration_run2 = round(
-        sum(
-            file_2_calculations["phases"].get(profile, {}).get(phase, {}).get("actualDuration", 0)
-            for profile in all_profiles
-            for phase in all_phases
-        ),
-        2,
+    file_1_as_dict = json.loads(file_1.getvalue().decode("utf-8"))
+    file_2_as_dict = json.loads(file_2.getvalue().decode("utf-8"))
+
+    return compare_long_frames(
+        phases_to_long_frame(get_phases_for_all_profiles(file_1_as_dict)),
+        phases_to_long_frame(get_phases_for_all_profiles(file_2_as_dict)),
     )
-    total_count_run1 = round(
-        sum(
-            file_1_calculations["phases"].get(profile, {}).get(phase, {}).get("count", 0)
-            for profile in all_profiles
-            for phase in all_phases
+
+
+def compare_commits() -> pd.DataFrame:
+    with st.form("compare_commits_form"), st.container(width="content"):
+        baseline_sha = st.text_input("Run 1 (Baseline) commit SHA")
+        treatment_sha = st.text_input("Run 2 (Treatment) commit SHA")
+        submitted = st.form_submit_button("Compare")
+
+    if not submitted and "compare_commit_shas" not in st.session_state:
+        st.stop()
+    if submitted:
+        st.session_state.compare_commit_shas = (baseline_sha.strip(), treatment_sha.strip())
+
+    baseline_sha, treatment_sha = st.session_state.compare_commit_shas
+    if not baseline_sha or not treatment_sha:
+        st.error("Please provide both commit SHAs.")
+        st.stop()
+
+    with st.spinner("Fetching performance results..."):
+        baseline_results = get_commit_results(baseline_sha)
+        treatment_results = get_commit_results(treatment_sha)
+
+    if not baseline_results or not treatment_results:
+        missing_sha = treatment_sha if baseline_results else baseline_sha
+        st.error(f"No Playwright performance results found for commit `{missing_sha[:7]}`.")
+        st.stop()
+
+    return compare_long_frames(results_to_long_frame(baseline_results), results_to_long_frame(treatment_results))
+
+
+def compare_pull_request() -> pd.DataFrame:
+    with st.container(width="content"):
+        pr_number = st.text_input("Pull request number", value=st.query_params.get("pr", ""))
+
+    pr_number = pr_number.strip().lstrip("#")
+    if not pr_number:
+        st.stop()
+    if not pr_number.isdigit():
+        st.error("Please enter a valid PR number.")
+        st.stop()
+    st.query_params.pr = pr_number
+
+    with st.spinner(f"Fetching data for PR #{pr_number}..."):
+        pr_info = fetch_pr_info(pr_number)
+    if not pr_info:
+        st.error(f"Could not fetch information for PR #{pr_number}.")
+        st.stop()
+
+    head_sha = pr_info["head"]["sha"]
+    with st.spinner("Fetching performance results..."):
+        pr_results = get_commit_results(head_sha)
+        develop = get_latest_develop_results()
+
+    if not pr_results:
+        st.error(f"No Playwright performance results found for the PR head commit `{head_sha[:7]}`.")
+        st.stop()
+    if develop is None:
+        st.error("No Playwright performance results found for the latest develop commits.")
+        st.stop()
+
+    develop_sha, develop_results = develop
+    st.caption(f"Comparing PR #{pr_number} (`{head_sha[:7]}`) against develop (`{develop_sha[:7]}`).")
+    return compare_long_frames(results_to_long_frame(develop_results), results_to_long_frame(pr_results))
+
+
+def describe_change(diff: float, pct: float, more: str, less: str) -> str:
+    direction = more if diff > 0 else less if diff < 0 else "⏸️ unchanged"
+    pct_text = "n/a" if pd.isna(pct) else f"{abs(round(pct, 2))}%"
+    return f"{direction} by `{pct_text}`"
+
+
+source = st.segmented_control(
+    "Compare", ["Uploaded files", "Commits", "Pull request"], default="Uploaded files", key="comparison_source"
+)
+
+if source == "Commits":
+    comparison = compare_commits()
+elif source == "Pull request":
+    comparison = compare_pull_request()
+else:
+    comparison = compare_uploaded_files()
+
+if comparison.empty:
+    st.info("No comparable metrics found.")
+    st.stop()
+
+test_names = sorted(comparison["test"].unique())
+if len(test_names) > 1:
+    with st.container(width="content"):
+        selected_test = st.selectbox("Test", test_names)
+    comparison = comparison[comparison["test"] == selected_test]
+
+react_metrics = comparison[comparison["profile"] != ""]
+
+data_view = st.segmented_control("Comparison View", ["Breakdown", "Table"], default="Breakdown")
+
+if data_view == "Table":
+    st.dataframe(
+        comparison.drop(columns="test").rename(
+            columns={
+                "profile": "Profile",
+                "phase": "Phase",
+                "metric": "Metric",
+                "baseline": "Run 1",
+                "treatment": "Run 2",
+                "difference": "Difference",
+                "difference_pct": "Difference (%)",
+            }
         ),
-        2,
+        hide_index=True,
     )
-    total_count_run2 = round(
-        sum(
-            file_2_calculations["phases"].get(profile, {}).get(phase, {}).get("count", 0)
-            for profile in all_profiles
-            for phase in all_phases
-        ),
-        2,
+
+if data_view == "Breakdown":
+    totals = (
+        react_metrics.groupby("metric")[["baseline", "treatment"]]
+        .sum()
+        .reindex(["duration_ms", "count"], fill_value=0.0)
+        .round(2)
     )
+    (total_duration_run1, total_duration_run2), (total_count_run1, total_count_run2) = totals.to_numpy().tolist()
 
     duration_diff = total_duration_run2 - total_duration_run1
     duration_percentage = (duration_diff / total_duration_run1) * 100 if total_duration_run1 != 0 else 0
@@ -147,36 +191,34 @@ if data_view == "Breakdown":
 **Total Duration:**
 - Run 1: `{total_duration_run1}ms`
 - Run 2: `{total_duration_run2}ms`
-- Difference: `{round(duration_diff, 2)}ms` ({"🐢 slower" if duration_diff > 0 else "🚀 faster" if duration_diff < 0 else "⏸️ unchanged"} by `{abs(round(duration_percentage, 2))}%`)
+- Difference: `{round(duration_diff, 2)}ms` ({describe_change(duration_diff, duration_percentage, "🐢 slower", "🚀 faster")})
 
 **Total Count:**
 - Run 1: `{total_count_run1}`
 - Run 2: `{total_count_run2}`
-- Difference: `{round(count_diff, 2)}` ({"🔺 more" if count_diff > 0 else "🔻 fewer" if count_diff < 0 else "⏸️ unchanged"} by `{abs(round(count_percentage, 2))}%`)
+- Difference: `{round(count_diff, 2)}` ({describe_change(count_diff, count_percentage, "🔺 more", "🔻 fewer")})
 
 #### Phase-wise Comparison:
         """
     )
 
-    for i, profile in enumerate(all_profiles):
-        for j, phase in enumerate(all_phases):
-            index = 2 * (i * len(all_phases) + j)
-            if index + 1 < len(metrics_data["Difference"]):
-                duration_diff = round(metrics_data["Difference"][index], 2)
-                count_diff = round(metrics_data["Difference"][index + 1], 2)
-                duration_percentage = (
-                    duration_diff
-                    / file_1_calculations["phases"].get(profile, {}).get(phase, {}).get("actualDuration", 1)
-                ) * 100
-                count_percentage = (
-                    count_diff / file_1_calculations["phases"].get(profile, {}).get(phase, {}).get("count", 1)
-                ) * 100
-                st.write(
-                    f"""
-    **Profile: {profile}, Phase: {phase}**
-    - Duration Difference: `{duration_diff}ms` ({"🐢 slower" if duration_diff > 0 else "🚀 faster" if duration_diff < 0 else "⏸️ unchanged"} by `{abs(round(duration_percentage, 2))}%`)
-    - Count Difference: `{count_diff}` ({"🔺 more" if count_diff > 0 else "🔻 fewer" if count_diff < 0 else "⏸️ unchanged"} by `{abs(round(count_percentage, 2))}%`)
-                    """
-                )
-            else:
-                st.write(f"**Profile: {profile}, Phase: {phase}** - Data not available")
+    # One row per profile and phase with the duration and count deltas side by side.
+    phase_wise = react_metrics.pivot_table(
+        index=["profile", "phase"],
+        columns="metric",
+        values=["difference", "difference_pct"],
+        aggfunc="first",
+    ).reindex(columns=pd.MultiIndex.from_product([["difference", "difference_pct"], ["duration_ms", "count"]]))
+    phase_wise.columns = ["_".join(column) for column in phase_wise.columns]
+    phase_wise = phase_wise.fillna({"difference_duration_ms": 0.0, "difference_count": 0.0})
+
+    for row in phase_wise.reset_index().to_dict("records"):
+        duration_diff = round(row["difference_duration_ms"], 2)
+        count_diff = round(row["difference_count"], 2)
+        st.write(
+            f"""
+    **Profile: {row["profile"]}, Phase: {row["phase"]}**
+    - Duration Difference: `{duration_diff}ms` ({describe_change(duration_diff, row["difference_pct_duration_ms"], "🐢 slower", "🚀 faster")})
+    - Count Difference: `{count_diff}` ({describe_change(count_diff, row["difference_pct_count"], "🔺 more", "🔻 fewer")})
+            """
+        )
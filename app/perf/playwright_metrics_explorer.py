@@ -2,10 +2,11 @@ import datetime
 import json
 from typing import Any
 
+import pandas as pd
 import plotly.express as px
 import streamlit as st
 
-from app.perf.utils.charting import make_gantt_entry
+from app.perf.utils.charting import build_gantt_timeline, downsample_gantt_timeline
 from app.perf.utils.docs import METRIC_DEFINITIONS
 from app.perf.utils.perf_traces import (
     get_phases_for_all_profiles,
@@ -41,73 +42,55 @@ def render_metrics_explorer() -> None:
     }
 
     @st.cache_data(ttl=60 * 60 * 12)
-    def get_json_data(the_file: Any) -> dict:
-        return json.load(the_file)
+    def get_timeline(file_bytes: bytes) -> pd.DataFrame:
+        return build_gantt_timeline(json.loads(file_bytes))
 
-    data = get_json_data(json_file)
+    timeline = get_timeline(json_file.getvalue())
 
-    @st.cache_data(ttl=60 * 60 * 12)
-    def get_gantt_data(the_data: dict) -> dict:
-        timestamp_parsed = datetime.datetime.strptime(json_file.name.split("_")[0], "%Y%m%d%H%M%S")
-
-        # Extract relevant data for the Gantt chart
-        gantt_data = []
-
-        for phase in the_data["capturedTraces"]["profiles"]:
-            for entry in the_data["capturedTraces"]["profiles"][phase]["entries"]:
-                start_time = timestamp_parsed + datetime.timedelta(milliseconds=entry["startTime"])
-                finish_time = timestamp_parsed + datetime.timedelta(
-                    milliseconds=entry["startTime"] + entry["actualDuration"]
-                )
-                gantt_data.append(
-                    {
-                        "Task": entry["phase"],
-                        "Start": start_time,
-                        "Finish": finish_time,
-                        "Location": phase,
-                    }
-                )
-
-        gantt_data.extend(
-            make_gantt_entry(timestamp_parsed, measurement, "script-run-cycle", "Global")
-            for measurement in the_data["capturedTraces"]["measure"]
-            if measurement["name"] == "script-run-cycle"
-        )
-
-        traces = ["long-animation-frame"]
-
-        for trace in traces:
-            if trace in the_data["capturedTraces"]:
-                gantt_data.extend(
-                    make_gantt_entry(timestamp_parsed, measurement, trace, "Global")
-                    for measurement in the_data["capturedTraces"][trace]
-                )
+    if timeline.empty:
+        st.info("This file doesn't contain any profiler entries or traces to show in a timeline.")
+        st.stop()
 
-        all_start_times = [entry["Start"] for entry in gantt_data]
-        all_finish_times = [entry["Finish"] for entry in gantt_data]
+    timeline_start = float(timeline["start_ms"].min())
+    timeline_finish = float(timeline["finish_ms"].max())
+    with st.container(width="content"):
+        window_start, window_finish = st.slider(
+            "Time window (ms)",
+            min_value=timeline_start,
+            max_value=max(timeline_finish, timeline_start + 1),
+            value=(timeline_start, max(timeline_finish, timeline_start + 1)),
+            help="Zoom into a part of the trace. Bars narrower than a pixel at the selected zoom level are merged.",
+        )
 
-        return {
-            "gantt_data": gantt_data,
-            "start_time": min(all_start_times),
-            "finish_time": max(all_finish_times),
-        }
+    visible_bars = downsample_gantt_timeline(timeline, window_start, window_finish)
+    st.caption(f"Showing {len(visible_bars):,} bars for {int(visible_bars['merged_count'].sum()):,} trace entries.")
 
-    gantt_data = get_gantt_data(data)
+    timestamp_parsed = datetime.datetime.strptime(json_file.name.split("_")[0], "%Y%m%d%H%M%S")
+    gantt_data = visible_bars.assign(
+        Start=timestamp_parsed + pd.to_timedelta(visible_bars["start_ms"], unit="ms"),
+        Finish=timestamp_parsed + pd.to_timedelta(visible_bars["finish_ms"], unit="ms"),
+    )
 
     # Create a Gantt chart
     fig = px.timeline(
-        gantt_data["gantt_data"],
+        gantt_data,
         x_start="Start",
         x_end="Finish",
         y="Task",
         color="Location",
+        hover_data=["merged_count"],
         title="Performance Metrics",
     )
     # Update layout for better readability
     fig.update_layout(
         xaxis_title="Time",
         yaxis_title="Measurement",
-        xaxis=dict(range=[gantt_data["start_time"], gantt_data["finish_time"]]),
+        xaxis=dict(
+            range=[
+                timestamp_parsed + datetime.timedelta(milliseconds=window_start),
+                timestamp_parsed + datetime.timedelta(milliseconds=window_finish),
+            ]
+        ),
     )
 
     st.plotly_chart(fig, width="stretch")
@@ -118,11 +101,17 @@ def render_metrics_explorer() -> None:
         with st.expander("Metric Definitions"):
             st.markdown(METRIC_DEFINITIONS)
 
+    def format_duration_percentiles(phase_values: dict) -> str:
+        return f"""
+Median / p95 duration per render: `{round(phase_values["p50ActualDuration"], 2)}ms` / `{round(phase_values["p95ActualDuration"], 2)}ms`
+"""
+
     def check_mount_count(phase_values: dict, profile_id: str) -> str:
         st.write("#### Mount")
         res = f"""
 Total time spent in mount: `{round(phase_values["actualDuration"], 2)}ms`
 """
+        res += format_duration_percentiles(phase_values)
 
         if phase_values["count"] > 1:
             res += f"""
@@ -144,6 +133,7 @@ unless we are dealing with a full page transition/reload.
         res = f"""
 Total time spent in nested updates: `{round(phase_values["actualDuration"], 2)}ms`
 """
+        res += format_duration_percentiles(phase_values)
 
         if phase_values["count"] > 0:
             res += f"""
@@ -162,6 +152,7 @@ synchronous. Expand the Metric Definitions section above for more information.
         res = f"""
 Total time spent in updates: `{round(phase_values["actualDuration"], 2)}ms`
 """
+        res += format_duration_percentiles(phase_values)
 
         if phase_values["count"] > 1:
             res += f"""
@@ -6,11 +6,12 @@ import plotly.express as px
 import streamlit as st
 
 from app.perf import (
+    playwright_bisect,
     playwright_interpreting_results,
     playwright_metrics_explorer,
     playwright_writing_a_test,
 )
-from app.perf.utils.artifacts import get_artifact_results
+from app.perf.utils.artifacts import get_cached_playwright_results
 from app.perf.utils.commit_details import (
     render_selected_commit_sidebar,
     reset_selection_on_page_change,
@@ -34,7 +35,7 @@ with title_row:
     st.title("🎭 Playwright performance")
 
 tab = segmented_tabs(
-    options=["Runs", "Interpret metrics", "Write a test", "Explorer"],
+    options=["Runs", "Interpret metrics", "Write a test", "Explorer", "Bisect"],
     key="playwright_tab",
     query_param="tab",
     default="Runs",
@@ -47,6 +48,8 @@ if tab != "Runs":
         playwright_writing_a_test.render_writing_a_test()
     elif tab == "Explorer":
         playwright_metrics_explorer.render_metrics_explorer()
+    elif tab == "Bisect":
+        playwright_bisect.render_bisect()
     st.stop()
 
 token = st.secrets["github"]["token"]
@@ -64,11 +67,6 @@ def get_commits(branch_name: str, until_date: str | None = None, limit: int = 50
     return get_commit_hashes_for_branch_name(branch_name, limit=limit, until_date=until_date)
 
 
-@st.cache_data(ttl=60 * 60 * 12)
-def get_everything_by_hash(commit_hash: str, load_all_metrics: bool) -> tuple:
-    return get_artifact_results(commit_hash, "playwright", load_all_metrics=load_all_metrics)
-
-
 selected_test_param = st.query_params.get("test")
 show_mean_line = st.query_params.get("show_mean_line", "True").lower() == "true"
 show_boxplot = st.query_params.get("show_boxplot", "True").lower() == "true"
@@ -106,7 +104,7 @@ timestamps_list: list[str] = []
 with concurrent.futures.ThreadPoolExecutor() as executor:
     # Create futures with their corresponding indices and hashes
     future_mapping = {
-        executor.submit(get_everything_by_hash, h, load_all_metrics): (i, h)
+        executor.submit(get_cached_playwright_results, h, load_all_metrics): (i, h)
         for i, h in enumerate(initial_commit_hashes)
     }
 
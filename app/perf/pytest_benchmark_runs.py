@@ -1,7 +1,6 @@
 import concurrent.futures
 import operator
 
-import pandas as pd
 import plotly.express as px
 import streamlit as st
 
@@ -16,7 +15,19 @@ from app.perf.utils.commit_details import (
     update_selected_commit_from_selection,
 )
 from app.perf.utils.perf_github_artifacts import get_commit_hashes_for_branch_name
-from app.perf.utils.pytest_types import BenchmarkStats, OutputJson
+from app.perf.utils.pytest_benchmark_data import (
+    SAMPLE_QUANTILES,
+    TIME_STATS,
+    BenchmarkRun,
+    BenchmarkRunTable,
+    benchmark_samples_frame,
+    benchmark_summary_frame,
+    build_benchmark_run_table,
+    calibration_factors,
+    compare_latest_by_fingerprint,
+    rescale_by_calibration,
+    sample_quantiles,
+)
 from app.perf.utils.tab_nav import segmented_tabs
 
 TITLE = "Pytest performance"
@@ -57,96 +68,147 @@ def get_commits(branch_name: str, limit: int = 50) -> list[str]:
 
 
 @st.cache_data(ttl=60 * 60 * 12)
-def get_pytest_results(commit_hash: str) -> tuple:
-    return get_artifact_results(commit_hash, "pytest")
+def get_pytest_results(commit_hash: str) -> tuple[BenchmarkRunTable | None, str | None]:
+    # Only the columnar form is cached, not the parsed JSON with all raw samples.
+    results, timestamp = get_artifact_results(commit_hash, "pytest")
+    if not results or not timestamp:
+        return None, None
+    return build_benchmark_run_table(results), timestamp
 
 
 commit_hashes = get_commits("develop")
 
 
-directories: list[str] = []
-run_results: list[tuple[str, str, OutputJson]] = []
+run_results: list[BenchmarkRun] = []
 
 # Download all the artifacts for the performance runs in parallel
 with concurrent.futures.ThreadPoolExecutor() as executor:
     future_mapping = {executor.submit(get_pytest_results, commit_hash): commit_hash for commit_hash in commit_hashes}
     for future in concurrent.futures.as_completed(future_mapping):
         commit_hash = future_mapping[future]
-        results, timestamp = future.result()
+        table, timestamp = future.result()
 
-        if not results or not timestamp:
+        if table is None or not timestamp:
             continue
 
-        run_results.append((timestamp, commit_hash, results))
+        run_results.append(BenchmarkRun(timestamp, commit_hash, table))
 
 # Guard: no data found
 if not run_results:
     st.info("No Pytest benchmark artifacts found for the selected commits.")
     st.stop()
 
-# Sort results and timestamps based on timestamps
-sorted_runs = sorted(run_results, key=operator.itemgetter(0))
-timestamps_sorted, commit_hashes_sorted, results_by_run = zip(*sorted_runs, strict=False)
-
-
-all_tests_set: set[str] = set()
-processed_results: dict[str, BenchmarkStats] = {}
-benchmark_data: list[dict] = []
-
-for run_index, (results, timestamp, commit_hash) in enumerate(
-    zip(results_by_run, timestamps_sorted, commit_hashes_sorted, strict=False)
-):
-    for test in results["benchmarks"]:
-        all_tests_set.add(test["name"])
-
-        if test["name"] not in processed_results:
-            processed_results[test["name"]] = test["stats"]
-
-        benchmark_data.append(
-            {
-                "test_name": test["name"],
-                "run_index": run_index,
-                "timestamp": timestamp,
-                "commit_hash": commit_hash[:7],
-                "commit_sha_full": commit_hash,
-                "min": test["stats"]["min"],
-                "max": test["stats"]["max"],
-                "mean": test["stats"]["mean"],
-                "stddev": test["stats"]["stddev"],
-                "median": test["stats"]["median"],
-                "iqr": test["stats"]["iqr"],
-                "q1": test["stats"]["q1"],
-                "q3": test["stats"]["q3"],
-                "iterations": test["stats"]["iterations"],
-            }
-        )
+# Sort runs based on timestamps
+sorted_runs = sorted(run_results, key=operator.attrgetter("timestamp"))
 
-df = pd.DataFrame(benchmark_data)
+df = benchmark_summary_frame(sorted_runs)
 
 if df.empty:
     st.info("No benchmark data found in the downloaded artifacts.")
     st.stop()
 
+fingerprints = sorted(df["fingerprint"].unique())
+runner_controls = st.container(horizontal=True, gap="medium")
+with runner_controls, st.container(width=500):
+    selected_fingerprints = st.multiselect(
+        "Runners",
+        fingerprints,
+        default=fingerprints,
+        help="Runs are grouped by runner fingerprint (CPU model, core count and Python version). "
+        "Each runner gets its own series, since timings of different runner types aren't comparable.",
+    )
+with runner_controls, st.container(width=500):
+    calibration_test = st.selectbox(
+        "Calibrate against",
+        sorted(df["test_name"].unique()),
+        index=None,
+        placeholder="No calibration",
+        help="Divide all timings of a run by the median of this benchmark in the same run. "
+        "This cancels out most of the speed difference between runners. Runs without this benchmark are hidden.",
+    )
+
+df = df[df["fingerprint"].isin(selected_fingerprints)]
+quantiles_df = sample_quantiles(benchmark_samples_frame(sorted_runs))
+time_label = "Time (s)"
+
+if calibration_test:
+    factors = calibration_factors(df, calibration_test)
+    df = rescale_by_calibration(df, factors, TIME_STATS)
+    quantiles_df = rescale_by_calibration(quantiles_df, factors, list(SAMPLE_QUANTILES))
+    time_label = f"Time (x {calibration_test})"
+
+if df.empty:
+    st.info("No benchmark data found for the selected runners.")
+    st.stop()
+
+with st.expander("Latest run vs. earlier runs on the same runner"):
+    st.dataframe(
+        compare_latest_by_fingerprint(df).rename(
+            columns={
+                "test_name": "Test",
+                "fingerprint": "Runner",
+                "latest": "Latest median",
+                "baseline": "Baseline median",
+                "baseline_runs": "Baseline runs",
+                "change_pct": "Change (%)",
+            }
+        ),
+        hide_index=True,
+        column_config={"Change (%)": st.column_config.NumberColumn(format="%.2f")},
+    )
+
+quantiles_by_test = {
+    str(test_name): test_quantiles.set_index("run_index")
+    for test_name, test_quantiles in quantiles_df.groupby("test_name", observed=True)
+}
+
+distribution: str | None = "Summary"
+if quantiles_by_test:
+    with st.container(width="content"):
+        distribution = st.segmented_control(
+            "Distribution",
+            ["Summary", "Raw samples"],
+            default="Raw samples",
+            help="Summary shows min, Q1, median, Q3 and max as reported by pytest-benchmark. "
+            "Raw samples shows the 5th, 25th, 50th, 75th and 95th percentiles of the individual "
+            "rounds, for runs that saved them.",
+        )
+
 grid = st.container(horizontal=True, gap="medium")
 
-all_tests = sorted(all_tests_set)
+all_tests: list[str] = []
 
-for test_name in all_tests:
-    test_df = df[df["test_name"] == test_name].reset_index(drop=True)
+for test_name, group_df in df.groupby("test_name", observed=True, sort=True):
+    all_tests.append(str(test_name))
+    test_df = group_df.reset_index(drop=True)
     fig = px.scatter(
         test_df,
         x="run_index",
         y="median",
-        title=test_name,
-        labels={"run_index": "Run Index", "median": "Time (s)"},
-        hover_data=["timestamp", "commit_hash"],
+        title=str(test_name),
+        color="fingerprint" if len(selected_fingerprints) > 1 else None,
+        labels={"run_index": "Run Index", "median": time_label, "fingerprint": "Runner"},
+        hover_data=["timestamp", "commit_hash", "fingerprint"],
         custom_data=["commit_sha_full"],
     )
     fig.update_traces(marker=dict(symbol="circle", opacity=0.6))
     fig.update_layout(clickmode="event+select")
 
+    test_quantiles = quantiles_by_test.get(str(test_name))
+    if distribution == "Raw samples" and test_quantiles is not None:
+        # Runs without raw samples fall back to their summary stats.
+        box_df = test_df.join(test_quantiles[list(SAMPLE_QUANTILES)], on="run_index", rsuffix="_sample")
+        box_df = box_df.assign(
+            min=box_df["p5"].fillna(box_df["min"]),
+            q1=box_df["q1_sample"].fillna(box_df["q1"]),
+            median=box_df["median_sample"].fillna(box_df["median"]),
+            q3=box_df["q3_sample"].fillna(box_df["q3"]),
+            max=box_df["p95"].fillna(box_df["max"]),
+        )
+    else:
+        box_df = test_df
     box_fig = px.box(
-        test_df,
+        box_df,
         x="run_index",
         y=["min", "q1", "median", "q3", "max"],
         points=None,
@@ -1,25 +1,35 @@
 from __future__ import annotations
 
 import pathlib
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import streamlit as st
+
+from app.perf.utils.lighthouse_metrics import lighthouse_app_key, lighthouse_metrics_frame
 from app.perf.utils.perf_github_artifacts import (
     extract_run_id_from_url,
     get_artifact_by_name,
     get_build_from_github,
     get_playwright_performance_artifact,
 )
-from app.perf.utils.test_diff_analyzer import ProcessTestDirectoryOutput, process_test_results_files
+from app.perf.utils.perf_run_index import get_performance_run_artifacts, lookup_performance_run
+from app.perf.utils.perf_traces import load_trace_aggregates
+from app.perf.utils.test_diff_analyzer import ProcessTestDirectoryOutput, process_test_results_aggregates
 from app.utils.github_utils import (
     download_artifact,
     fetch_artifacts,
     iter_json_from_zip_bytes,
+    iter_json_members_from_zip_bytes,
     zip_namelist,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import pandas as pd
+
 
-def _get_performance_artifact_zip_bytes_for_run(run_id: str) -> bytes | None:
-    artifacts = fetch_artifacts(int(run_id))
+def _get_performance_artifact_zip_bytes(artifacts: list[dict[str, Any]]) -> bytes | None:
     if not artifacts:
         return None
 
@@ -36,25 +46,18 @@ def _extract_playwright_results(zip_bytes: bytes, *, load_all_metrics: bool) ->
     names = zip_namelist(zip_bytes)
     has_playwright_dir = any(n.startswith("playwright/") and n.endswith(".json") and not n.endswith("/") for n in names)
     if has_playwright_dir:
-        files_iter = (
-            (pathlib.Path(name).name, payload)
-            for name, payload in iter_json_from_zip_bytes(zip_bytes, prefix="playwright/")
-        )
+        members = iter_json_members_from_zip_bytes(zip_bytes, prefix="playwright/")
     else:
         # Legacy: no subfolders -> treat root JSON files as Playwright traces.
-        files_iter = (
-            (pathlib.Path(name).name, payload) for name, payload in iter_json_from_zip_bytes(zip_bytes, root_only=True)
-        )
+        members = iter_json_members_from_zip_bytes(zip_bytes, root_only=True)
 
-    return process_test_results_files(files_iter, load_all_metrics=load_all_metrics)
+    # Aggregate each trace while it is decompressed and parsed, so the raw trace
+    # entries of large runs are never held in memory.
+    files_iter = ((pathlib.Path(name).name, load_trace_aggregates(stream)) for name, stream in members)
+    return process_test_results_aggregates(files_iter, load_all_metrics=load_all_metrics)
 
 
-def _extract_lighthouse_scores(zip_bytes: bytes) -> dict[str, float]:
-    """Extract Lighthouse performance scores from a performance artifact zip.
-
-    Returns mapping of app key (matching prior `read_json_files` naming) -> score (0..1).
-    """
-    scores: dict[str, float] = {}
+def _iter_lighthouse_reports(zip_bytes: bytes) -> Iterator[tuple[str, dict[str, Any]]]:
     names = zip_namelist(zip_bytes)
     has_lighthouse_dir = any(n.startswith("lighthouse/") and n.endswith(".json") and not n.endswith("/") for n in names)
 
@@ -65,28 +68,34 @@ def _extract_lighthouse_scores(zip_bytes: bytes) -> dict[str, float]:
     )
 
     for member_name, payload in json_iter:
-        if not isinstance(payload, dict):
-            continue
+        if isinstance(payload, dict):
+            yield member_name, payload
+
+
+def _extract_lighthouse_scores(zip_bytes: bytes) -> dict[str, float]:
+    """Extract Lighthouse performance scores from a performance artifact zip.
+
+    Returns mapping of app key (matching prior `read_json_files` naming) -> score (0..1).
+    """
+    scores: dict[str, float] = {}
+
+    for member_name, payload in _iter_lighthouse_reports(zip_bytes):
         try:
             score = payload["categories"]["performance"]["score"]
         except Exception:  # ruff:ignore[try-except-continue]
             continue
 
-        # Keep the same (slightly odd) key derivation behavior as the prior disk-based parser.
-        parts = member_name.split("_-_")
-        if len(parts) >= 3:
-            app_name = parts[1]
-            device_type = parts[2]
-            key = f"{app_name}_{device_type}"
-        else:
-            key = member_name
-
         if isinstance(score, (int, float)):
-            scores[key] = float(score)
+            scores[lighthouse_app_key(member_name)] = float(score)
 
     return scores
 
 
+def _extract_lighthouse_metrics(zip_bytes: bytes) -> pd.DataFrame:
+    """Extract the score and core timing audits of every Lighthouse report, see `lighthouse_metrics_frame()`."""
+    return lighthouse_metrics_frame(_iter_lighthouse_reports(zip_bytes))
+
+
 def _extract_pytest_benchmark_json(zip_bytes: bytes) -> dict[str, Any] | None:
     names = zip_namelist(zip_bytes)
     has_pytest_dir = any(n.startswith("pytest/") and n.endswith(".json") and not n.endswith("/") for n in names)
@@ -116,27 +125,38 @@ def get_artifact_results(
                Returns (None, None) if no artifact is found or the build is not completed.
                Returns ("", "") if the artifact run status is not completed.
     """
-    build_data = get_build_from_github(commit_hash)
+    indexed_run = lookup_performance_run(commit_hash)
+    if indexed_run is not None:
+        if indexed_run["status"] != "completed":
+            return "", ""
+        build_timestamp = indexed_run["started_at"]
+        artifacts = [dict(artifact) for artifact in get_performance_run_artifacts(commit_hash, indexed_run)]
+        zip_bytes = _get_performance_artifact_zip_bytes(artifacts)
+    else:
+        # Not a develop commit covered by the run index (e.g. a PR commit or an
+        # old commit), resolve its performance run individually.
+        build_data = get_build_from_github(commit_hash)
 
-    if build_data is None:
-        return None, None
+        if build_data is None:
+            return None, None
 
-    artifact_run = get_playwright_performance_artifact(build_data)
+        artifact_run = get_playwright_performance_artifact(build_data)
 
-    if artifact_run is None:
-        return None, None
+        if artifact_run is None:
+            return None, None
 
-    if artifact_run.get("status") != "completed":
-        return "", ""
+        if artifact_run.get("status") != "completed":
+            return "", ""
 
-    build_timestamp = artifact_run["started_at"]
+        build_timestamp = artifact_run["started_at"]
 
-    run_id = extract_run_id_from_url(artifact_run["details_url"])
+        run_id = extract_run_id_from_url(artifact_run["details_url"])
 
-    if run_id is None:
-        return None, None
+        if run_id is None:
+            return None, None
+
+        zip_bytes = _get_performance_artifact_zip_bytes(fetch_artifacts(int(run_id)))
 
-    zip_bytes = _get_performance_artifact_zip_bytes_for_run(run_id)
     if not zip_bytes:
         return None, None
 
@@ -144,7 +164,34 @@ def get_artifact_results(
         return _extract_playwright_results(zip_bytes, load_all_metrics=load_all_metrics), build_timestamp
     if artifact_type == "lighthouse":
         return _extract_lighthouse_scores(zip_bytes), build_timestamp
+    if artifact_type == "lighthouse_metrics":
+        return _extract_lighthouse_metrics(zip_bytes), build_timestamp
     if artifact_type == "pytest":
         return _extract_pytest_benchmark_json(zip_bytes), build_timestamp
 
     return None, None
+
+
+def get_lighthouse_scores_for_run(run_id: int) -> dict[str, float] | None:
+    """Extract the Lighthouse scores from the artifacts of a workflow run, e.g. of a PR.
+
+    Returns None if the run has no Lighthouse artifact.
+    """
+    artifacts = fetch_artifacts(run_id)
+    zip_bytes = _get_performance_artifact_zip_bytes(artifacts)
+    if not zip_bytes:
+        lighthouse_artifact = next((a for a in artifacts if "lighthouse" in a["name"].lower()), None)
+        if lighthouse_artifact is None:
+            return None
+        zip_bytes = download_artifact(lighthouse_artifact["archive_download_url"])
+    if not zip_bytes:
+        return None
+    return _extract_lighthouse_scores(zip_bytes)
+
+
+@st.cache_data(ttl=60 * 60 * 12, show_spinner=False)
+def get_cached_playwright_results(
+    commit_hash: str, load_all_metrics: bool = False
+) -> tuple[ProcessTestDirectoryOutput | str | None, str | None]:
+    """Cached `get_artifact_results()` for Playwright, shared by all Playwright perf pages."""
+    return get_artifact_results(commit_hash, "playwright", load_all_metrics=load_all_metrics)
@@ -12,30 +12,105 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import datetime
 from typing import Any
 
+import numpy as np
+import pandas as pd
 
-def make_gantt_entry(
-    now: datetime.datetime, measurement: dict[str, Any], task_name: str, location: str
-) -> dict[str, Any]:
-    """Create a Gantt chart entry.
+
+def build_gantt_timeline(file_as_dict: dict[str, Any]) -> pd.DataFrame:
+    """Build a columnar Gantt dataset for all bars of a Playwright trace.
+
+    Contains one row per React profiler entry, `script-run-cycle` measure and
+    long animation frame, with times in milliseconds relative to the trace start.
+    Build this once per file and use `downsample_gantt_timeline()` to produce
+    the bars for the current zoom window.
+
+    Args:
+        file_as_dict: The parsed trace JSON.
+
+    Returns:
+        A DataFrame with the columns Task, Location, start_ms and finish_ms,
+        sorted by lane (Task, Location) and start time.
+    """
+    captured_traces = file_as_dict.get("capturedTraces") or {}
+    tasks: list[str] = []
+    locations: list[str] = []
+    starts: list[float] = []
+    durations: list[float] = []
+
+    for profile_name, profile in (captured_traces.get("profiles") or {}).items():
+        for entry in profile.get("entries", []):
+            tasks.append(entry["phase"])
+            locations.append(profile_name)
+            starts.append(entry["startTime"])
+            durations.append(entry["actualDuration"])
+
+    for measurement in captured_traces.get("measure") or []:
+        if measurement["name"] == "script-run-cycle":
+            tasks.append("script-run-cycle")
+            locations.append("Global")
+            starts.append(measurement["startTime"])
+            durations.append(measurement["duration"])
+
+    for measurement in captured_traces.get("long-animation-frame") or []:
+        tasks.append("long-animation-frame")
+        locations.append("Global")
+        starts.append(measurement["startTime"])
+        durations.append(measurement["duration"])
+
+    start_ms = np.asarray(starts, dtype=np.float64)
+    timeline = pd.DataFrame(
+        {
+            "Task": pd.Categorical(tasks),
+            "Location": pd.Categorical(locations),
+            "start_ms": start_ms,
+            "finish_ms": start_ms + np.asarray(durations, dtype=np.float64),
+        }
+    )
+    return timeline.sort_values(["Task", "Location", "start_ms"], ignore_index=True)
+
+
+def downsample_gantt_timeline(
+    timeline: pd.DataFrame,
+    window_start_ms: float,
+    window_end_ms: float,
+    width_px: int = 1200,
+) -> pd.DataFrame:
+    """Clip the timeline to a zoom window and merge bars that can't be told apart.
+
+    Within each lane (Task, Location), consecutive bars are merged if they overlap
+    or the gap between them is narrower than one pixel at the current zoom level.
+    The number of rendered bars is therefore bounded by the chart width instead
+    of the number of trace entries.
 
     Args:
-        now: The current datetime.
-        measurement: A dictionary containing measurement data.
-        task_name: The name of the task.
-        location: The location of the task.
+        timeline: The output of `build_gantt_timeline()`.
+        window_start_ms: Start of the visible window in milliseconds.
+        window_end_ms: End of the visible window in milliseconds.
+        width_px: Approximate width of the chart in pixels.
 
     Returns:
-        A dictionary representing a Gantt chart entry.
+        A DataFrame with the same columns as the timeline plus `merged_count`,
+        the number of original bars each row represents.
     """
-    start_time = now + datetime.timedelta(milliseconds=measurement["startTime"])
-    finish_time = now + datetime.timedelta(milliseconds=measurement["startTime"] + measurement["duration"])
-
-    return {
-        "Task": task_name,
-        "Start": start_time,
-        "Finish": finish_time,
-        "Location": location,
-    }
+    visible = timeline[(timeline["finish_ms"] >= window_start_ms) & (timeline["start_ms"] <= window_end_ms)]
+    if visible.empty:
+        return visible.assign(merged_count=pd.Series(dtype="int64"))
+
+    ms_per_px = max(window_end_ms - window_start_ms, 1e-9) / max(width_px, 1)
+    lane = visible.groupby(["Task", "Location"], observed=True, sort=False)
+    # The furthest a previous bar in the same lane reaches; a new merged bar only
+    # starts if there is at least a pixel of empty space before it.
+    previous_reach = lane["finish_ms"].cummax().groupby([visible["Task"], visible["Location"]], observed=True).shift()
+    starts_new_bar = previous_reach.isna() | (visible["start_ms"] - previous_reach >= ms_per_px)
+    bar_id = starts_new_bar.cumsum()
+
+    merged = visible.groupby(bar_id, sort=False).agg(
+        Task=("Task", "first"),
+        Location=("Location", "first"),
+        start_ms=("start_ms", "min"),
+        finish_ms=("finish_ms", "max"),
+        merged_count=("start_ms", "size"),
+    )
+    return merged.reset_index(drop=True)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Final
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Lighthouse audit id -> metric name. All values are the audit's `numericValue`.
+LIGHTHOUSE_AUDIT_METRICS: Final[dict[str, str]] = {
+    "first-contentful-paint": "fcp_ms",
+    "largest-contentful-paint": "lcp_ms",
+    "total-blocking-time": "tbt_ms",
+    "cumulative-layout-shift": "cls",
+    "speed-index": "speed_index_ms",
+    "interactive": "tti_ms",
+    # Only reported by timespan reports that include interactions.
+    "interaction-to-next-paint": "inp_ms",
+    "total-byte-weight": "total_byte_weight_bytes",
+    "mainthread-work-breakdown": "main_thread_ms",
+}
+MAIN_THREAD_METRIC_PREFIX: Final[str] = "main_thread_"
+
+METRIC_LABELS: Final[dict[str, str]] = {
+    "score": "Performance score",
+    "fcp_ms": "First Contentful Paint (ms)",
+    "lcp_ms": "Largest Contentful Paint (ms)",
+    "tbt_ms": "Total Blocking Time (ms)",
+    "cls": "Cumulative Layout Shift",
+    "speed_index_ms": "Speed Index (ms)",
+    "tti_ms": "Time to Interactive (ms)",
+    "inp_ms": "Interaction to Next Paint (ms)",
+    "total_byte_weight_bytes": "Total byte weight (bytes)",
+    "main_thread_ms": "Main-thread work (ms)",
+}
+
+
+def lighthouse_app_key(member_name: str) -> str:
+    """Derive the app key (`<app>_<device>`) from the name of a Lighthouse report file."""
+    parts = member_name.split("_-_")
+    if len(parts) >= 3:
+        return f"{parts[1]}_{parts[2]}"
+    return member_name
+
+
+def extract_lighthouse_metrics(report: dict[str, Any]) -> dict[str, float]:
+    """Extract the performance score and the core timing audits from a Lighthouse report.
+
+    The main-thread breakdown is split into one `main_thread_<group>_ms` metric
+    per work group (e.g. `scriptEvaluation`, `styleLayout`). Audits missing from
+    the report or without a numeric value are left out.
+    """
+    metrics: dict[str, float] = {}
+
+    score = (report.get("categories") or {}).get("performance", {}).get("score")
+    if isinstance(score, (int, float)):
+        metrics["score"] = float(score)
+
+    audits = report.get("audits") or {}
+    for audit_id, metric in LIGHTHOUSE_AUDIT_METRICS.items():
+        value = (audits.get(audit_id) or {}).get("numericValue")
+        if isinstance(value, (int, float)):
+            metrics[metric] = float(value)
+
+    breakdown = ((audits.get("mainthread-work-breakdown") or {}).get("details") or {}).get("items") or []
+    for item in breakdown:
+        group = item.get("group")
+        duration = item.get("duration")
+        if group and isinstance(duration, (int, float)):
+            metrics[f"{MAIN_THREAD_METRIC_PREFIX}{group}_ms"] = float(duration)
+
+    return metrics
+
+
+def lighthouse_metrics_frame(reports: Iterable[tuple[str, dict[str, Any]]]) -> pd.DataFrame:
+    """Build a compact long table with one row per app and metric from `(member name, report)` pairs.
+
+    `app_name` and `metric` are categorical and `value` is float32, so the
+    per-commit tables stay small when they are cached.
+    """
+    rows = [
+        (lighthouse_app_key(member_name), metric, value)
+        for member_name, report in reports
+        for metric, value in extract_lighthouse_metrics(report).items()
+    ]
+    frame = pd.DataFrame(rows, columns=["app_name", "metric", "value"])
+    return frame.astype({"app_name": "category", "metric": "category", "value": "float32"})
+
+
+def metric_label(metric: str) -> str:
+    """Return a human readable label for a metric of `lighthouse_metrics_frame()`."""
+    if metric in METRIC_LABELS:
+        return METRIC_LABELS[metric]
+    if metric.startswith(MAIN_THREAD_METRIC_PREFIX):
+        group = metric.removeprefix(MAIN_THREAD_METRIC_PREFIX).removesuffix("_ms")
+        return f"Main-thread work: {group} (ms)"
+    return metric
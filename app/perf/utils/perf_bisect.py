@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import statistics
+from typing import TYPE_CHECKING, Literal, TypedDict
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from app.perf.utils.test_diff_analyzer import ProcessTestDirectoryOutput
+
+Verdict = Literal["good", "bad", "skipped"]
+
+
+class BisectStep(TypedDict):
+    commit_hash: str
+    index: int
+    value: float | None
+    verdict: Verdict
+
+
+class BisectResult(TypedDict):
+    good_value: float | None
+    bad_value: float | None
+    last_good_index: int
+    first_bad_index: int
+    # Commits between `last_good_index` (exclusive) and `first_bad_index`
+    # (inclusive) that could still contain the change. A single entry means the
+    # regression was localised to one commit.
+    culprit_candidates: list[str]
+    steps: list[BisectStep]
+
+
+def get_metric_value(results: ProcessTestDirectoryOutput | None, test_name: str, metric_name: str) -> float | None:
+    """Return the mean value of a metric for a single processed Playwright run.
+
+    Returns None if the run has no samples for the given test and metric.
+    """
+    if not results:
+        return None
+    samples = results.get(test_name, {}).get(metric_name)
+    if not samples:
+        return None
+    return float(statistics.fmean(samples))
+
+
+def classify_value(value: float, good_value: float, bad_value: float) -> Verdict:
+    """Classify a value as good or bad depending on which endpoint it is closer to."""
+    return "bad" if abs(value - bad_value) < abs(value - good_value) else "good"
+
+
+def _next_probe(low: int, high: int, skipped: set[int]) -> int | None:
+    """Pick the untested commit closest to the midpoint of the open interval (low, high)."""
+    candidates = [idx for idx in range(low + 1, high) if idx not in skipped]
+    if not candidates:
+        return None
+    midpoint = (low + high) / 2
+    return min(candidates, key=lambda idx: (abs(idx - midpoint), idx))
+
+
+def bisect_commits(
+    commit_hashes: Sequence[str],
+    get_value: Callable[[str], float | None],
+) -> BisectResult:
+    """Localise a performance change between a good and a bad commit.
+
+    The first commit in `commit_hashes` is the known good endpoint and the last
+    commit is the known bad endpoint (ordered oldest to newest). Only the
+    endpoints and the midpoint commits needed to narrow the range are passed to
+    `get_value`, so the number of artifact downloads grows with O(log N)
+    instead of O(N). Commits without a value (e.g. missing or expired
+    artifacts) are skipped and the next closest commit to the midpoint is
+    probed instead.
+
+    Args:
+        commit_hashes: Commits ordered from the good endpoint to the bad endpoint.
+        get_value: Returns the metric value for a commit or None if unavailable.
+
+    Returns:
+        BisectResult: The narrowed range and every probed commit.
+    """
+    if len(commit_hashes) < 2:
+        msg = "At least a good and a bad commit are required to bisect."
+        raise ValueError(msg)
+
+    low = 0
+    high = len(commit_hashes) - 1
+    steps: list[BisectStep] = []
+
+    good_value = get_value(commit_hashes[low])
+    bad_value = get_value(commit_hashes[high])
+    steps.extend(
+        [
+            {"commit_hash": commit_hashes[low], "index": low, "value": good_value, "verdict": "good"},
+            {"commit_hash": commit_hashes[high], "index": high, "value": bad_value, "verdict": "bad"},
+        ]
+    )
+
+    if good_value is not None and bad_value is not None:
+        skipped: set[int] = set()
+        while (probe := _next_probe(low, high, skipped)) is not None:
+            value = get_value(commit_hashes[probe])
+            if value is None:
+                skipped.add(probe)
+                steps.append({"commit_hash": commit_hashes[probe], "index": probe, "value": None, "verdict": "skipped"})
+                continue
+
+            verdict = classify_value(value, good_value, bad_value)
+            steps.append({"commit_hash": commit_hashes[probe], "index": probe, "value": value, "verdict": verdict})
+            if verdict == "bad":
+                high = probe
+            else:
+                low = probe
+
+    return {
+        "good_value": good_value,
+        "bad_value": bad_value,
+        "last_good_index": low,
+        "first_bad_index": high,
+        "culprit_candidates": list(commit_hashes[low + 1 : high + 1]),
+        "steps": steps,
+    }
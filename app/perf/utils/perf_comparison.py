@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from app.perf.utils.test_diff_analyzer import ProcessTestDirectoryOutput
+
+COMPARISON_KEYS = ["test", "profile", "phase", "metric"]
+
+
+def results_to_long_frame(results: ProcessTestDirectoryOutput) -> pd.DataFrame:
+    """Flatten processed Playwright results into one row per metric sample.
+
+    React profiler metrics (`<profile>__<phase>__<metric>`) are split into their
+    profile, phase and metric parts. All other metrics (e.g. long animation
+    frames or tracked metrics) keep their name as metric with an empty profile
+    and phase.
+    """
+    rows = [
+        (test_name, *_split_metric_key(metric_key), value)
+        for test_name, metrics in results.items()
+        for metric_key, values in metrics.items()
+        for value in values
+    ]
+    return pd.DataFrame(rows, columns=[*COMPARISON_KEYS, "value"])
+
+
+def phases_to_long_frame(phases: dict[str, Any], test_name: str = "") -> pd.DataFrame:
+    """Flatten the output of `get_phases_for_all_profiles()` into the long comparison format."""
+    rows = [
+        (test_name, profile, phase, metric, values[source_key])
+        for profile, profile_phases in phases.items()
+        for phase, values in profile_phases.items()
+        for metric, source_key in (("duration_ms", "actualDuration"), ("count", "count"))
+    ]
+    return pd.DataFrame(rows, columns=[*COMPARISON_KEYS, "value"])
+
+
+def _split_metric_key(metric_key: str) -> tuple[str, str, str]:
+    parts = metric_key.split("__")
+    if len(parts) == 3:
+        return parts[0], parts[1], parts[2]
+    return "", "", metric_key
+
+
+def compare_long_frames(baseline: pd.DataFrame, treatment: pd.DataFrame) -> pd.DataFrame:
+    """Compare two runs in the long comparison format with a single join.
+
+    Samples are averaged per (test, profile, phase, metric) on both sides, then
+    outer-joined so that metrics only present on one side are kept with a zero
+    value on the other side.
+
+    Returns:
+        A DataFrame with the comparison keys and the columns `baseline`,
+        `treatment`, `difference` and `difference_pct` (NaN if the baseline is 0).
+    """
+    baseline_means = baseline.groupby(COMPARISON_KEYS, sort=False)["value"].mean().rename("baseline")
+    treatment_means = treatment.groupby(COMPARISON_KEYS, sort=False)["value"].mean().rename("treatment")
+
+    comparison = pd.concat([baseline_means, treatment_means], axis=1, join="outer").fillna(0.0).reset_index()
+    comparison["difference"] = comparison["treatment"] - comparison["baseline"]
+    comparison["difference_pct"] = np.where(
+        comparison["baseline"] != 0,
+        comparison["difference"] / comparison["baseline"].where(comparison["baseline"] != 0, 1.0) * 100,
+        np.nan,
+    )
+    return comparison.sort_values(COMPARISON_KEYS, ignore_index=True)
+
+
+def compare_lighthouse_scores(pr_scores: Mapping[int, dict[str, float]], baseline: dict[str, float]) -> pd.DataFrame:
+    """Compare the Lighthouse scores of PRs against a baseline (e.g. develop) per app.
+
+    Scores are converted from 0..1 to 0..100.
+
+    Returns:
+        A DataFrame with the columns `pr`, `app_name`, `pr_score`, `baseline_score`
+        and `delta` (NaN if the app has no baseline score), one row per PR and app.
+    """
+    rows = [(pr, app_name, score) for pr, scores in pr_scores.items() for app_name, score in scores.items()]
+    comparison = pd.DataFrame(rows, columns=["pr", "app_name", "pr_score"])
+    comparison["pr_score"] *= 100
+    comparison["baseline_score"] = comparison["app_name"].map(baseline).astype(float) * 100
+    comparison["delta"] = comparison["pr_score"] - comparison["baseline_score"]
+    return comparison.sort_values(["pr", "app_name"], ignore_index=True)
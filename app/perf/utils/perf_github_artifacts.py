@@ -71,6 +71,27 @@ def get_commit_hashes_for_branch_name(
     return [commit["sha"] for commit in commits]
 
 
+def get_commit_hashes_between(base: str, head: str) -> list[str]:
+    """Get the commit hashes from `base` to `head` (both inclusive), ordered oldest to newest."""
+    url = f"https://api.github.com/repos/streamlit/streamlit/compare/{base}...{head}"
+    commits: list[dict[str, Any]] = []
+    page = 1
+    per_page = 100
+
+    while True:
+        response = requests.get(url, headers=get_headers(), params={"per_page": per_page, "page": page}, timeout=30)
+        response.raise_for_status()
+        payload = response.json()
+        page_commits = payload.get("commits", [])
+        commits.extend(page_commits)
+        if len(page_commits) < per_page or len(commits) >= payload.get("total_commits", 0):
+            break
+        page += 1
+
+    base_sha = payload.get("merge_base_commit", {}).get("sha") or base
+    return [base_sha, *(commit["sha"] for commit in commits)]
+
+
 def get_check_run_by_name(workflow_runs: list[dict[str, Any]], name: str) -> dict[str, Any] | None:
     return next((run for run in workflow_runs if run["name"] == name), None)
 
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Final, TypedDict
+
+import requests
+
+from app.utils.github_utils import fetch_artifacts, get_headers
+
+# Persistent sha -> "Performance Suite" run -> artifacts index. Develop runs are
+# listed in bulk (incrementally by creation date) instead of one request per commit.
+PERFORMANCE_WORKFLOW_NAME: Final[str] = "Performance Suite"
+RUN_INDEX_PATH: Final[Path] = Path(".cache/perf_runs/performance_suite_index.json")
+# GitHub deletes workflow artifacts after 90 days, older runs are useless.
+INITIAL_LOOKBACK_DAYS: Final[int] = 90
+# Minimum time between two refreshes of the run listing.
+REFRESH_INTERVAL_SECONDS: Final[int] = 10 * 60
+
+_API_BASE: Final[str] = "https://api.github.com/repos/streamlit/streamlit/actions"
+
+
+class IndexedArtifact(TypedDict):
+    name: str
+    archive_download_url: str
+    expired: bool
+
+
+class IndexedRun(TypedDict):
+    run_id: int
+    status: str
+    created_at: str
+    started_at: str
+    details_url: str
+    # None until the artifacts of the (completed) run were listed once.
+    artifacts: list[IndexedArtifact] | None
+
+
+class RunIndex(TypedDict):
+    workflow_id: int | None
+    runs: dict[str, IndexedRun]
+
+
+class _IndexState:
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.index: RunIndex | None = None
+        self.last_refresh = 0.0
+
+
+_state = _IndexState()
+
+
+def load_run_index(path: Path = RUN_INDEX_PATH) -> RunIndex:
+    """Load the persisted run index, or an empty index if there is none yet."""
+    if not path.exists():
+        return {"workflow_id": None, "runs": {}}
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"workflow_id": None, "runs": {}}
+
+
+def save_run_index(index: RunIndex, path: Path = RUN_INDEX_PATH) -> None:
+    """Persist the run index atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump(index, f)
+    tmp_path.replace(path)
+
+
+def _to_indexed_run(run: dict[str, Any]) -> IndexedRun:
+    return {
+        "run_id": run["id"],
+        "status": run["status"],
+        "created_at": run["created_at"],
+        "started_at": run.get("run_started_at") or run["created_at"],
+        "details_url": run["html_url"],
+        "artifacts": None,
+    }
+
+
+def merge_runs_into_index(index: RunIndex, runs: list[dict[str, Any]]) -> RunIndex:
+    """Add listed workflow runs to the index, keeping the most recent run per commit.
+
+    Artifacts that were already resolved for a run are kept.
+    """
+    for run in runs:
+        sha = run["head_sha"]
+        existing = index["runs"].get(sha)
+        if existing is not None and existing["run_id"] > run["id"]:
+            continue
+        indexed_run = _to_indexed_run(run)
+        if existing is not None and existing["run_id"] == run["id"] and existing["status"] == run["status"]:
+            indexed_run["artifacts"] = existing["artifacts"]
+        index["runs"][sha] = indexed_run
+    return index
+
+
+def get_refresh_since(index: RunIndex, now: datetime) -> str:
+    """Return the creation date from which runs need to be (re-)listed.
+
+    That's the newest indexed run, or the oldest run that wasn't completed yet
+    at the last refresh, whichever is older.
+    """
+    runs = index["runs"].values()
+    if not runs:
+        return (now - timedelta(days=INITIAL_LOOKBACK_DAYS)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    pending = [run["created_at"] for run in runs if run["status"] != "completed"]
+    newest = max(run["created_at"] for run in runs)
+    return min([*pending, newest])
+
+
+def _fetch_workflow_id(workflow_name: str) -> int | None:
+    response = requests.get(f"{_API_BASE}/workflows", headers=get_headers(), params={"per_page": 100}, timeout=30)
+    response.raise_for_status()
+    for workflow in response.json().get("workflows", []):
+        if workflow.get("name") == workflow_name:
+            return workflow["id"]
+    return None
+
+
+def _fetch_runs_created_since(workflow_id: int, since: str, branch: str = "develop") -> list[dict[str, Any]]:
+    runs: list[dict[str, Any]] = []
+    page = 1
+    per_page = 100
+    while True:
+        response = requests.get(
+            f"{_API_BASE}/workflows/{workflow_id}/runs",
+            headers=get_headers(),
+            params={"branch": branch, "created": f">={since}", "per_page": str(per_page), "page": str(page)},
+            timeout=30,
+        )
+        response.raise_for_status()
+        page_runs = response.json().get("workflow_runs", [])
+        runs.extend(page_runs)
+        if len(page_runs) < per_page:
+            break
+        page += 1
+    return runs
+
+
+def refresh_run_index(index: RunIndex, now: datetime | None = None) -> RunIndex:
+    """List new (or still pending) "Performance Suite" runs on develop and merge them into the index."""
+    if index["workflow_id"] is None:
+        index["workflow_id"] = _fetch_workflow_id(PERFORMANCE_WORKFLOW_NAME)
+    if index["workflow_id"] is None:
+        return index
+    since = get_refresh_since(index, now or datetime.now(UTC))
+    return merge_runs_into_index(index, _fetch_runs_created_since(index["workflow_id"], since))
+
+
+def _get_index() -> RunIndex:
+    if _state.index is None:
+        _state.index = load_run_index()
+    return _state.index
+
+
+def lookup_performance_run(commit_hash: str) -> IndexedRun | None:
+    """Resolve the "Performance Suite" run of a develop commit from the persistent index.
+
+    The run listing is refreshed at most every `REFRESH_INTERVAL_SECONDS` and only
+    if the commit isn't indexed yet (or its run wasn't completed). Returns None if
+    the commit has no indexed run, e.g. for PR commits or commits older than the
+    index, so callers can fall back to a per-commit lookup.
+    """
+    with _state.lock:
+        index = _get_index()
+        run = index["runs"].get(commit_hash)
+        if run is not None and run["status"] == "completed":
+            return run
+
+        if time.monotonic() - _state.last_refresh >= REFRESH_INTERVAL_SECONDS:
+            _state.last_refresh = time.monotonic()
+            try:
+                refresh_run_index(index)
+                save_run_index(index)
+            except requests.RequestException as ex:
+                print(f"Failed to refresh the performance run index: {ex}")
+
+        return index["runs"].get(commit_hash)
+
+
+def get_performance_run_artifacts(commit_hash: str, run: IndexedRun) -> list[IndexedArtifact]:
+    """Return the artifacts of an indexed run, listing and persisting them only once."""
+    if run["artifacts"] is not None:
+        return run["artifacts"]
+
+    artifacts: list[IndexedArtifact] = [
+        {
+            "name": artifact["name"],
+            "archive_download_url": artifact["archive_download_url"],
+            "expired": bool(artifact.get("expired")),
+        }
+        for artifact in fetch_artifacts(run["run_id"])
+    ]
+    if artifacts and run["status"] == "completed":
+        with _state.lock:
+            index = _get_index()
+            indexed_run = index["runs"].get(commit_hash)
+            if indexed_run is not None and indexed_run["run_id"] == run["run_id"]:
+                indexed_run["artifacts"] = artifacts
+                save_run_index(index)
+    return artifacts
@@ -14,14 +14,18 @@
 
 import json
 import pathlib
-from collections.abc import Iterable
-from typing import Any, TypedDict
+from collections.abc import Iterable, Iterator
+from typing import IO, Any, NamedTuple, TypedDict
+
+import numpy as np
+import numpy.typing as npt
 
 from app.perf.utils.types import (
     CalculatedPhases,
     CapturedTraces,
     LongAnimationFrame,
     Metric,
+    PhaseStatsByProfile,
     Profile,
 )
 
@@ -81,14 +85,15 @@ def calculate_phases_for_all_profiles(
 ) -> dict[str, CalculatedPhases]:
     """Calculate phases for all profiles from the given dictionary.
 
+    All profiles are aggregated in a single pass, see `aggregate_phase_stats()`.
+
     Args:
         file_as_dict (Dict[str, CapturedTraces]): A dictionary containing JSON data.
 
     Returns:
         Dict[str, CalculatedPhases]: A dictionary containing phases for all profiles.
     """
-    profile_names = get_all_profile_names(file_as_dict)
-    return {profile_name: calculate_phases(file_as_dict, profile_name) for profile_name in profile_names}
+    return to_calculated_phases(aggregate_phase_stats(get_profile_entries_table(file_as_dict)))
 
 
 def extract_react_profiles(file_as_dict: dict[str, Any], profile_name: str) -> dict[str, Any]:
@@ -142,10 +147,23 @@ def get_phases_for_all_profiles(file: dict[str, Any]) -> dict[str, Any]:
         file: A file-like object containing JSON data.
 
     Returns:
-        A dictionary containing phases for all profiles.
+        A dictionary containing phases for all profiles, including the p50 and
+        p95 of the entries' `actualDuration`.
     """
-    profile_names = get_all_profile_names(file)  # type: ignore[arg-type]
-    return {profile_name: get_phases(file, profile_name) for profile_name in profile_names}
+    phase_stats = aggregate_phase_stats(get_profile_entries_table(file))
+    return {
+        profile_name: {
+            phase: {
+                "actualDuration": stats["duration_ms"],
+                "baseDuration": stats["base_duration_ms"],
+                "count": stats["count"],
+                "p50ActualDuration": stats["p50_ms"],
+                "p95ActualDuration": stats["p95_ms"],
+            }
+            for phase, stats in phases.items()
+        }
+        for profile_name, phases in phase_stats.items()
+    }
 
 
 def sum_long_animation_frames(
@@ -202,6 +220,265 @@ def count_entries_per_phase(file_as_dict: dict[str, CapturedTraces], profile_nam
     return phase_counts
 
 
+class TraceAggregates(TypedDict):
+    phases: dict[str, CalculatedPhases]
+    first_mount_time: float | None
+    long_animation_frame_starts: list[float]
+    long_animation_frame_durations: list[float]
+    metrics: list[Metric]
+    raw: dict[str, Any] | None
+
+
+class ProfileEntriesTable(NamedTuple):
+    """Flat, columnar table of all React profiler entries of a trace.
+
+    Profiles and phases are dictionary-encoded: `profile_codes[i]` indexes into
+    `profile_names` and `phase_codes[i]` into `phase_names`. Missing start times
+    are stored as NaN.
+    """
+
+    profile_names: list[str]
+    phase_names: list[str]
+    profile_codes: npt.NDArray[np.intp]
+    phase_codes: npt.NDArray[np.intp]
+    actual_durations: npt.NDArray[np.float64]
+    base_durations: npt.NDArray[np.float64]
+    start_times: npt.NDArray[np.float64]
+
+
+class _ProfileEntryRecord(NamedTuple):
+    phase: str
+    actual_duration: float
+    base_duration: float
+    start_time: float | None
+
+
+class _FrameRecord(NamedTuple):
+    start_time: float
+    duration: float
+
+
+def _entry_record(entry: dict[str, Any]) -> _ProfileEntryRecord:
+    return _ProfileEntryRecord(
+        entry["phase"], entry["actualDuration"], entry.get("baseDuration", 0.0), entry.get("startTime")
+    )
+
+
+def build_profile_entries_table(
+    profile_entries: dict[str, list[_ProfileEntryRecord]],
+) -> ProfileEntriesTable:
+    """Build the columnar entries table from per-profile entry records.
+
+    Phase codes are assigned in order of first occurrence, so iterating the
+    aggregated phases keeps the order in which they appear in the trace.
+    """
+    profile_names = list(profile_entries)
+    phase_lookup: dict[str, int] = {}
+    records = [record for entries in profile_entries.values() for record in entries]
+
+    profile_codes = np.repeat(
+        np.arange(len(profile_names), dtype=np.intp),
+        [len(entries) for entries in profile_entries.values()],
+    )
+    phase_codes = np.fromiter(
+        (phase_lookup.setdefault(record.phase, len(phase_lookup)) for record in records),
+        dtype=np.intp,
+        count=len(records),
+    )
+    return ProfileEntriesTable(
+        profile_names=profile_names,
+        phase_names=list(phase_lookup),
+        profile_codes=profile_codes,
+        phase_codes=phase_codes,
+        actual_durations=np.fromiter((r.actual_duration for r in records), dtype=np.float64, count=len(records)),
+        base_durations=np.fromiter((r.base_duration for r in records), dtype=np.float64, count=len(records)),
+        start_times=np.fromiter(
+            (np.nan if r.start_time is None else r.start_time for r in records), dtype=np.float64, count=len(records)
+        ),
+    )
+
+
+def get_profile_entries_table(file_as_dict: dict[str, Any]) -> ProfileEntriesTable:
+    """Flatten the React profiler entries of all profiles in a parsed trace into one table."""
+    profiles = file_as_dict["capturedTraces"].get("profiles") or {}
+    return build_profile_entries_table(
+        {
+            profile_name: [_entry_record(entry) for entry in profile.get("entries", [])]
+            for profile_name, profile in profiles.items()
+        }
+    )
+
+
+def aggregate_phase_stats(table: ProfileEntriesTable) -> PhaseStatsByProfile:
+    """Compute duration sums, counts and p50/p95 durations for every profile and phase.
+
+    All profile x phase groups are computed in one vectorised pass over the
+    entries table instead of one Python loop per profile.
+
+    Args:
+        table (ProfileEntriesTable): The flattened profiler entries.
+
+    Returns:
+        PhaseStatsByProfile: Statistics per profile and phase. Profiles without
+            entries map to an empty dict.
+    """
+    result: PhaseStatsByProfile = {profile_name: {} for profile_name in table.profile_names}
+    num_entries = len(table.actual_durations)
+    if num_entries == 0:
+        return result
+
+    num_phases = len(table.phase_names)
+    group_keys = table.profile_codes * num_phases + table.phase_codes
+    num_groups = len(table.profile_names) * num_phases
+
+    counts = np.bincount(group_keys, minlength=num_groups)
+    duration_sums = np.bincount(group_keys, weights=table.actual_durations, minlength=num_groups)
+    base_duration_sums = np.bincount(group_keys, weights=table.base_durations, minlength=num_groups)
+    first_seen = np.full(num_groups, num_entries, dtype=np.intp)
+    np.minimum.at(first_seen, group_keys, np.arange(num_entries, dtype=np.intp))
+
+    # Sort durations within each group to read percentiles by position, using the
+    # same linear interpolation as `numpy.percentile`.
+    sorted_durations = table.actual_durations[np.lexsort((table.actual_durations, group_keys))]
+    group_starts = np.cumsum(counts) - counts
+    present = np.flatnonzero(counts)
+    # Order groups by profile, then by the first occurrence of the phase.
+    present = present[np.lexsort((first_seen[present], present // num_phases))]
+
+    def percentile(quantile: float) -> npt.NDArray[np.float64]:
+        positions = group_starts[present] + quantile * (counts[present] - 1)
+        lower = np.floor(positions).astype(np.intp)
+        upper = np.ceil(positions).astype(np.intp)
+        return sorted_durations[lower] + (sorted_durations[upper] - sorted_durations[lower]) * (positions - lower)
+
+    p50 = percentile(0.5)
+    p95 = percentile(0.95)
+
+    for idx, group in enumerate(present.tolist()):
+        profile_code, phase_code = divmod(group, num_phases)
+        result[table.profile_names[profile_code]][table.phase_names[phase_code]] = {
+            "duration_ms": float(duration_sums[group]),
+            "base_duration_ms": float(base_duration_sums[group]),
+            "count": int(counts[group]),
+            "p50_ms": float(p50[idx]),
+            "p95_ms": float(p95[idx]),
+        }
+
+    return result
+
+
+def to_calculated_phases(phase_stats: PhaseStatsByProfile) -> dict[str, CalculatedPhases]:
+    """Reduce phase statistics to the duration and count shape used by the runs pages."""
+    return {
+        profile_name: {
+            phase: {"duration_ms": stats["duration_ms"], "count": stats["count"]} for phase, stats in phases.items()
+        }
+        for profile_name, phases in phase_stats.items()
+    }
+
+
+def get_first_mount_time(table: ProfileEntriesTable) -> float | None:
+    """Return the earliest start time of any mount entry, or None if there is none."""
+    if "mount" not in table.phase_names:
+        return None
+    mount_start_times = table.start_times[table.phase_codes == table.phase_names.index("mount")]
+    mount_start_times = mount_start_times[~np.isnan(mount_start_times)]
+    return float(mount_start_times.min()) if mount_start_times.size else None
+
+
+def _aggregating_object_hook(obj: dict[str, Any]) -> Any:
+    """Reduce trace records to compact records while the JSON is being decoded.
+
+    The decoder calls this hook bottom-up for every JSON object, so profile entries
+    are reduced to small records before their profile is complete. Long animation
+    frames keep only their start time and duration, and all other trace entries
+    (marks, measures, paints, long tasks, scripts) are dropped. None of the raw
+    entry dicts survive the parse.
+    """
+    if "phase" in obj and "actualDuration" in obj:
+        return _entry_record(obj)
+    entry_type = obj.get("entryType")
+    if entry_type == "long-animation-frame":
+        return _FrameRecord(obj.get("startTime", 0), obj["duration"])
+    if entry_type is not None:
+        return None
+    return obj
+
+
+def _to_trace_aggregates(
+    profile_entries: dict[str, list[_ProfileEntryRecord]],
+    frames: list[_FrameRecord],
+    metrics: list[Metric],
+) -> TraceAggregates:
+    table = build_profile_entries_table(profile_entries)
+    return {
+        "phases": to_calculated_phases(aggregate_phase_stats(table)),
+        "first_mount_time": get_first_mount_time(table),
+        "long_animation_frame_starts": [frame.start_time for frame in frames],
+        "long_animation_frame_durations": [frame.duration for frame in frames],
+        "metrics": metrics,
+        "raw": None,
+    }
+
+
+def aggregate_trace(file_as_dict: dict[str, Any]) -> TraceAggregates:
+    """Compute the per-profile aggregates for an already parsed trace in a single pass."""
+    captured_traces = file_as_dict["capturedTraces"]
+    profile_entries = {
+        profile_name: [_entry_record(entry) for entry in profile.get("entries", [])]
+        for profile_name, profile in (captured_traces.get("profiles") or {}).items()
+    }
+    frames = [
+        _FrameRecord(frame.get("startTime", 0), frame["duration"])
+        for frame in captured_traces.get("long-animation-frame") or []
+    ]
+    return _to_trace_aggregates(profile_entries, frames, file_as_dict.get("metrics", []))
+
+
+def load_trace_aggregates(fp: IO[bytes] | IO[str], *, include_raw: bool = False) -> TraceAggregates:
+    """Parse a Playwright trace JSON file and compute its aggregates while parsing.
+
+    Unless `include_raw` is set, the raw trace entries are folded into per-phase
+    sums, counts and long animation frame timings as they are decoded, so peak
+    memory stays close to the size of the file instead of the size of the full
+    Python object tree.
+
+    Args:
+        fp: A binary or text file object containing the trace JSON.
+        include_raw: Also return the fully parsed JSON under the `raw` key.
+
+    Returns:
+        TraceAggregates: The aggregates of the trace.
+    """
+    if include_raw:
+        file_as_dict = json.load(fp)
+        aggregates = aggregate_trace(file_as_dict)
+        aggregates["raw"] = file_as_dict
+        return aggregates
+
+    folded = json.load(fp, object_hook=_aggregating_object_hook)
+    captured_traces = folded.get("capturedTraces") or {}
+    profile_entries = {
+        profile_name: [entry for entry in profile.get("entries", []) if isinstance(entry, _ProfileEntryRecord)]
+        for profile_name, profile in (captured_traces.get("profiles") or {}).items()
+    }
+    frames = [frame for frame in captured_traces.get("long-animation-frame") or [] if isinstance(frame, _FrameRecord)]
+    return _to_trace_aggregates(profile_entries, frames, folded.get("metrics", []))
+
+
+def sum_long_animation_frames_from_aggregates(
+    aggregates: TraceAggregates, first_mount_time: float | None = None
+) -> float:
+    """Aggregate variant of `sum_long_animation_frames()`."""
+    return sum(
+        duration
+        for start_time, duration in zip(
+            aggregates["long_animation_frame_starts"], aggregates["long_animation_frame_durations"], strict=True
+        )
+        if first_mount_time is None or start_time >= first_mount_time
+    )
+
+
 class LoadFilesOutput(TypedDict):
     filenames: list[str]
     all_phases: list[dict[str, CalculatedPhases]]
@@ -210,13 +487,13 @@ class LoadFilesOutput(TypedDict):
     first_mount_time: float | None
 
 
-def load_files_from_dicts(
-    files: Iterable[tuple[str, dict[str, Any]]],
+def load_files_from_aggregates(
+    files: Iterable[tuple[str, TraceAggregates]],
 ) -> LoadFilesOutput:
-    """In-memory variant of `load_files()`.
+    """Aggregate variant of `load_files()`.
 
-    This accepts already-parsed JSON dicts (e.g. from an artifact zip) and returns
-    the same output shape as `load_files()`, without any filesystem access.
+    Accepts per-file aggregates (see `load_trace_aggregates()`) and returns the
+    same output shape as `load_files()`.
     """
     filenames: list[str] = []
     all_phases: list[dict[str, CalculatedPhases]] = []
@@ -224,25 +501,17 @@ def load_files_from_dicts(
     first_mount_time: float | None = None
     all_metrics: list[list[Metric]] = []
 
-    for filename, file_content in files:
-        phases = calculate_phases_for_all_profiles(file_content)
-
+    for filename, aggregates in files:
         # Find first mount time before calculating animation frames
-        profiles = file_content["capturedTraces"].get("profiles", {})
-        for profile_data in profiles.values():
-            for entry in profile_data.get("entries", []):
-                if entry["phase"] == "mount":
-                    entry_time = entry.get("startTime", None)
-                    if entry_time is not None and (first_mount_time is None or entry_time < first_mount_time):
-                        first_mount_time = entry_time
-
-        # Now sum animation frames with the mount time filter
-        long_animation_frames_sum = sum_long_animation_frames(file_content, first_mount_time)
+        file_first_mount_time = aggregates["first_mount_time"]
+        if file_first_mount_time is not None and (first_mount_time is None or file_first_mount_time < first_mount_time):
+            first_mount_time = file_first_mount_time
 
         filenames.append(filename)
-        all_phases.append(phases)
-        all_metrics.append(file_content.get("metrics", []))
-        all_long_animation_frames.append(long_animation_frames_sum)
+        all_phases.append(aggregates["phases"])
+        all_metrics.append(aggregates["metrics"])
+        # Now sum animation frames with the mount time filter
+        all_long_animation_frames.append(sum_long_animation_frames_from_aggregates(aggregates, first_mount_time))
 
     return {
         "filenames": filenames,
@@ -253,6 +522,17 @@ def load_files_from_dicts(
     }
 
 
+def load_files_from_dicts(
+    files: Iterable[tuple[str, dict[str, Any]]],
+) -> LoadFilesOutput:
+    """In-memory variant of `load_files()`.
+
+    This accepts already-parsed JSON dicts (e.g. from an artifact zip) and returns
+    the same output shape as `load_files()`, without any filesystem access.
+    """
+    return load_files_from_aggregates((filename, aggregate_trace(file_content)) for filename, file_content in files)
+
+
 def load_files(
     directory_path: str,
 ) -> LoadFilesOutput:
@@ -263,6 +543,9 @@ def load_files(
     Animation frames before the first mount are typically artifacts from
     Chrome DevTools Protocol initialization and not related to actual app performance.
 
+    Each file is aggregated while it is parsed (see `load_trace_aggregates()`),
+    so the raw trace entries are never held in memory.
+
     Args:
         directory_path (str): The path to the directory containing the files.
 
@@ -278,40 +561,10 @@ def load_files(
         msg = f"The directory {directory_path} does not exist."
         raise FileNotFoundError(msg)
 
-    filenames = []
-    all_phases = []
-    all_long_animation_frames = []
-    first_mount_time = None
-    all_metrics = []
-
-    for file_path in pathlib.Path(directory_path).iterdir():
-        if file_path.is_file() and file_path.name.endswith("json"):
-            with file_path.open("r", encoding="utf-8") as file:
-                file_content = json.load(file)
-
-            phases = calculate_phases_for_all_profiles(file_content)
+    def iter_aggregates() -> Iterator[tuple[str, TraceAggregates]]:
+        for file_path in pathlib.Path(directory_path).iterdir():
+            if file_path.is_file() and file_path.name.endswith("json"):
+                with file_path.open("rb") as file:
+                    yield file_path.name, load_trace_aggregates(file)
 
-            # Find first mount time before calculating animation frames
-            profiles = file_content["capturedTraces"].get("profiles", {})
-            for profile_data in profiles.values():
-                for entry in profile_data.get("entries", []):
-                    if entry["phase"] == "mount":
-                        entry_time = entry.get("startTime", None)
-                        if entry_time is not None and (first_mount_time is None or entry_time < first_mount_time):
-                            first_mount_time = entry_time
-
-            # Now sum animation frames with the mount time filter
-            long_animation_frames_sum = sum_long_animation_frames(file_content, first_mount_time)
-
-            filenames.append(file_path.name)
-            all_phases.append(phases)
-            all_metrics.append(file_content["metrics"])
-            all_long_animation_frames.append(long_animation_frames_sum)
-
-    return {
-        "filenames": filenames,
-        "all_phases": all_phases,
-        "all_long_animation_frames": all_long_animation_frames,
-        "first_mount_time": first_mount_time,
-        "all_metrics": all_metrics,
-    }
+    return load_files_from_aggregates(iter_aggregates())
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from app.perf.utils.pytest_types import MachineInfo, OutputJson
+
+SUMMARY_STATS: Final[tuple[str, ...]] = ("min", "max", "mean", "stddev", "median", "iqr", "q1", "q3", "iterations")
+SAMPLE_QUANTILES: Final[dict[str, float]] = {"p5": 0.05, "q1": 0.25, "median": 0.5, "q3": 0.75, "p95": 0.95}
+# Summary stats that are durations and scale with the speed of the runner.
+TIME_STATS: Final[tuple[str, ...]] = ("min", "max", "mean", "stddev", "median", "iqr", "q1", "q3")
+UNKNOWN_FINGERPRINT: Final[str] = "unknown runner"
+
+
+class BenchmarkRunTable(NamedTuple):
+    """Columnar form of one pytest-benchmark output file.
+
+    `summary` maps every stat in `SUMMARY_STATS` to an array aligned with
+    `test_names`. The raw per-round samples of all tests are concatenated into
+    `sample_values` as float32; the samples of test `i` are
+    `sample_values[sample_offsets[i]:sample_offsets[i + 1]]` (empty if the run
+    didn't save raw data).
+    """
+
+    test_names: list[str]
+    summary: dict[str, npt.NDArray[np.float64]]
+    sample_offsets: npt.NDArray[np.int64]
+    sample_values: npt.NDArray[np.float32]
+    fingerprint: str
+
+
+class BenchmarkRun(NamedTuple):
+    timestamp: str
+    commit_hash: str
+    table: BenchmarkRunTable
+
+
+def machine_fingerprint(machine_info: MachineInfo | None) -> str:
+    """Identify the kind of runner a benchmark ran on by CPU model, core count and Python version.
+
+    Hostnames and other per-machine details are left out on purpose, so runs from
+    different runners of the same SKU share a fingerprint.
+    """
+    if not machine_info:
+        return UNKNOWN_FINGERPRINT
+    cpu = machine_info.get("cpu") or {}
+    brand = cpu.get("brand_raw") or machine_info.get("processor") or machine_info.get("machine") or "unknown CPU"
+    cores = f"{cpu['count']} cores" if cpu.get("count") else "unknown cores"
+    python = f"{machine_info.get('python_implementation', 'Python')} {machine_info.get('python_version', '')}".strip()
+    return f"{brand.strip()} · {cores} · {python}"
+
+
+def build_benchmark_run_table(output: OutputJson) -> BenchmarkRunTable:
+    """Convert a parsed pytest-benchmark JSON file into its columnar form."""
+    benchmarks = output["benchmarks"]
+    samples = [np.asarray(benchmark["stats"].get("data", ()), dtype=np.float32) for benchmark in benchmarks]
+    sample_offsets = np.zeros(len(benchmarks) + 1, dtype=np.int64)
+    np.cumsum([len(test_samples) for test_samples in samples], out=sample_offsets[1:])
+    return BenchmarkRunTable(
+        test_names=[benchmark["name"] for benchmark in benchmarks],
+        summary={
+            stat: np.fromiter(
+                (benchmark["stats"][stat] for benchmark in benchmarks),  # type: ignore[literal-required]
+                dtype=np.float64,
+                count=len(benchmarks),
+            )
+            for stat in SUMMARY_STATS
+        },
+        sample_offsets=sample_offsets,
+        sample_values=np.concatenate(samples) if samples else np.empty(0, dtype=np.float32),
+        fingerprint=machine_fingerprint(output.get("machine_info")),
+    )
+
+
+def _concatenate[T: np.generic](arrays: list[npt.NDArray[T]], dtype: type[T]) -> npt.NDArray[T]:
+    return np.concatenate(arrays).astype(dtype, copy=False) if arrays else np.empty(0, dtype=dtype)
+
+
+def benchmark_summary_frame(runs: Sequence[BenchmarkRun]) -> pd.DataFrame:
+    """Build one row per run and test with the summary stats of pytest-benchmark.
+
+    `runs` are expected in chronological order; their position becomes the
+    `run_index` column. `test_name` is categorical so that grouping by test is cheap.
+    """
+    test_counts = [len(run.table.test_names) for run in runs]
+    frame = pd.DataFrame(
+        {
+            "test_name": pd.Categorical([name for run in runs for name in run.table.test_names]),
+            "run_index": np.repeat(np.arange(len(runs), dtype=np.int32), test_counts),
+            "timestamp": np.repeat([run.timestamp for run in runs], test_counts),
+            "commit_hash": np.repeat([run.commit_hash[:7] for run in runs], test_counts),
+            "commit_sha_full": np.repeat([run.commit_hash for run in runs], test_counts),
+            "fingerprint": pd.Categorical(np.repeat([run.table.fingerprint for run in runs], test_counts)),
+        }
+    )
+    for stat in SUMMARY_STATS:
+        frame[stat] = _concatenate([run.table.summary[stat] for run in runs], np.float64)
+    return frame
+
+
+def benchmark_samples_frame(runs: Sequence[BenchmarkRun]) -> pd.DataFrame:
+    """Build one row per raw sample with the columns `test_name`, `run_index` and `value` (float32)."""
+    test_names = [name for run in runs for name in run.table.test_names]
+    samples_per_test = _concatenate([np.diff(run.table.sample_offsets) for run in runs], np.int64)
+    samples_per_run = [len(run.table.sample_values) for run in runs]
+    return pd.DataFrame(
+        {
+            "test_name": pd.Categorical(np.repeat(np.asarray(test_names, dtype=object), samples_per_test)),
+            "run_index": np.repeat(np.arange(len(runs), dtype=np.int32), samples_per_run),
+            "value": _concatenate([run.table.sample_values for run in runs], np.float32),
+        }
+    )
+
+
+def sample_quantiles(samples: pd.DataFrame) -> pd.DataFrame:
+    """Compute the sample count and `SAMPLE_QUANTILES` for every test and run in one group-by.
+
+    Returns:
+        A DataFrame with the columns `test_name`, `run_index`, `samples` and one
+        column per entry of `SAMPLE_QUANTILES`.
+    """
+    grouped = samples.groupby(["test_name", "run_index"], observed=True, sort=True)["value"]
+    quantiles = pd.DataFrame({"samples": grouped.size()})
+    for name, quantile in SAMPLE_QUANTILES.items():
+        quantiles[name] = grouped.quantile(quantile)
+    return quantiles.reset_index()
+
+
+def calibration_factors(summary: pd.DataFrame, calibration_test: str, stat: str = "median") -> pd.Series:
+    """Return the value of the calibration benchmark per run, indexed by `run_index`.
+
+    Dividing the time stats of a run by its factor expresses them in multiples of
+    the calibration benchmark, which cancels out most of the speed difference
+    between runner SKUs. Runs without a positive calibration value are left out.
+    """
+    calibration = summary.loc[summary["test_name"] == calibration_test, ["run_index", stat]]
+    calibration = calibration[calibration[stat] > 0]
+    return calibration.set_index("run_index")[stat]
+
+
+def rescale_by_calibration(frame: pd.DataFrame, factors: pd.Series, columns: Sequence[str]) -> pd.DataFrame:
+    """Divide `columns` of every row by the calibration factor of its run.
+
+    Rows of runs without a calibration factor are dropped.
+    """
+    run_factors = frame["run_index"].map(factors)
+    rescaled = frame[run_factors.notna()].copy()
+    rescaled[list(columns)] = rescaled[list(columns)].div(run_factors[run_factors.notna()], axis=0)
+    return rescaled
+
+
+def compare_latest_by_fingerprint(summary: pd.DataFrame, stat: str = "median") -> pd.DataFrame:
+    """Compare the latest run of every test against earlier runs on the same kind of runner.
+
+    The baseline is the median of `stat` over all earlier runs that share the
+    fingerprint of the latest run, so a switch of runner SKU doesn't show up as a
+    regression.
+
+    Returns:
+        A DataFrame with the columns `test_name`, `fingerprint`, `latest`,
+        `baseline`, `baseline_runs` and `change_pct`. Tests without earlier runs on
+        the same runner have a NaN baseline and change.
+    """
+    latest = summary.loc[
+        summary.groupby("test_name", observed=True)["run_index"].idxmax(),
+        ["test_name", "fingerprint", "run_index", stat],
+    ].rename(columns={"run_index": "latest_run_index", stat: "latest"})
+
+    history = summary.merge(latest[["test_name", "fingerprint", "latest_run_index"]], on=["test_name", "fingerprint"])
+    history = history[history["run_index"] < history["latest_run_index"]]
+    baseline = history.groupby("test_name", observed=True)[stat].agg(baseline="median", baseline_runs="size")
+
+    comparison = latest.drop(columns="latest_run_index").join(baseline, on="test_name")
+    comparison["baseline_runs"] = comparison["baseline_runs"].fillna(0).astype(int)
+    comparison["change_pct"] = (comparison["latest"] - comparison["baseline"]) / comparison["baseline"] * 100
+    return comparison.sort_values("test_name", ignore_index=True)
@@ -1,4 +1,4 @@
-from typing import Any, TypedDict
+from typing import Any, NotRequired, TypedDict
 
 """
 These types represent the structure of the outputted .json file that is
@@ -82,6 +82,8 @@ class BenchmarkStats(TypedDict):
     ops: float
     total: float
     iterations: int
+    # Per-round timings, only present if the benchmarks ran with `--benchmark-save-data`.
+    data: NotRequired[list[float]]
 
 
 class PytestBenchmarkRun(TypedDict):
@@ -19,7 +19,13 @@ from typing import Any, TypedDict
 
 from scipy import stats
 
-from app.perf.utils.perf_traces import LoadFilesOutput, load_files, load_files_from_dicts
+from app.perf.utils.perf_traces import (
+    LoadFilesOutput,
+    TraceAggregates,
+    load_files,
+    load_files_from_aggregates,
+    load_files_from_dicts,
+)
 from app.perf.utils.test_run_utils import get_stable_test_name
 from app.perf.utils.types import CalculatedPhases
 
@@ -98,6 +104,14 @@ def process_test_results_files(
     return process_test_results_load_files_output(load_files_output, load_all_metrics=load_all_metrics)
 
 
+def process_test_results_aggregates(
+    files: Iterable[tuple[str, TraceAggregates]], load_all_metrics: bool = False
+) -> ProcessTestDirectoryOutput:
+    """Variant of `process_test_results_files()` for traces aggregated while parsing."""
+    load_files_output = load_files_from_aggregates(files)
+    return process_test_results_load_files_output(load_files_output, load_all_metrics=load_all_metrics)
+
+
 def process_test_results_load_files_output(
     load_files_output: LoadFilesOutput, *, load_all_metrics: bool = False
 ) -> ProcessTestDirectoryOutput:
@@ -40,6 +40,18 @@ class CalculatedPhase(TypedDict):
 CalculatedPhases = dict[str, CalculatedPhase]
 
 
+class PhaseStats(TypedDict):
+    duration_ms: float
+    base_duration_ms: float
+    count: int
+    p50_ms: float
+    p95_ms: float
+
+
+# Profile name -> phase -> statistics of the entries' `actualDuration`.
+PhaseStatsByProfile = dict[str, dict[str, PhaseStats]]
+
+
 # region JSON file types
 # These types are used to represent the structure of the JSON file that is
 # generated by the performance tracing in our Playwright tests. They utilize
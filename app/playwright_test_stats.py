@@ -15,6 +15,7 @@ from app.utils.github_utils import (
     fetch_artifacts,
     fetch_workflow_runs,
 )
+from app.utils.workflow_metrics import PLAYWRIGHT_TEST_COUNT, record_run_metrics
 
 st.set_page_config(page_title="Playwright test stats", page_icon="🎭", layout="wide")
 
@@ -166,6 +167,7 @@ with st.spinner("Fetching data..."):
 
     df = pd.DataFrame(records)
     df = df.sort_values("created_at")
+    record_run_metrics("playwright.yml", df, {PLAYWRIGHT_TEST_COUNT: "total_tests"})
 
 # ── Top-level metrics ────────────────────────────────────────────────────────
 
@@ -1,5 +1,4 @@
 import json
-import pathlib
 from datetime import datetime, timedelta
 from io import BytesIO
 from typing import Any
@@ -11,15 +10,31 @@ import plotly.graph_objects as go
 import streamlit as st
 import streamlit.components.v1 as components
 
-from app.utils.coverage_parsers import parse_vitest_coverage_payload
+from app.utils.coverage_history import (
+    FRONTEND_COVERAGE_HISTORY_PATH,
+    display_coverage_decay,
+    file_history_frame,
+    load_coverage_history,
+    record_coverage_runs,
+)
+from app.utils.coverage_parsers import (
+    find_coverage_summary_json,
+    parse_istanbul_coverage_final,
+    parse_vitest_coverage_payload,
+)
+from app.utils.coverage_rollup import coverage_rollup_figure, display_coverage_tree, rollup_coverage
 from app.utils.github_utils import (
     download_artifact,
     fetch_artifacts,
     fetch_pr_info,
+    fetch_pull_request_files_payload,
     fetch_workflow_runs,
     fetch_workflow_runs_for_commit,
 )
-from app.utils.smokeshow import extract_and_upload_coverage_report
+from app.utils.patch_coverage import display_patch_coverage
+from app.utils.report_server import serve_coverage_report, serve_reports_locally_toggle
+from app.utils.smokeshow import upload_coverage_report
+from app.utils.workflow_metrics import FRONTEND_COVERAGE, record_run_metrics
 
 # Set page configuration
 st.set_page_config(page_title="Frontend test coverage", page_icon="☂️", layout="wide")
@@ -49,8 +64,8 @@ def deploy_coverage_report(run_id: int) -> str | None:
         st.error("Failed to download the HTML coverage report.")
         return None
 
-    # Extract and upload to smokeshow
-    return extract_and_upload_coverage_report(artifact_content)
+    # Upload to smokeshow
+    return upload_coverage_report(artifact_content)
 
 
 # Function to download, extract, upload and display the HTML coverage report
@@ -59,7 +74,11 @@ def display_coverage_report_dialog(run_id: int) -> None:
     """Download, extract, upload and display the HTML coverage report in an iframe."""
     # Download the artifact
     with st.spinner("Downloading and deploying the coverage report..."):
-        report_url = deploy_coverage_report(run_id)
+        report_url = (
+            serve_coverage_report(run_id, "vitest_coverage_html")
+            if serve_reports_locally
+            else deploy_coverage_report(run_id)
+        )
         if not report_url:
             st.error("Failed to deploy the HTML coverage report.")
             return
@@ -124,6 +143,8 @@ else:
     else:
         since_date = None
 
+serve_reports_locally = serve_reports_locally_toggle()
+
 
 def parse_vitest_coverage_json(coverage_file: Any) -> tuple[dict, dict] | tuple[None, None]:
     """Parse a Vitest JSON summary report file and return the data."""
@@ -138,6 +159,31 @@ def parse_vitest_coverage_json(coverage_file: Any) -> tuple[dict, dict] | tuple[
         return None, None
 
 
+@st.cache_data(show_spinner=False)
+def get_line_coverage_from_artifact(run_id: int) -> dict[str, dict[str, Any]] | None:
+    """Get per-line coverage from the Istanbul detail report (`coverage-final.json`) of a workflow run."""
+    artifacts = fetch_artifacts(run_id)
+    coverage_json_artifact = next((a for a in artifacts if a["name"] == "vitest_coverage_json"), None)
+    if not coverage_json_artifact:
+        return None
+
+    artifact_content = download_artifact(coverage_json_artifact["archive_download_url"])
+    if not artifact_content:
+        return None
+
+    try:
+        with ZipFile(BytesIO(artifact_content)) as zip_file:
+            detail_file = next((f for f in zip_file.namelist() if f.endswith("coverage-final.json")), None)
+            if not detail_file:
+                return None
+            with zip_file.open(detail_file) as coverage_file:
+                return parse_istanbul_coverage_final(coverage_file)
+    except Exception as e:
+        st.error(f"Error extracting line coverage data: {e}")
+
+    return None
+
+
 @st.cache_data(show_spinner=False)
 def get_coverage_data_from_artifact(run_id: int) -> dict[str, Any] | None:
     """Get coverage data from the artifact of a workflow run."""
@@ -163,11 +209,11 @@ def get_coverage_data_from_artifact(run_id: int) -> dict[str, Any] | None:
         with ZipFile(BytesIO(artifact_content)) as zip_file:
             file_list = zip_file.namelist()
             # Find a JSON file that contains coverage data
-            json_file = next((f for f in file_list if f.endswith(".json")), None)
+            json_file = find_coverage_summary_json(file_list)
 
             if json_file:
                 with zip_file.open(json_file) as coverage_file:
-                    _, total_data = parse_vitest_coverage_json(coverage_file)
+                    file_data, total_data = parse_vitest_coverage_json(coverage_file)
                     if total_data:
                         # Return key metrics from the total data
                         return {
@@ -180,6 +226,10 @@ def get_coverage_data_from_artifact(run_id: int) -> dict[str, Any] | None:
                             "branches_total": total_data["branches"]["total"],
                             "branches_covered": total_data["branches"]["covered"],
                             "branches_pct": total_data["branches"]["pct"],
+                            "file_stats": {
+                                file_path: (file_info["lines_total"], file_info["lines_covered"])
+                                for file_path, file_info in (file_data or {}).items()
+                            },
                         }
     except Exception as e:
         st.error(f"Error extracting coverage data: {e}")
@@ -303,65 +353,36 @@ def display_coverage_details(
         )
         st.plotly_chart(fig_branches, width="stretch")
 
-    # Display file-level coverage
+    # Display file-level coverage, one directory at a time
     st.header("File Coverage Details")
+    st.caption(":material/keyboard_arrow_down: Select a directory to open it, or a file to view its coverage.")
 
-    # Sort by coverage percentage (ascending)
-    coverage_df = coverage_df.sort_values("Lines Coverage %", ascending=False)
+    rollup_df = rollup_coverage(coverage_df["Path"].tolist(), coverage_df["Lines Total"], coverage_df["Lines Covered"])
+    selected_file_path = display_coverage_tree(rollup_df, key="file_coverage_tree", stmts_label="Lines")
 
-    # Create GitHub links for the Path column
-    coverage_df["File"] = coverage_df["Path"].apply(
-        lambda x: f"https://github.com/streamlit/streamlit/tree/develop/frontend/{x}"
-    )
-
-    # Display the dataframe with coverage information and GitHub links
-    st.dataframe(
-        coverage_df,
-        column_config={
-            "Lines Coverage %": st.column_config.ProgressColumn(
-                "Lines Coverage %",
-                help="Percentage of lines covered by tests",
-                format="%d%%",
-                min_value=0,
-                max_value=100,
-            ),
-            "Functions Coverage %": st.column_config.ProgressColumn(
-                "Functions Coverage %",
-                help="Percentage of functions covered by tests",
-                format="%d%%",
-                min_value=0,
-                max_value=100,
-            ),
-            "Branches Coverage %": st.column_config.ProgressColumn(
-                "Branches Coverage %",
-                help="Percentage of branches covered by tests",
-                format="%d%%",
-                min_value=0,
-                max_value=100,
-            ),
-            "Lines Uncovered": st.column_config.NumberColumn("Lines Uncovered"),
-            "File": st.column_config.LinkColumn(
-                "File",
-                help="View file in GitHub repository",
-                display_text="https://github.com/streamlit/streamlit/tree/develop/frontend/(.*)",
-                pinned=True,
-            ),
-        },
-        hide_index=True,
-        column_order=[
-            "File",
-            "Lines Covered",
-            "Lines Uncovered",
-            "Lines Total",
-            "Lines Coverage %",
-            "Functions Covered",
-            "Functions Total",
-            "Functions Coverage %",
-            "Branches Covered",
-            "Branches Total",
-            "Branches Coverage %",
-        ],
-    )
+    # Show the function and branch coverage of the selected file, which the rollup doesn't aggregate
+    if selected_file_path:
+        selected_file = coverage_data[selected_file_path]
+        col1, col2, col3 = st.columns(3)
+        col1.metric(
+            "Lines Coverage",
+            f"{selected_file['lines_pct']:.2f}%",
+            help=f"{selected_file['lines_covered']} of {selected_file['lines_total']} lines",
+        )
+        col2.metric(
+            "Functions Coverage",
+            f"{selected_file['functions_pct']:.2f}%",
+            help=f"{selected_file['functions_covered']} of {selected_file['functions_total']} functions",
+        )
+        col3.metric(
+            "Branches Coverage",
+            f"{selected_file['branches_pct']:.2f}%",
+            help=f"{selected_file['branches_covered']} of {selected_file['branches_total']} branches",
+        )
+        st.link_button(
+            f":material/open_in_new: View {selected_file['file_name']} on GitHub",
+            f"https://github.com/streamlit/streamlit/tree/develop/frontend/{selected_file_path}",
+        )
 
     col1, col2 = st.columns(2)
     # Add HTML report download button if URL is available
@@ -376,31 +397,9 @@ def display_coverage_details(
 
     # Create visualizations for file coverage
     if len(coverage_df) > 0:
-        # Create a treemap visualization
+        # Create a treemap visualization of the directories
         st.subheader("Coverage Treemap")
-
-        # Extract package (top-level directory) and directory structure
-        coverage_df["Package"] = coverage_df["Path"].apply(lambda x: x.split("/")[0] if "/" in x else "root")
-
-        # Extract directory structure (last directory component)
-        coverage_df["Directory"] = coverage_df["Path"].apply(lambda x: pathlib.Path(x).parent.name or "root")
-
-        fig = px.treemap(
-            coverage_df,
-            path=["Package", "Directory", "Filename"],
-            values="Lines Total",
-            color="Lines Coverage %",
-            color_continuous_scale=["red", "orange", "green"],
-            range_color=[0, 100],
-            hover_data=[
-                "Lines Covered",
-                "Lines Total",
-                "Functions Coverage %",
-                "Branches Coverage %",
-            ],
-        )
-
-        st.plotly_chart(fig, width="stretch")
+        st.plotly_chart(coverage_rollup_figure(rollup_df), width="stretch")
 
         st.subheader("Coverage by File")
 
@@ -530,7 +529,9 @@ def get_pr_coverage(pr_info: dict[str, Any]) -> dict[str, Any] | None:
     }
 
 
-def display_pr_coverage_comparison(pr_coverage: dict[str, Any], develop_coverage: dict[str, Any]) -> None:
+def display_pr_coverage_comparison(
+    pr_coverage: dict[str, Any], develop_coverage: dict[str, Any], pr_number: int
+) -> None:
     """Display a comparison of PR coverage against develop branch coverage."""
     st.subheader("PR Coverage Comparison")
 
@@ -606,6 +607,26 @@ def display_pr_coverage_comparison(pr_coverage: dict[str, Any], develop_coverage
             if st.button(":material/preview: View Develop Report", width="stretch"):
                 display_coverage_report_dialog(develop_coverage["run_id"])
 
+    display_frontend_patch_coverage(pr_number, pr_coverage["run_id"])
+
+
+def display_frontend_patch_coverage(pr_number: int, run_id: int) -> None:
+    """Display the patch coverage of the PR based on the line coverage of its coverage artifact."""
+    with st.spinner("Fetching line coverage data..."):
+        line_coverage = get_line_coverage_from_artifact(run_id)
+    if not line_coverage:
+        st.subheader("Patch Coverage")
+        st.info(
+            "The coverage artifact of this run has no line coverage (`coverage-final.json` of the Vitest `json` "
+            "reporter), so the patch coverage isn't available."
+        )
+        return
+
+    pr_files, error = fetch_pull_request_files_payload("streamlit/streamlit", pr_number)
+    if error:
+        st.warning(f"Could only fetch some of the changed files of the PR: {error}")
+    display_patch_coverage(pr_files, line_coverage, path_prefix="frontend/")
+
 
 # PR mode processing
 if pr_number is not None:
@@ -624,7 +645,7 @@ if pr_number is not None:
 
         if pr_coverage and develop_coverage:
             # Display the comparison
-            display_pr_coverage_comparison(pr_coverage, develop_coverage)
+            display_pr_coverage_comparison(pr_coverage, develop_coverage, int(pr_number))
             # Stop execution to not show the regular app content
             st.stop()
         else:
@@ -658,6 +679,9 @@ with st.spinner("Fetching data..."):
 
     # Process the data
     coverage_history = []
+    file_history = load_coverage_history(FRONTEND_COVERAGE_HISTORY_PATH)
+    recorded_run_ids = set(file_history["run_id"].unique())
+    new_file_history = []
     progress_bar = st.progress(0)
     status_text = st.empty()
 
@@ -670,12 +694,15 @@ with st.spinner("Fetching data..."):
         coverage_data = get_coverage_data_from_artifact(run["id"])
 
         if coverage_data:
+            created_at = datetime.strptime(run["created_at"], "%Y-%m-%dT%H:%M:%SZ")
+            if run["id"] not in recorded_run_ids:
+                new_file_history.append(file_history_frame(run["id"], created_at, coverage_data["file_stats"]))
             coverage_history.append(
                 {
                     "run_id": run["id"],
                     "commit_sha": run["head_sha"][:7],
                     "commit_url": f"https://github.com/streamlit/streamlit/commit/{run['head_sha']}",
-                    "created_at": datetime.strptime(run["created_at"], "%Y-%m-%dT%H:%M:%SZ"),
+                    "created_at": created_at,
                     "lines_pct": coverage_data["lines_pct"],
                     "functions_pct": coverage_data["functions_pct"],
                     "branches_pct": coverage_data["branches_pct"],
@@ -692,10 +719,14 @@ with st.spinner("Fetching data..."):
     progress_bar.empty()
     status_text.empty()
 
+    if new_file_history:
+        file_history = record_coverage_runs(new_file_history, FRONTEND_COVERAGE_HISTORY_PATH)
+
     # Create DataFrame
     if coverage_history:
         df = pd.DataFrame(coverage_history)
         df = df.sort_values("created_at")
+        record_run_metrics("js-tests.yml", df, {FRONTEND_COVERAGE: "lines_pct"})
     else:
         st.warning("No coverage data found in the workflow runs.")
         st.stop()
@@ -831,6 +862,10 @@ fig_metrics.update_layout(
 
 st.plotly_chart(fig_metrics, width="stretch", theme="streamlit")
 
+display_coverage_decay(
+    file_history, df, coverage_label="Lines Coverage", stmts_label="Lines", missed_label="Missed Lines"
+)
+
 # Create a table with the data
 st.subheader("Coverage History")
 
@@ -949,7 +984,7 @@ if df_selection["selection"]["rows"]:
                 with ZipFile(BytesIO(artifact_content)) as zip_file:
                     file_list = zip_file.namelist()
                     # Find a JSON file that contains coverage data
-                    json_file = next((f for f in file_list if f.endswith(".json")), None)
+                    json_file = find_coverage_summary_json(file_list)
 
                     if json_file:
                         with zip_file.open(json_file) as coverage_file:
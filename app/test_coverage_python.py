@@ -1,5 +1,4 @@
 import json
-import pathlib
 from datetime import datetime, timedelta
 from io import BytesIO
 from typing import Any
@@ -11,15 +10,32 @@ import plotly.graph_objects as go
 import streamlit as st
 import streamlit.components.v1 as components
 
-from app.utils.coverage_parsers import extract_python_coverage_summary, parse_python_coverage_payload
+from app.utils.coverage_history import (
+    PYTHON_COVERAGE_HISTORY_PATH,
+    display_coverage_decay,
+    file_history_frame,
+    load_coverage_history,
+    record_coverage_runs,
+)
+from app.utils.coverage_parsers import (
+    compare_python_coverage,
+    parse_python_coverage_payload,
+    read_python_coverage_summaries,
+    summarize_python_coverage_totals,
+)
+from app.utils.coverage_rollup import coverage_rollup_figure, display_coverage_tree, rollup_coverage
 from app.utils.github_utils import (
     download_artifact,
     fetch_artifacts,
     fetch_pr_info,
+    fetch_pull_request_files_payload,
     fetch_workflow_runs,
     fetch_workflow_runs_for_commit,
 )
-from app.utils.smokeshow import extract_and_upload_coverage_report
+from app.utils.patch_coverage import display_patch_coverage
+from app.utils.report_server import serve_coverage_report, serve_reports_locally_toggle
+from app.utils.smokeshow import upload_coverage_report
+from app.utils.workflow_metrics import PYTHON_COVERAGE, record_run_metrics
 
 # Set page configuration
 st.set_page_config(page_title="Python test coverage", page_icon="☂️", layout="wide")
@@ -80,6 +96,8 @@ else:
     else:
         since_date = None
 
+serve_reports_locally = serve_reports_locally_toggle()
+
 
 def parse_coverage_json(coverage_file: Any) -> dict | None:
     """Parse a coverage.py JSON report file and return the data."""
@@ -94,11 +112,6 @@ def parse_coverage_json(coverage_file: Any) -> dict | None:
         return None
 
 
-def extract_coverage_summary(coverage_data: dict) -> dict[str, Any]:
-    """Extract summary statistics from coverage data."""
-    return extract_python_coverage_summary(coverage_data)
-
-
 @st.cache_data(show_spinner=False)
 def get_coverage_data_from_artifact(run_id: int) -> dict[str, Any] | None:
     """Get coverage data from the artifact of a workflow run."""
@@ -119,13 +132,18 @@ def get_coverage_data_from_artifact(run_id: int) -> dict[str, Any] | None:
     if not artifact_content:
         return None
 
-    # Extract the coverage.json file from the zip
+    # Only read the totals from the coverage.json file in the zip, the trend doesn't need the line data
     try:
         with ZipFile(BytesIO(artifact_content)) as zip_file:
             with zip_file.open("coverage.json") as coverage_file:
-                coverage_data = parse_coverage_json(coverage_file)
-                if coverage_data:
-                    return extract_coverage_summary(coverage_data)
+                totals, file_summaries = read_python_coverage_summaries(coverage_file)
+                if totals:
+                    summary = summarize_python_coverage_totals(totals, len(file_summaries))
+                    summary["file_stats"] = {
+                        file_path: (file_summary["num_statements"], file_summary["covered_lines"])
+                        for file_path, file_summary in file_summaries.items()
+                    }
+                    return summary
     except Exception as e:
         st.error(f"Error extracting coverage data: {e}")
 
@@ -218,58 +236,18 @@ def display_coverage_details(
 
     st.plotly_chart(fig, width="stretch")
 
-    # Display file-level coverage
+    # Display file-level coverage, one directory at a time
     st.header("File Coverage Details")
+    st.caption(":material/keyboard_arrow_down: Select a directory to open it, or a file to download its coverage data.")
 
-    # Sort by coverage percentage (ascending)
-    coverage_df = coverage_df.sort_values("Coverage %", ascending=False)
-
-    # Create GitHub links for the Path column
-    coverage_df["File"] = coverage_df["Path"].apply(
-        lambda x: f"https://github.com/streamlit/streamlit/tree/develop/lib/{x}"
-    )
-
-    # Display the dataframe with coverage information and GitHub links
-    file_coverage_selection = st.dataframe(
-        coverage_df,
-        column_config={
-            "Coverage %": st.column_config.ProgressColumn(
-                "Coverage %",
-                help="Percentage of lines covered by tests",
-                format="%f%%",
-                min_value=0,
-                max_value=100,
-            ),
-            "Lines Uncovered": st.column_config.NumberColumn("Lines Uncovered"),
-            "File": st.column_config.LinkColumn(
-                "File",
-                help="View file in GitHub repository",
-                display_text="https://github.com/streamlit/streamlit/tree/develop/lib/streamlit/(.*)",
-                pinned=True,
-            ),
-        },
-        hide_index=True,
-        column_order=[
-            "File",
-            "Lines Covered",
-            "Lines Uncovered",
-            "Lines Missed",
-            "Total Lines",
-            "Coverage %",
-        ],
-        on_select="rerun",
-        selection_mode="single-row",
-        key="file_coverage_selection",
-    )
+    rollup_df = rollup_coverage(coverage_df["Path"].tolist(), coverage_df["Total Lines"], coverage_df["Lines Covered"])
+    selected_file_path = display_coverage_tree(rollup_df, key="file_coverage_tree")
 
     # Check if a file was selected
-    if file_coverage_selection["selection"] and file_coverage_selection["selection"]["rows"]:
-        selected_file_index = file_coverage_selection["selection"]["rows"][0]
-        selected_file_path = coverage_df.iloc[selected_file_index]["Path"]
-        selected_file_name = coverage_df.iloc[selected_file_index]["Filename"]
-
+    if selected_file_path:
         # Get the coverage data for the selected file
         selected_file_data = coverage_data[selected_file_path]
+        selected_file_name = selected_file_data["file_name"]
 
         # Create JSON data for the selected file
         single_file_json = {
@@ -281,8 +259,8 @@ def display_coverage_details(
             },
             "files": {
                 selected_file_path: {
-                    "executed_lines": selected_file_data["executed_lines"],
-                    "missing_lines": selected_file_data["missing_lines"],
+                    "executed_lines": selected_file_data["executed_lines"].to_list(),
+                    "missing_lines": selected_file_data["missing_lines"].to_list(),
                     "excluded_lines": [],
                     "summary": {
                         "covered_lines": len(selected_file_data["executed_lines"]),
@@ -326,26 +304,9 @@ def display_coverage_details(
 
     # Create a horizontal bar chart for file coverage
     if len(coverage_df) > 0:
-        # Create a treemap visualization
+        # Create a treemap visualization of the directories
         st.subheader("Coverage Treemap")
-
-        # Add a size column for the treemap (using total lines)
-        treemap_df = coverage_df.copy()
-
-        # Extract directory structure
-        treemap_df["Directory"] = treemap_df["Path"].apply(lambda x: pathlib.Path(x).parent.name or "root")
-
-        fig = px.treemap(
-            treemap_df,
-            path=["Directory", "Filename"],
-            values="Total Lines",
-            color="Coverage %",
-            color_continuous_scale=["red", "orange", "green"],
-            range_color=[0, 100],
-            hover_data=["Lines Covered", "Lines Missed", "Total Lines"],
-        )
-
-        st.plotly_chart(fig, width="stretch")
+        st.plotly_chart(coverage_rollup_figure(rollup_df), width="stretch")
 
         st.subheader("Coverage by File")
 
@@ -489,8 +450,8 @@ def deploy_coverage_report(run_id: int) -> str | None:
         st.error("Failed to download the HTML coverage report.")
         return None
 
-    # Extract and upload to smokeshow
-    return extract_and_upload_coverage_report(artifact_content)
+    # Upload to smokeshow
+    return upload_coverage_report(artifact_content)
 
 
 # Function to download, extract, upload and display the HTML coverage report
@@ -499,7 +460,11 @@ def display_coverage_report_dialog(run_id: int) -> None:
     """Download, extract, upload and display the HTML coverage report in an iframe."""
     # Download the artifact
     with st.spinner("Downloading and deploying the coverage report..."):
-        report_url = deploy_coverage_report(run_id)
+        report_url = (
+            serve_coverage_report(run_id, "combined_coverage_report")
+            if serve_reports_locally
+            else deploy_coverage_report(run_id)
+        )
         if not report_url:
             st.error("Failed to process the HTML coverage report.")
             return
@@ -508,7 +473,9 @@ def display_coverage_report_dialog(run_id: int) -> None:
         components.iframe(report_url, height=600, scrolling=True)
 
 
-def display_pr_coverage_comparison(pr_coverage: dict[str, Any], develop_coverage: dict[str, Any]) -> None:
+def display_pr_coverage_comparison(
+    pr_coverage: dict[str, Any], develop_coverage: dict[str, Any], pr_number: int
+) -> None:
     """Display a comparison of PR coverage against develop branch coverage."""
     st.subheader("PR Coverage Comparison")
 
@@ -615,6 +582,11 @@ def display_pr_coverage_comparison(pr_coverage: dict[str, Any], develop_coverage
                 with zip_file.open("coverage.json") as coverage_file:
                     develop_coverage_data = parse_coverage_json(coverage_file)
 
+            if pr_coverage_data:
+                pr_files, error = fetch_pull_request_files_payload("streamlit/streamlit", pr_number)
+                if error:
+                    st.warning(f"Could only fetch some of the changed files of the PR: {error}")
+                display_patch_coverage(pr_files, pr_coverage_data, path_prefix="lib/")
             if pr_coverage_data and develop_coverage_data:
                 display_pr_detailed_comparison(pr_coverage_data, develop_coverage_data)
         except Exception as e:
@@ -625,53 +597,7 @@ def display_pr_detailed_comparison(pr_coverage_data: dict, develop_coverage_data
     """Display a detailed file-by-file comparison of PR coverage against develop coverage."""
     st.subheader("File-by-File Coverage Comparison")
 
-    # Create DataFrames for PR and develop coverage
-    pr_df = pd.DataFrame(
-        [
-            {
-                "Filename": info["file_name"],
-                "Path": file_path,
-                "PR Coverage %": round(info["coverage_pct"], 2),
-                "PR Lines Covered": len(info["executed_lines"]),
-                "PR Lines Missed": len(info["missing_lines"]),
-                "PR Total Lines": info["total_lines"],
-            }
-            for file_path, info in pr_coverage_data.items()
-        ]
-    )
-
-    develop_df = pd.DataFrame(
-        [
-            {
-                "Filename": info["file_name"],
-                "Path": file_path,
-                "Develop Coverage %": round(info["coverage_pct"], 2),
-                "Develop Lines Covered": len(info["executed_lines"]),
-                "Develop Lines Missed": len(info["missing_lines"]),
-                "Develop Total Lines": info["total_lines"],
-            }
-            for file_path, info in develop_coverage_data.items()
-        ]
-    )
-
-    # Merge the DataFrames on Path
-    merged_df = pr_df.merge(
-        develop_df,
-        on=["Path", "Filename"],
-        how="outer",
-        suffixes=("_pr", "_develop"),
-    ).fillna(0)
-
-    # Calculate coverage changes
-    merged_df["Coverage Change"] = merged_df["PR Coverage %"] - merged_df["Develop Coverage %"]
-    merged_df["Lines Covered Change"] = merged_df["PR Lines Covered"] - merged_df["Develop Lines Covered"]
-    merged_df["Lines Missed Change"] = merged_df["PR Lines Missed"] - merged_df["Develop Lines Missed"]
-    merged_df["Total Lines Change"] = merged_df["PR Total Lines"] - merged_df["Develop Total Lines"]
-
-    # Flag new and removed files
-    merged_df["Status"] = "-"
-    merged_df.loc[merged_df["Develop Total Lines"] == 0, "Status"] = "New"
-    merged_df.loc[merged_df["PR Total Lines"] == 0, "Status"] = "Removed"
+    merged_df = compare_python_coverage(pr_coverage_data, develop_coverage_data)
 
     # Create GitHub links for the Path column
     merged_df["File"] = merged_df["Path"].apply(
@@ -713,6 +639,10 @@ def display_pr_detailed_comparison(pr_coverage_data: dict, develop_coverage_data
                 "Total Lines Change",
                 format="%+d",
             ),
+            "Newly Uncovered Lines": st.column_config.NumberColumn(
+                "Newly Uncovered Lines",
+                help="Lines missed on the PR that were covered on develop (matched by line number).",
+            ),
             "Status": st.column_config.TextColumn(
                 "Status",
             ),
@@ -729,6 +659,7 @@ def display_pr_detailed_comparison(pr_coverage_data: dict, develop_coverage_data
             "Lines Covered Change",
             "Lines Missed Change",
             "Total Lines Change",
+            "Newly Uncovered Lines",
             "PR Coverage %",
             "PR Lines Covered",
             "PR Lines Missed",
@@ -794,7 +725,7 @@ if pr_number is not None:
 
     if pr_coverage and develop_coverage:
         # Display the comparison
-        display_pr_coverage_comparison(pr_coverage, develop_coverage)
+        display_pr_coverage_comparison(pr_coverage, develop_coverage, int(pr_number))
         # Stop execution to not show the regular app content
         st.stop()
     else:
@@ -828,6 +759,9 @@ with st.spinner("Fetching data..."):
 
     # Process the data
     coverage_history = []
+    file_history = load_coverage_history(PYTHON_COVERAGE_HISTORY_PATH)
+    recorded_run_ids = set(file_history["run_id"].unique())
+    new_file_history = []
     progress_bar = st.progress(0)
     status_text = st.empty()
 
@@ -840,12 +774,15 @@ with st.spinner("Fetching data..."):
         coverage_data = get_coverage_data_from_artifact(run["id"])
 
         if coverage_data:
+            created_at = datetime.strptime(run["created_at"], "%Y-%m-%dT%H:%M:%SZ")
+            if run["id"] not in recorded_run_ids:
+                new_file_history.append(file_history_frame(run["id"], created_at, coverage_data["file_stats"]))
             coverage_history.append(
                 {
                     "run_id": run["id"],
                     "commit_sha": run["head_sha"][:7],
                     "commit_url": f"https://github.com/streamlit/streamlit/commit/{run['head_sha']}",
-                    "created_at": datetime.strptime(run["created_at"], "%Y-%m-%dT%H:%M:%SZ"),
+                    "created_at": created_at,
                     "total_stmts": coverage_data["total_stmts"],
                     "total_miss": coverage_data["total_miss"],
                     "covered_stmts": coverage_data["covered_stmts"],
@@ -858,10 +795,14 @@ with st.spinner("Fetching data..."):
     progress_bar.empty()
     status_text.empty()
 
+    if new_file_history:
+        file_history = record_coverage_runs(new_file_history, PYTHON_COVERAGE_HISTORY_PATH)
+
     # Create DataFrame
     if coverage_history:
         df = pd.DataFrame(coverage_history)
         df = df.sort_values("created_at")
+        record_run_metrics("python-tests.yml", df, {PYTHON_COVERAGE: "coverage_pct"})
     else:
         st.warning("No coverage data found in the workflow runs.")
         st.stop()
@@ -967,6 +908,8 @@ fig_metrics.update_layout(
 
 st.plotly_chart(fig_metrics, width="stretch", theme="streamlit")
 
+display_coverage_decay(file_history, df)
+
 # Create a table with the data
 st.subheader("Coverage History")
 
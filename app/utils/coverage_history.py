@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Mapping
+
+# Per-run, per-file coverage of develop, one Parquet file per test suite. Runs are
+# appended as they are first loaded, so the history outlives artifact expiry and
+# doesn't have to be rebuilt from the artifacts on every cold start.
+PYTHON_COVERAGE_HISTORY_PATH: Final[Path] = Path(".cache/coverage/python_file_history.parquet")
+FRONTEND_COVERAGE_HISTORY_PATH: Final[Path] = Path(".cache/coverage/frontend_file_history.parquet")
+
+COVERAGE_HISTORY_COLUMNS: Final[list[str]] = ["run_id", "created_at", "path", "stmts", "covered"]
+
+_lock = threading.Lock()
+
+
+def file_history_frame(run_id: int, created_at: datetime, file_stats: Mapping[str, tuple[int, int]]) -> pd.DataFrame:
+    """Build the history rows of a single run.
+
+    Args:
+        run_id: ID of the workflow run.
+        created_at: When the workflow run was created.
+        file_stats: Number of statements and covered statements by file path.
+    """
+    paths = list(file_stats)
+    counts = np.array(list(file_stats.values()), dtype=np.int32).reshape(-1, 2)
+    return pd.DataFrame(
+        {
+            "run_id": np.full(len(paths), run_id, dtype=np.int64),
+            "created_at": pd.Series([created_at] * len(paths), dtype="datetime64[us]"),
+            "path": pd.Categorical(paths),
+            "stmts": counts[:, 0],
+            "covered": counts[:, 1],
+        }
+    )
+
+
+def _empty_history() -> pd.DataFrame:
+    return file_history_frame(0, datetime.min, {})
+
+
+def _normalize(history: pd.DataFrame) -> pd.DataFrame:
+    # Paths repeat for every run, a categorical keeps them dictionary encoded in memory and in the file.
+    return history.astype({"path": "category", "stmts": np.int32, "covered": np.int32})
+
+
+def load_coverage_history(path: Path) -> pd.DataFrame:
+    """Load the persisted coverage history, or an empty history if there is none yet."""
+    if not path.exists():
+        return _empty_history()
+    try:
+        history = pd.read_parquet(path, columns=COVERAGE_HISTORY_COLUMNS)
+    except (OSError, ValueError) as ex:
+        print(f"Failed to read the coverage history {path}: {ex}")
+        return _empty_history()
+    return _normalize(history)
+
+
+def save_coverage_history(history: pd.DataFrame, path: Path) -> None:
+    """Persist the coverage history atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    history.to_parquet(tmp_path, index=False)
+    tmp_path.replace(path)
+
+
+def record_coverage_runs(run_frames: Iterable[pd.DataFrame], path: Path) -> pd.DataFrame:
+    """Append the rows of new runs to the persisted coverage history.
+
+    Runs that are already in the history are kept as they are.
+
+    Returns:
+        The updated history, sorted by run.
+    """
+    with _lock:
+        history = load_coverage_history(path)
+        new_rows = [frame for frame in run_frames if not frame.empty]
+        new_rows = [frame[~frame["run_id"].isin(history["run_id"])] for frame in new_rows]
+        if not any(len(frame) for frame in new_rows):
+            return history
+        history = pd.concat([history.astype({"path": str}), *(frame.astype({"path": str}) for frame in new_rows)])
+        history = _normalize(history.sort_values(["created_at", "run_id", "path"], ignore_index=True))
+        try:
+            save_coverage_history(history, path)
+        except OSError as ex:
+            print(f"Failed to persist the coverage history {path}: {ex}")
+        return history
+
+
+def coverage_decay(history: pd.DataFrame, run_ids: Collection[int] | None = None) -> pd.DataFrame:
+    """Rank the files whose coverage dropped most over a window of runs.
+
+    The changes are computed per file over its runs in time order: from the first
+    to the last run, from the best to the last run, and between consecutive runs
+    (the worst of which points to the run that caused most of the drop). Files
+    that aren't in the last run of the window (e.g. deleted files) are left out.
+
+    Args:
+        history: Coverage history as returned by `load_coverage_history`.
+        run_ids: Runs of the window, all runs of the history if None.
+
+    Returns:
+        One row per file with a coverage drop, the biggest drop first.
+    """
+    window = history if run_ids is None else history[history["run_id"].isin(list(run_ids))]
+    columns = [
+        "path",
+        "runs",
+        "first_pct",
+        "last_pct",
+        "coverage_change",
+        "peak_pct",
+        "change_from_peak",
+        "missed_change",
+        "stmts",
+        "missed",
+        "worst_run_change",
+        "worst_run_id",
+    ]
+    if window.empty:
+        return pd.DataFrame(columns=columns)
+
+    window = window.sort_values(["created_at", "run_id"], kind="stable")
+    window = window[window["path"].isin(window.loc[window["run_id"] == window["run_id"].iloc[-1], "path"])]
+    stmts = window["stmts"].to_numpy(dtype=np.int64)
+    covered = window["covered"].to_numpy(dtype=np.int64)
+    # Like coverage.py and Istanbul, a file without statements is fully covered.
+    coverage_pct = np.divide(covered * 100.0, stmts, out=np.full(len(window), 100.0), where=stmts > 0)
+    window = window.assign(coverage_pct=coverage_pct, missed=stmts - covered)
+
+    by_file = window.groupby("path", observed=True, sort=False)
+    window = window.assign(run_change=by_file["coverage_pct"].diff())
+    report = window.groupby("path", observed=True, sort=False).agg(
+        runs=("run_id", "size"),
+        first_pct=("coverage_pct", "first"),
+        last_pct=("coverage_pct", "last"),
+        peak_pct=("coverage_pct", "max"),
+        first_missed=("missed", "first"),
+        missed=("missed", "last"),
+        stmts=("stmts", "last"),
+    )
+    worst_runs = (
+        window.dropna(subset=["run_change"])
+        .sort_values("run_change", kind="stable")
+        .drop_duplicates("path")
+        .set_index("path")[["run_change", "run_id"]]
+        .rename(columns={"run_change": "worst_run_change", "run_id": "worst_run_id"})
+    )
+    report = report.join(worst_runs)
+    report["coverage_change"] = report["last_pct"] - report["first_pct"]
+    report["change_from_peak"] = report["last_pct"] - report["peak_pct"]
+    report["missed_change"] = report["missed"] - report["first_missed"]
+
+    report = report[report["coverage_change"] < 0].reset_index()
+    report["path"] = report["path"].astype(str)
+    report["worst_run_id"] = report["worst_run_id"].astype("Int64")
+    return report.sort_values(["coverage_change", "missed_change"], ascending=[True, False], ignore_index=True)[columns]
+
+
+def display_coverage_decay(
+    file_history: pd.DataFrame,
+    runs_df: pd.DataFrame,
+    *,
+    coverage_label: str = "Coverage",
+    stmts_label: str = "Statements",
+    missed_label: str = "Missed",
+) -> None:
+    """Display the files whose coverage dropped most over the displayed runs, with their coverage over time.
+
+    Args:
+        file_history: Coverage history as returned by `load_coverage_history`.
+        runs_df: The displayed runs with `run_id` and `commit_url` columns.
+        coverage_label: Name of the coverage in labels, e.g. "Lines Coverage".
+        stmts_label: Name of the counted statements (or lines).
+        missed_label: Name of the missed statements (or lines).
+    """
+    st.subheader("Coverage Decay")
+    st.caption(
+        f"Files whose {coverage_label.lower()} dropped most between their first and last run in the selected time period. "
+        ":material/keyboard_arrow_down: Select a row to view the coverage of that file over time."
+    )
+
+    decay_df = coverage_decay(file_history, run_ids=runs_df["run_id"].tolist())
+    if decay_df.empty:
+        st.info("No file lost coverage in the selected time period.")
+        return
+
+    commit_by_run = runs_df.set_index("run_id")["commit_url"]
+    decay_df["worst_commit_url"] = decay_df["worst_run_id"].map(commit_by_run)
+    decay_selection = st.dataframe(
+        decay_df,
+        column_config={
+            "path": st.column_config.TextColumn("File", pinned=True),
+            "runs": st.column_config.NumberColumn("Runs"),
+            "first_pct": st.column_config.NumberColumn(f"First {coverage_label} %", format="%.2f%%"),
+            "last_pct": st.column_config.ProgressColumn(
+                f"Latest {coverage_label} %", format="%.2f%%", min_value=0, max_value=100
+            ),
+            "coverage_change": st.column_config.NumberColumn(f"{coverage_label} Change", format="%+.2f%%"),
+            "change_from_peak": st.column_config.NumberColumn(
+                "Change from Best", format="%+.2f%%", help="Change from the best coverage in the time period"
+            ),
+            "missed_change": st.column_config.NumberColumn("Missed Change", format="%+d"),
+            "stmts": st.column_config.NumberColumn(stmts_label),
+            "missed": st.column_config.NumberColumn(missed_label),
+            "worst_run_change": st.column_config.NumberColumn(
+                "Worst Commit Change", format="%+.2f%%", help="Largest drop between two consecutive runs"
+            ),
+            "worst_commit_url": st.column_config.LinkColumn(
+                "Worst Commit",
+                display_text="https://github.com/streamlit/streamlit/commit/([a-f0-9]{7}).*",
+            ),
+        },
+        column_order=[
+            "path",
+            "coverage_change",
+            "last_pct",
+            "first_pct",
+            "change_from_peak",
+            "missed_change",
+            "missed",
+            "stmts",
+            "runs",
+            "worst_run_change",
+            "worst_commit_url",
+        ],
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        key="coverage_decay_df",
+    )
+
+    if decay_selection["selection"]["rows"]:
+        selected_path = decay_df.iloc[decay_selection["selection"]["rows"][0]]["path"]
+        file_df = file_history[
+            (file_history["path"] == selected_path) & file_history["run_id"].isin(runs_df["run_id"])
+        ].sort_values("created_at")
+        file_df = file_df.assign(
+            coverage_pct=(file_df["covered"] / file_df["stmts"] * 100).where(file_df["stmts"] > 0, 100.0),
+            missed=file_df["stmts"] - file_df["covered"],
+        )
+        fig_file = px.line(
+            file_df,
+            x="created_at",
+            y="coverage_pct",
+            title=f"{coverage_label} of {selected_path} Over Time",
+            labels={"created_at": "Date", "coverage_pct": f"{coverage_label} %"},
+            markers=True,
+            hover_data={"stmts": True, "missed": True},
+        )
+        st.plotly_chart(fig_file, width="stretch", theme="streamlit")
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
 import pathlib
-from typing import Any
+from typing import IO, Any, Final
+
+import numpy as np
+import pandas as pd
+
+from app.utils.json_stream import JsonScanner
+from app.utils.line_bitmap import LineBitmap
+
+# Checkout directory of the frontend in CI, Vitest reports absolute paths.
+VITEST_CI_PATH_PREFIX: Final[str] = "/home/runner/work/streamlit/streamlit/frontend/"
 
 
 def parse_python_coverage_payload(coverage_payload: dict[str, Any]) -> dict[str, dict[str, Any]]:
-    """Parse a coverage.py JSON payload into a normalized file mapping."""
+    """Parse a coverage.py JSON payload into a normalized file mapping.
+
+    Executed and missing lines are kept as `LineBitmap`s, which are much smaller
+    than lists of line numbers when the parsed data is cached.
+    """
     coverage_info: dict[str, dict[str, Any]] = {}
 
     for file_path, file_data in coverage_payload["files"].items():
         file_name = pathlib.Path(file_path).name
-        executed_lines = file_data.get("executed_lines", [])
-        missing_lines = file_data.get("missing_lines", [])
+        executed_lines = LineBitmap.from_lines(file_data.get("executed_lines", []))
+        missing_lines = LineBitmap.from_lines(file_data.get("missing_lines", []))
         total_lines = len(executed_lines) + len(missing_lines)
         coverage_pct = (len(executed_lines) / total_lines * 100) if total_lines > 0 else 0
 
@@ -48,10 +61,129 @@ def extract_python_coverage_summary(coverage_data: dict[str, dict[str, Any]]) ->
     }
 
 
+def newly_uncovered_lines(pr_file: dict[str, Any], develop_file: dict[str, Any]) -> LineBitmap:
+    """Return the lines of a file that are missed on the PR but were executed on develop.
+
+    Lines are matched by number, so this is exact for unchanged parts of the file.
+    """
+    return pr_file["missing_lines"] & develop_file["executed_lines"]
+
+
+def compare_python_coverage(
+    pr_coverage_data: dict[str, dict[str, Any]], develop_coverage_data: dict[str, dict[str, Any]]
+) -> pd.DataFrame:
+    """Merge parsed coverage.py data of a PR and develop into one row per file with the changes.
+
+    Files that only exist on one side have zeros for the other side and are
+    flagged as `New` or `Removed` in the `Status` column.
+    """
+    # Create DataFrames for PR and develop coverage
+    pr_df = pd.DataFrame(
+        [
+            {
+                "Filename": info["file_name"],
+                "Path": file_path,
+                "PR Coverage %": round(info["coverage_pct"], 2),
+                "PR Lines Covered": len(info["executed_lines"]),
+                "PR Lines Missed": len(info["missing_lines"]),
+                "PR Total Lines": info["total_lines"],
+            }
+            for file_path, info in pr_coverage_data.items()
+        ]
+    )
+
+    develop_df = pd.DataFrame(
+        [
+            {
+                "Filename": info["file_name"],
+                "Path": file_path,
+                "Develop Coverage %": round(info["coverage_pct"], 2),
+                "Develop Lines Covered": len(info["executed_lines"]),
+                "Develop Lines Missed": len(info["missing_lines"]),
+                "Develop Total Lines": info["total_lines"],
+            }
+            for file_path, info in develop_coverage_data.items()
+        ]
+    )
+
+    # Merge the DataFrames on Path
+    merged_df = pr_df.merge(
+        develop_df,
+        on=["Path", "Filename"],
+        how="outer",
+        suffixes=("_pr", "_develop"),
+    ).fillna(0)
+
+    # Calculate coverage changes
+    merged_df["Coverage Change"] = merged_df["PR Coverage %"] - merged_df["Develop Coverage %"]
+    merged_df["Lines Covered Change"] = merged_df["PR Lines Covered"] - merged_df["Develop Lines Covered"]
+    merged_df["Lines Missed Change"] = merged_df["PR Lines Missed"] - merged_df["Develop Lines Missed"]
+    merged_df["Total Lines Change"] = merged_df["PR Total Lines"] - merged_df["Develop Total Lines"]
+
+    # Lines that lost coverage, computed as bitmap intersection for files on both sides
+    merged_df["Newly Uncovered Lines"] = [
+        len(newly_uncovered_lines(pr_coverage_data[path], develop_coverage_data[path]))
+        if path in pr_coverage_data and path in develop_coverage_data
+        else 0
+        for path in merged_df["Path"]
+    ]
+
+    # Flag new and removed files
+    merged_df["Status"] = "-"
+    merged_df.loc[merged_df["Develop Total Lines"] == 0, "Status"] = "New"
+    merged_df.loc[merged_df["PR Total Lines"] == 0, "Status"] = "Removed"
+
+    return merged_df
+
+
+def read_python_coverage_summaries(
+    coverage_file: IO[bytes] | IO[str],
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Stream the `totals` and per-file `summary` blocks out of a coverage.py JSON report.
+
+    The per-line arrays, which make up most of the report, are skipped without
+    being decoded.
+
+    Returns:
+        The report totals and the summary of every file by path.
+    """
+    scanner = JsonScanner(coverage_file)
+    totals: dict[str, Any] = {}
+    file_summaries: dict[str, dict[str, Any]] = {}
+    for key in scanner.iter_object():
+        if key == "totals":
+            totals = scanner.read_value()
+        elif key == "files":
+            for file_path in scanner.iter_object():
+                for file_key in scanner.iter_object():
+                    if file_key == "summary":
+                        file_summaries[file_path] = scanner.read_value()
+    return totals, file_summaries
+
+
+def summarize_python_coverage_totals(totals: dict[str, Any], total_files: int) -> dict[str, Any]:
+    """Build the summary of `extract_python_coverage_summary` from the `totals` of a coverage.py report.
+
+    Like `extract_python_coverage_summary`, the coverage only counts lines (not
+    branches), so trends stay comparable.
+    """
+    total_stmts = totals.get("num_statements", 0)
+    covered_stmts = totals.get("covered_lines", 0)
+    coverage = (covered_stmts / total_stmts) if total_stmts > 0 else 0
+    return {
+        "total_files": total_files,
+        "total_stmts": total_stmts,
+        "covered_stmts": covered_stmts,
+        "total_miss": total_stmts - covered_stmts,
+        "coverage": coverage,
+        "coverage_pct": coverage * 100,
+    }
+
+
 def parse_vitest_coverage_payload(
     coverage_payload: dict[str, Any],
     *,
-    path_prefix_to_remove: str = "/home/runner/work/streamlit/streamlit/frontend/",
+    path_prefix_to_remove: str = VITEST_CI_PATH_PREFIX,
 ) -> tuple[dict[str, dict[str, Any]], dict[str, Any]]:
     """Parse Vitest JSON summary payload into normalized file stats plus totals."""
     coverage_info: dict[str, dict[str, Any]] = {}
@@ -78,3 +210,94 @@ def parse_vitest_coverage_payload(
         }
 
     return coverage_info, coverage_payload.get("total", {})
+
+
+def find_coverage_summary_json(file_list: list[str]) -> str | None:
+    """Find the json-summary report in a coverage artifact, which may also contain the detail report."""
+    json_files = [f for f in file_list if f.endswith(".json") and not f.endswith("coverage-final.json")]
+    return next((f for f in json_files if f.endswith("coverage-summary.json")), next(iter(json_files), None))
+
+
+def _pct(covered: int, total: int) -> float:
+    # Istanbul reports 100% for files without anything to cover.
+    return covered / total * 100 if total > 0 else 100.0
+
+
+def parse_istanbul_file_coverage(file_path: str, file_data: dict[str, Any]) -> dict[str, Any]:
+    """Turn the Istanbul detail coverage of one file into line and branch bitmaps.
+
+    Like Istanbul's own line coverage, a line is executed if any statement that
+    starts on it was executed. A branch outcome belongs to the line its location
+    starts on.
+
+    Returns:
+        The file in the normalized structure of `parse_python_coverage_payload`
+        (`executed_lines`, `missing_lines`, `total_lines`, `coverage_pct`), with the
+        totals of `parse_vitest_coverage_payload` and `executed_branch_lines` and
+        `missing_branch_lines` bitmaps.
+    """
+    statement_map = file_data.get("statementMap", {})
+    statement_counts = file_data.get("s", {})
+    statement_ids = [statement_id for statement_id in statement_map if statement_id in statement_counts]
+    statement_lines = np.fromiter(
+        (statement_map[statement_id]["start"]["line"] for statement_id in statement_ids),
+        dtype=np.int64,
+        count=len(statement_ids),
+    )
+    statement_hits = np.fromiter(
+        (statement_counts[statement_id] for statement_id in statement_ids), dtype=np.int64, count=len(statement_ids)
+    )
+    executed_lines = LineBitmap.from_lines(statement_lines[statement_hits > 0])
+    missing_lines = LineBitmap.from_lines(statement_lines[statement_hits == 0]) - executed_lines
+
+    branch_lines: list[int] = []
+    branch_hits: list[int] = []
+    for branch_id, branch in file_data.get("branchMap", {}).items():
+        outcome_counts = file_data.get("b", {}).get(branch_id, [])
+        for location, count in zip(branch.get("locations", []), outcome_counts, strict=False):
+            # Some locations (e.g. an implicit else) have no position, use the line of the branch then.
+            branch_lines.append(location.get("start", {}).get("line") or branch["loc"]["start"]["line"])
+            branch_hits.append(count)
+    branch_lines_arr = np.asarray(branch_lines, dtype=np.int64)
+    branch_hits_arr = np.asarray(branch_hits, dtype=np.int64)
+
+    function_hits = list(file_data.get("f", {}).values())
+    lines_total = len(executed_lines) + len(missing_lines)
+    functions_covered = sum(1 for count in function_hits if count > 0)
+    branches_covered = int(np.count_nonzero(branch_hits_arr))
+    return {
+        "file_name": pathlib.Path(file_path).name,
+        "file_path": file_path,
+        "executed_lines": executed_lines,
+        "missing_lines": missing_lines,
+        "total_lines": lines_total,
+        "coverage_pct": _pct(len(executed_lines), lines_total),
+        "executed_branch_lines": LineBitmap.from_lines(branch_lines_arr[branch_hits_arr > 0]),
+        "missing_branch_lines": LineBitmap.from_lines(branch_lines_arr[branch_hits_arr == 0]),
+        "lines_total": lines_total,
+        "lines_covered": len(executed_lines),
+        "lines_pct": _pct(len(executed_lines), lines_total),
+        "functions_total": len(function_hits),
+        "functions_covered": functions_covered,
+        "functions_pct": _pct(functions_covered, len(function_hits)),
+        "branches_total": len(branch_hits),
+        "branches_covered": branches_covered,
+        "branches_pct": _pct(branches_covered, len(branch_hits)),
+    }
+
+
+def parse_istanbul_coverage_final(
+    coverage_file: IO[bytes] | IO[str],
+    *,
+    path_prefix_to_remove: str = VITEST_CI_PATH_PREFIX,
+) -> dict[str, dict[str, Any]]:
+    """Stream an Istanbul `coverage-final.json` (Vitest `json` reporter) into per-file line bitmaps.
+
+    Only one file of the report is decoded at a time, see `parse_istanbul_file_coverage`.
+    """
+    scanner = JsonScanner(coverage_file)
+    coverage_info: dict[str, dict[str, Any]] = {}
+    for file_path in scanner.iter_object():
+        clean_path = file_path.removeprefix(path_prefix_to_remove)
+        coverage_info[clean_path] = parse_istanbul_file_coverage(clean_path, scanner.read_value())
+    return coverage_info
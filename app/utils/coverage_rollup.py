@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from itertools import accumulate
+from typing import TYPE_CHECKING, Final
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy.typing as npt
+
+# Parent of the top-level directories and files.
+ROLLUP_ROOT: Final[str] = ""
+
+ROLLUP_COLUMNS: Final[list[str]] = [
+    "id",
+    "parent",
+    "name",
+    "depth",
+    "is_dir",
+    "files",
+    "stmts",
+    "covered",
+    "missed",
+    "coverage_pct",
+]
+
+
+def rollup_coverage(paths: Sequence[str], stmts: npt.ArrayLike, covered: npt.ArrayLike) -> pd.DataFrame:
+    """Aggregate per-file coverage counts up the directory tree.
+
+    Every file contributes its counts to itself and each of its ancestor
+    directories, and all nodes are summed in a single groupby.
+
+    Args:
+        paths: Slash-separated file paths.
+        stmts: Number of statements (or lines) of each file.
+        covered: Number of covered statements of each file.
+
+    Returns:
+        One row per directory and file with the columns of `ROLLUP_COLUMNS`.
+        `id` is the path of the node and `parent` the path of its directory
+        (`ROLLUP_ROOT` for top-level nodes).
+    """
+    if not paths:
+        return pd.DataFrame(columns=ROLLUP_COLUMNS)
+
+    # e.g. lib/src/a.ts -> lib, lib/src, lib/src/a.ts
+    node_paths = [list(accumulate(path.split("/"), lambda parent, part: f"{parent}/{part}")) for path in paths]
+    depths = np.fromiter(map(len, node_paths), dtype=np.int64, count=len(node_paths))
+    # Depth of every node within its file, without a Python loop per node.
+    node_depths = np.arange(depths.sum()) - np.repeat(np.cumsum(depths) - depths, depths) + 1
+    nodes = pd.DataFrame(
+        {
+            "id": [node for file_nodes in node_paths for node in file_nodes],
+            "depth": node_depths,
+            "is_dir": node_depths < np.repeat(depths, depths),
+            "stmts": np.repeat(np.asarray(stmts, dtype=np.int64), depths),
+            "covered": np.repeat(np.asarray(covered, dtype=np.int64), depths),
+        }
+    )
+    rollup = (
+        nodes.groupby("id", sort=False)
+        .agg(
+            depth=("depth", "first"),
+            is_dir=("is_dir", "first"),
+            files=("id", "size"),
+            stmts=("stmts", "sum"),
+            covered=("covered", "sum"),
+        )
+        .reset_index()
+    )
+    parent_and_name = rollup["id"].str.rpartition("/")
+    rollup["parent"] = parent_and_name[0]
+    rollup["name"] = parent_and_name[2]
+    rollup["missed"] = rollup["stmts"] - rollup["covered"]
+    # Like coverage.py and Istanbul, nothing to cover counts as fully covered.
+    rollup["coverage_pct"] = np.divide(
+        rollup["covered"] * 100.0,
+        rollup["stmts"],
+        out=np.full(len(rollup), 100.0),
+        where=rollup["stmts"].to_numpy() > 0,
+    )
+    return rollup[ROLLUP_COLUMNS]
+
+
+def directory_children(rollup: pd.DataFrame, directory: str = ROLLUP_ROOT) -> pd.DataFrame:
+    """Return the direct children of a directory, directories first and the most missed statements first."""
+    children = rollup[rollup["parent"] == directory]
+    return children.sort_values(["is_dir", "missed", "name"], ascending=[False, False, True], ignore_index=True)
+
+
+def coverage_rollup_figure(rollup: pd.DataFrame, *, max_depth: int | None = None) -> go.Figure:
+    """Create a treemap of the directories of a rollup, sized by statements and colored by coverage.
+
+    Files are left out, which keeps the figure at a few hundred nodes.
+    """
+    directories = rollup[rollup["is_dir"]]
+    if max_depth is not None:
+        directories = directories[directories["depth"] <= max_depth]
+    return go.Figure(
+        go.Treemap(
+            ids=directories["id"],
+            labels=directories["name"],
+            parents=directories["parent"],
+            values=directories["stmts"],
+            branchvalues="total",
+            customdata=directories[["coverage_pct", "covered", "missed", "files"]],
+            marker={
+                "colors": directories["coverage_pct"],
+                "colorscale": [[0, "red"], [0.5, "orange"], [1, "green"]],
+                "cmin": 0,
+                "cmax": 100,
+                "showscale": True,
+            },
+            hovertemplate=(
+                "<b>%{id}</b><br>Coverage: %{customdata[0]:.2f}%<br>Covered: %{customdata[1]:,}"
+                "<br>Missed: %{customdata[2]:,}<br>Files: %{customdata[3]:,}<extra></extra>"
+            ),
+        ),
+        layout={"margin": {"t": 10, "l": 10, "r": 10, "b": 10}},
+    )
+
+
+def display_coverage_tree(rollup: pd.DataFrame, *, key: str, stmts_label: str = "Statements") -> str | None:
+    """Display a drill-down table of a rollup that only renders one directory at a time.
+
+    Selecting a directory opens it, the breadcrumb above the table goes back up.
+
+    Returns:
+        The path of the selected file, None if no file is selected.
+    """
+    directory_key = f"{key}_directory"
+    directory = st.session_state.get(directory_key, ROLLUP_ROOT)
+    if directory != ROLLUP_ROOT and not (rollup["id"] == directory).any():
+        directory = ROLLUP_ROOT
+    # A new table key per directory resets the selection when navigating.
+    table_key = f"{key}_table_{directory}"
+
+    def open_directory(path: str) -> None:
+        st.session_state[directory_key] = path
+
+    with st.container(horizontal=True, vertical_alignment="center", gap="small"):
+        st.button("All files", key=f"{key}_crumb_root", type="tertiary", on_click=open_directory, args=(ROLLUP_ROOT,))
+        ancestors = list(accumulate(directory.split("/"), lambda parent, part: f"{parent}/{part}")) if directory else []
+        for ancestor in ancestors:
+            st.markdown("/")
+            st.button(
+                ancestor.rpartition("/")[2],
+                key=f"{key}_crumb_{ancestor}",
+                type="tertiary",
+                on_click=open_directory,
+                args=(ancestor,),
+            )
+
+    children = directory_children(rollup, directory)
+    children["label"] = np.where(children["is_dir"], "📁 " + children["name"] + "/", "📄 " + children["name"])
+    selection = st.dataframe(
+        children,
+        column_config={
+            "label": st.column_config.TextColumn("Name", pinned=True),
+            "files": st.column_config.NumberColumn("Files"),
+            "stmts": st.column_config.NumberColumn(stmts_label),
+            "covered": st.column_config.NumberColumn("Covered"),
+            "missed": st.column_config.NumberColumn("Missed"),
+            "coverage_pct": st.column_config.ProgressColumn("Coverage %", format="%.2f%%", min_value=0, max_value=100),
+        },
+        column_order=["label", "coverage_pct", "missed", "covered", "stmts", "files"],
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        key=table_key,
+    )
+
+    if not selection["selection"]["rows"]:
+        return None
+    selected = children.iloc[selection["selection"]["rows"][0]]
+    if selected["is_dir"]:
+        open_directory(selected["id"])
+        # Forget the selection, otherwise going back up would open the directory again.
+        del st.session_state[table_key]
+        st.rerun()
+    return selected["id"]
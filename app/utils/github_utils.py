@@ -5,7 +5,7 @@ import contextlib
 import json
 import urllib.parse
 from io import BytesIO
-from typing import TYPE_CHECKING, Any, Final, Literal, Protocol, cast
+from typing import IO, TYPE_CHECKING, Any, Final, Literal, Protocol, cast
 from zipfile import ZipFile
 
 import requests
@@ -837,10 +837,14 @@ def zip_namelist(zip_bytes: bytes) -> list[str]:
         return z.namelist()
 
 
-def iter_json_from_zip_bytes(
+def iter_json_members_from_zip_bytes(
     zip_bytes: bytes, *, prefix: str | None = None, root_only: bool = False
-) -> Iterator[tuple[str, Any]]:
-    """Iterate JSON files within a zip blob (in-memory).
+) -> Iterator[tuple[str, IO[bytes]]]:
+    """Iterate JSON members within a zip blob (in-memory) as open binary streams.
+
+    This allows callers to parse members incrementally instead of materializing
+    the full JSON document. Each stream is only valid until the next item is
+    requested.
 
     Args:
         zip_bytes: Raw zip bytes.
@@ -848,7 +852,7 @@ def iter_json_from_zip_bytes(
         root_only: If True, only consider members at the zip root (no '/' in name).
 
     Yields:
-        (member_name, parsed_json)
+        (member_name, binary_stream)
     """
     with ZipFile(BytesIO(zip_bytes)) as z:
         for name in z.namelist():
@@ -861,7 +865,24 @@ def iter_json_from_zip_bytes(
             if not name.endswith(".json"):
                 continue
             with z.open(name) as f:
-                yield name, json.load(f)
+                yield name, f
+
+
+def iter_json_from_zip_bytes(
+    zip_bytes: bytes, *, prefix: str | None = None, root_only: bool = False
+) -> Iterator[tuple[str, Any]]:
+    """Iterate JSON files within a zip blob (in-memory).
+
+    Args:
+        zip_bytes: Raw zip bytes.
+        prefix: If provided, only consider members starting with this prefix.
+        root_only: If True, only consider members at the zip root (no '/' in name).
+
+    Yields:
+        (member_name, parsed_json)
+    """
+    for name, f in iter_json_members_from_zip_bytes(zip_bytes, prefix=prefix, root_only=root_only):
+        yield name, json.load(f)
 
 
 def first_json_from_zip_bytes(zip_bytes: bytes, *, prefix: str | None = None) -> tuple[str, Any] | None:
@@ -1,25 +1,22 @@
 """Data fetching functions for the interrupt rotation dashboard.
 
 Contains all GitHub-specific business logic for analyzing issues, PRs, and CI metrics.
+The CI metrics are read from the table of `app.utils.workflow_metrics`, they don't
+download any artifacts.
 """
 
 from __future__ import annotations
 
-import json
 import pathlib
 from collections import Counter
 from datetime import date, datetime, timedelta
-from io import BytesIO
 from typing import Any
-from zipfile import ZipFile
 
 import pandas as pd
 import streamlit as st
 
 from app.utils.agent_wiki import fetch_wiki_issue_repros
 from app.utils.github_utils import (
-    download_artifact,
-    fetch_artifacts,
     fetch_workflow_run_annotations,
     fetch_workflow_runs,
     fetch_workflow_runs_ids,
@@ -27,6 +24,16 @@ from app.utils.github_utils import (
     get_all_github_prs,
     is_community_author,
 )
+from app.utils.workflow_metrics import (
+    BUNDLE_ENTRY_GZIP,
+    BUNDLE_TOTAL_GZIP,
+    FRONTEND_COVERAGE,
+    PLAYWRIGHT_TEST_COUNT,
+    PYTHON_COVERAGE,
+    WHEEL_SIZE,
+    load_workflow_metrics,
+    metric_window,
+)
 
 # Path to the issues folder
 DEFAULT_ISSUES_FOLDER = "issues"
@@ -274,218 +281,44 @@ def build_interrupt_action_items(since_date: date, refresh_nonce: int = 0) -> di
     return _build_interrupt_action_items(issues=issues, prs=prs, since_date=since_date)
 
 
-@st.cache_data(ttl=60 * 60 * 6, show_spinner="Fetching python test coverage...")  # cache for 6 hours
-def get_python_test_coverage_metrics(since_date: date, refresh_nonce: int = 0) -> tuple[float, float]:
-    """Get the python test coverage and the change over a period."""
-    _ = refresh_nonce  # Included to enable targeted cache busting from selected pages.
-    runs_in_period = fetch_workflow_runs("python-tests.yml", since=since_date)
-
-    def get_coverage(run_id: int) -> float:
-        artifacts = fetch_artifacts(run_id)
-        artifact = next((a for a in artifacts if a["name"] == "combined_coverage_json"), None)
-        if not artifact:
-            return 0.0
-        content = download_artifact(artifact["archive_download_url"])
-        if not content:
-            return 0.0
-        with ZipFile(BytesIO(content)) as z:
-            with z.open("coverage.json") as f:
-                data = json.load(f)
-                return data["totals"]["percent_covered"]
-
-    if not runs_in_period:
-        # If there are no runs in the selected period, just get the latest one
-        # to show the current coverage.
-        latest_run = fetch_workflow_runs("python-tests.yml", limit=1)
-        if not latest_run:
-            return 0.0, 0.0
-        latest_coverage = get_coverage(latest_run[0]["id"])
-        return latest_coverage, 0.0
-
-    latest_coverage = get_coverage(runs_in_period[0]["id"])
-
-    if len(runs_in_period) < 2:
-        return latest_coverage, 0.0
-
-    oldest_coverage = get_coverage(runs_in_period[-1]["id"])
-
-    return latest_coverage, latest_coverage - oldest_coverage
-
-
-@st.cache_data(ttl=60 * 60 * 6, show_spinner="Fetching frontend test coverage...")  # cache for 6 hours
-def get_frontend_test_coverage_metrics(since_date: date, refresh_nonce: int = 0) -> tuple[float, float]:
-    """Get the frontend test coverage and the change over a period."""
-    _ = refresh_nonce  # Included to enable targeted cache busting from selected pages.
-    runs_in_period = fetch_workflow_runs("js-tests.yml", since=since_date)
-
-    def get_coverage(run_id: int) -> float:
-        artifacts = fetch_artifacts(run_id)
-        artifact = next((a for a in artifacts if a["name"] == "vitest_coverage_json"), None)
-        if not artifact:
-            return 0.0
-        content = download_artifact(artifact["archive_download_url"])
-        if not content:
-            return 0.0
-        with ZipFile(BytesIO(content)) as z:
-            json_file = next((f for f in z.namelist() if f.endswith(".json")), None)
-            if json_file:
-                with z.open(json_file) as f:
-                    data = json.load(f)
-                    return data.get("total", {}).get("lines", {}).get("pct", 0.0)
-        return 0.0
-
-    if not runs_in_period:
-        # If there are no runs in the selected period, just get the latest one
-        # to show the current coverage.
-        latest_run = fetch_workflow_runs("js-tests.yml", limit=1)
-        if not latest_run:
-            return 0.0, 0.0
-        latest_coverage = get_coverage(latest_run[0]["id"])
-        return latest_coverage, 0.0
-
-    latest_coverage = get_coverage(runs_in_period[0]["id"])
-
-    if len(runs_in_period) < 2:
-        return latest_coverage, 0.0
-
-    oldest_coverage = get_coverage(runs_in_period[-1]["id"])
-
-    return latest_coverage, latest_coverage - oldest_coverage
-
-
-@st.cache_data(ttl=60 * 60 * 6, show_spinner="Fetching wheel size...")  # cache for 6 hours
-def get_wheel_size_metrics(since_date: date, refresh_nonce: int = 0) -> tuple[int, int]:
-    """Get the wheel size and the change over a period."""
-    _ = refresh_nonce  # Included to enable targeted cache busting from selected pages.
-    runs_in_period = fetch_workflow_runs("pr-preview.yml", since=since_date)
-
-    def get_size(run_id: int) -> int:
-        artifacts = fetch_artifacts(run_id)
-        artifact = next((a for a in artifacts if a["name"] == "whl_file"), None)
-        return artifact["size_in_bytes"] if artifact else 0
+def _ci_metric_window(metric: str, since_date: date) -> tuple[float, float] | None:
+    """Get the latest value of a CI metric and its change over a period, None if it isn't known yet."""
+    return metric_window(load_workflow_metrics(), metric, since_date)
 
-    if not runs_in_period:
-        # If there are no runs in the selected period, just get the latest one
-        # to show the current wheel size.
-        latest_run = fetch_workflow_runs("pr-preview.yml", limit=1)
-        if not latest_run:
-            return 0, 0
-        latest_size = get_size(latest_run[0]["id"])
-        return latest_size, 0
 
-    latest_size = get_size(runs_in_period[0]["id"])
+def _int_window(window: tuple[float, float] | None) -> tuple[int, int] | None:
+    return None if window is None else (int(window[0]), int(window[1]))
 
-    if len(runs_in_period) < 2:
-        return latest_size, 0
 
-    oldest_size = get_size(runs_in_period[-1]["id"])
+def get_python_test_coverage_metrics(since_date: date) -> tuple[float, float] | None:
+    """Get the python test coverage and the change over a period, None if it isn't known yet."""
+    return _ci_metric_window(PYTHON_COVERAGE, since_date)
 
-    return latest_size, latest_size - oldest_size
 
+def get_frontend_test_coverage_metrics(since_date: date) -> tuple[float, float] | None:
+    """Get the frontend test coverage and the change over a period, None if it isn't known yet."""
+    return _ci_metric_window(FRONTEND_COVERAGE, since_date)
 
-@st.cache_data(ttl=60 * 60 * 6, show_spinner="Fetching bundle size metrics...")  # cache for 6 hours
-def get_bundle_size_metrics(since_date: date, refresh_nonce: int = 0) -> tuple[int, int, int, int]:
-    """Get the total and entry gzip size and the change over a period.
-
-    Returns: (total_gzip, total_gzip_change, entry_gzip, entry_gzip_change).
-    """
-    _ = refresh_nonce  # Included to enable targeted cache busting from selected pages.
-    runs_in_period = fetch_workflow_runs("pr-preview.yml", since=since_date)
-
-    def get_sizes(run_id: int) -> tuple[int, int]:
-        artifacts = fetch_artifacts(run_id)
-        artifact = next((a for a in artifacts if a["name"] == "bundle_analysis_json"), None)
 
-        if not artifact:
-            return 0, 0
+def get_wheel_size_metrics(since_date: date) -> tuple[int, int] | None:
+    """Get the wheel size and the change over a period, None if it isn't known yet."""
+    return _int_window(_ci_metric_window(WHEEL_SIZE, since_date))
 
-        content = download_artifact(artifact["archive_download_url"])
-        if not content:
-            return 0, 0
 
-        try:
-            with ZipFile(BytesIO(content)) as z:
-                for name in z.namelist():
-                    if name.endswith(".json"):
-                        with z.open(name) as f:
-                            bundle_data = json.load(f)
-                            total_gzip = 0
-                            entry_gzip = 0
-
-                            for item in bundle_data:
-                                total_gzip += item.get("gzipSize", 0)
-                                if item.get("isEntry"):
-                                    entry_gzip += item.get("gzipSize", 0)
-
-                            return total_gzip, entry_gzip
-        except Exception:
-            return 0, 0
-
-        return 0, 0
-
-    if not runs_in_period:
-        # If there are no runs in the selected period, just get the latest one
-        latest_run = fetch_workflow_runs("pr-preview.yml", limit=1)
-        if not latest_run:
-            return 0, 0, 0, 0
-        latest_total, latest_entry = get_sizes(latest_run[0]["id"])
-        return latest_total, 0, latest_entry, 0
-
-    latest_total, latest_entry = get_sizes(runs_in_period[0]["id"])
-
-    if len(runs_in_period) < 2:
-        return latest_total, 0, latest_entry, 0
-
-    oldest_total, oldest_entry = get_sizes(runs_in_period[-1]["id"])
+def get_bundle_size_metrics(since_date: date) -> tuple[tuple[int, int] | None, tuple[int, int] | None]:
+    """Get the total and entry gzip size and their changes over a period.
 
+    Returns: ((total_gzip, total_gzip_change), (entry_gzip, entry_gzip_change)), each None if it isn't known yet.
+    """
     return (
-        latest_total,
-        latest_total - oldest_total,
-        latest_entry,
-        latest_entry - oldest_entry,
+        _int_window(_ci_metric_window(BUNDLE_TOTAL_GZIP, since_date)),
+        _int_window(_ci_metric_window(BUNDLE_ENTRY_GZIP, since_date)),
     )
 
 
-@st.cache_data(ttl=60 * 60 * 6, show_spinner="Fetching Playwright test count...")  # cache for 6 hours
-def get_playwright_test_count_metrics(since_date: date, refresh_nonce: int = 0) -> tuple[int, int]:
-    """Get the Playwright E2E test count and the change over a period."""
-    _ = refresh_nonce
-    runs_in_period = fetch_workflow_runs("playwright.yml", since=since_date)
-
-    def get_test_count(run_id: int) -> int:
-        artifacts = fetch_artifacts(run_id)
-        artifact = next((a for a in artifacts if a["name"].startswith("playwright_test_stats")), None)
-        if not artifact:
-            return 0
-        content = download_artifact(artifact["archive_download_url"])
-        if not content:
-            return 0
-        try:
-            with ZipFile(BytesIO(content)) as z:
-                for name in z.namelist():
-                    if name.endswith(".json"):
-                        with z.open(name) as f:
-                            data = json.load(f)
-                            return data.get("summary", {}).get("total_tests", 0)
-        except Exception:
-            return 0
-        return 0
-
-    if not runs_in_period:
-        latest_run = fetch_workflow_runs("playwright.yml", limit=1)
-        if not latest_run:
-            return 0, 0
-        latest_count = get_test_count(latest_run[0]["id"])
-        return latest_count, 0
-
-    latest_count = get_test_count(runs_in_period[0]["id"])
-
-    if len(runs_in_period) < 2:
-        return latest_count, 0
-
-    oldest_count = get_test_count(runs_in_period[-1]["id"])
-
-    return latest_count, latest_count - oldest_count
+def get_playwright_test_count_metrics(since_date: date) -> tuple[int, int] | None:
+    """Get the Playwright E2E test count and the change over a period, None if it isn't known yet."""
+    return _int_window(_ci_metric_window(PLAYWRIGHT_TEST_COUNT, since_date))
 
 
 def get_bug_metrics(since_date: date) -> tuple[int, int]:
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import io
+import json
+import re
+from typing import IO, TYPE_CHECKING, Any, Final, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_DECODER: Final[json.JSONDecoder] = json.JSONDecoder()
+_WHITESPACE: Final[re.Pattern[str]] = re.compile(r"\s*")
+_STRING: Final[re.Pattern[str]] = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+# Numbers, true, false and null.
+_SCALAR: Final[re.Pattern[str]] = re.compile(r"[^\s,\]}]+")
+# Characters that can follow a complete value.
+_DELIMITERS: Final[frozenset[str]] = frozenset(" \t\n\r,]}")
+# Strings (which may contain brackets) and brackets, the only tokens that matter to skip a container.
+_CONTAINER_TOKEN: Final[re.Pattern[str]] = re.compile(r'"(?:[^"\\]|\\.)*(?P<closed>")?|[\[\]{}]', re.DOTALL)
+
+
+class JsonScanner:
+    """Pull scanner over a JSON document that is read from a stream in chunks.
+
+    Only values that are read with `read_value` are decoded. Everything else is
+    skipped by scanning for brackets and quotes, without building Python objects.
+    That keeps the memory and time needed to pick a few small blocks out of a
+    large report (e.g. the `summary` blocks of coverage.json) low.
+
+    Example:
+        >>> scanner = JsonScanner(stream)
+        >>> for key in scanner.iter_object():
+        ...     if key == "totals":
+        ...         totals = scanner.read_value()
+    """
+
+    def __init__(self, stream: IO[str] | IO[bytes], chunk_size: int = 1 << 16) -> None:
+        self._stream: IO[str]
+        if isinstance(stream.read(0), bytes):
+            self._stream = io.TextIOWrapper(cast("IO[bytes]", stream), encoding="utf-8")
+        else:
+            self._stream = cast("IO[str]", stream)
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        # Start of the value that is being read, the buffer is kept from there on.
+        self._capture_start: int | None = None
+        self._value_consumed = True
+
+    def _refill(self, size: int | None = None) -> bool:
+        if self._eof:
+            return False
+        chunk = self._stream.read(size or self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        keep_from = self._pos if self._capture_start is None else self._capture_start
+        self._buffer = self._buffer[keep_from:] + chunk
+        self._pos -= keep_from
+        if self._capture_start is not None:
+            self._capture_start -= keep_from
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            whitespace = _WHITESPACE.match(self._buffer, self._pos)
+            if whitespace is not None:
+                self._pos = whitespace.end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._refill():
+                message = "Unexpected end of JSON document."
+                raise ValueError(message)
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            message = f"Expected {char!r} but found {self._buffer[self._pos]!r}."
+            raise ValueError(message)
+        self._pos += 1
+
+    def _match(self, pattern: re.Pattern[str]) -> str:
+        # A token at the end of the buffer may continue in the next chunk.
+        while True:
+            match = pattern.match(self._buffer, self._pos)
+            if match is not None and match.end() < len(self._buffer):
+                break
+            if not self._refill():
+                if match is None:
+                    message = f"Invalid JSON token at {self._buffer[self._pos : self._pos + 20]!r}."
+                    raise ValueError(message)
+                break
+        self._pos = match.end()
+        return match.group()
+
+    def _skip_container(self) -> None:
+        depth = 0
+        while True:
+            resume = len(self._buffer)
+            for match in _CONTAINER_TOKEN.finditer(self._buffer, self._pos):
+                char = self._buffer[match.start()]
+                if char == '"':
+                    if match.group("closed") is None:
+                        # The string continues in the next chunk, scan it again after refilling.
+                        resume = match.start()
+                        break
+                    continue
+                depth += 1 if char in "[{" else -1
+                if depth == 0:
+                    self._pos = match.end()
+                    return
+            self._pos = resume
+            if not self._refill():
+                message = "Unexpected end of JSON document."
+                raise ValueError(message)
+
+    def skip_value(self) -> None:
+        """Skip the next value without decoding it."""
+        char = self._peek()
+        if char == '"':
+            self._match(_STRING)
+        elif char in "[{":
+            self._skip_container()
+        else:
+            self._match(_SCALAR)
+        self._value_consumed = True
+
+    def _may_continue(self, error: json.JSONDecodeError) -> bool:
+        # Only errors at the end of the buffer may be fixed by reading more, e.g. a
+        # truncated string, literal or escape, or a value that hasn't started yet.
+        if error.msg.startswith("Unterminated string"):
+            return True
+        return error.pos >= len(self._buffer) or _SCALAR.fullmatch(self._buffer, error.pos) is not None
+
+    def read_value(self) -> Any:
+        """Decode the next value."""
+        is_scalar = self._peek() not in '"[{'
+        self._capture_start = self._pos
+        try:
+            while True:
+                try:
+                    value, end = _DECODER.raw_decode(self._buffer, self._pos)
+                except json.JSONDecodeError as error:
+                    # The value continues in the next chunks, read as much again as is buffered
+                    # so that large values are only decoded a few times.
+                    if not self._may_continue(error) or not self._refill(
+                        max(self._chunk_size, len(self._buffer) - self._pos)
+                    ):
+                        raise
+                    continue
+                # A number is only complete once it is followed by a delimiter, e.g. `1` may be
+                # the start of `1.5` or `1e3` that continues in the next chunk.
+                if not is_scalar or (end < len(self._buffer) and self._buffer[end] in _DELIMITERS):
+                    break
+                if not self._refill(max(self._chunk_size, len(self._buffer) - self._pos)):
+                    break
+        finally:
+            self._capture_start = None
+        self._pos = end
+        self._value_consumed = True
+        return value
+
+    def iter_object(self) -> Iterator[str]:
+        """Iterate over the keys of the next value, which has to be an object.
+
+        After every key, the caller can read its value with `read_value`, iterate
+        over it with `iter_object` or skip it. Values that weren't consumed are
+        skipped automatically.
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            self._value_consumed = True
+            return
+        while True:
+            if self._peek() != '"':
+                message = f"Expected an object key but found {self._buffer[self._pos]!r}."
+                raise ValueError(message)
+            key = json.loads(self._match(_STRING))
+            self._expect(":")
+            self._value_consumed = False
+            yield key
+            if not self._value_consumed:
+                self.skip_value()
+            separator = self._peek()
+            self._pos += 1
+            if separator == "}":
+                break
+            if separator != ",":
+                message = f"Expected ',' or '}}' but found {separator!r}."
+                raise ValueError(message)
+        self._value_consumed = True
@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Final, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Common log-bucketed grid that all latency histograms are re-binned onto, so
+# histograms of different runs and scenarios can be merged by adding counts.
+# 16 buckets per power of two keep the relative error of a percentile below ~4.4%.
+LATENCY_BUCKETS_PER_OCTAVE: Final[int] = 16
+LATENCY_MIN_MS: Final[float] = 0.1
+LATENCY_MAX_MS: Final[float] = 15 * 60 * 1000
+LATENCY_BUCKET_EDGES_MS: Final[npt.NDArray[np.float64]] = LATENCY_MIN_MS * np.exp2(
+    np.arange(int(np.ceil(np.log2(LATENCY_MAX_MS / LATENCY_MIN_MS) * LATENCY_BUCKETS_PER_OCTAVE)) + 1)
+    / LATENCY_BUCKETS_PER_OCTAVE
+)
+# Values below the first edge go into bucket 0, values above the last edge into the last bucket.
+NUM_LATENCY_BUCKETS: Final[int] = len(LATENCY_BUCKET_EDGES_MS) + 1
+
+
+class LatencyHistogram(NamedTuple):
+    """Sparse latency histogram on the common `LATENCY_BUCKET_EDGES_MS` grid."""
+
+    bucket_indices: npt.NDArray[np.int16]
+    counts: npt.NDArray[np.int64]
+
+
+def parse_latency_histogram(timing: dict[str, Any]) -> LatencyHistogram | None:
+    """Parse the optional `histogram` of a load-test timing summary (e.g. `initial_load_time_ms`).
+
+    Two formats are supported:
+
+    - HDR-style recorded values: `{"values": [...], "counts": [...]}` where every
+      value (in ms) was recorded `counts[i]` times.
+    - Log-bucketed: `{"bucket_upper_bounds_ms": [...], "counts": [...]}` where
+      `counts[i]` values fell into the bucket ending at the upper bound.
+
+    Both are re-binned onto the common grid. Returns None if the summary has no
+    (valid) histogram.
+    """
+    histogram = timing.get("histogram")
+    if not isinstance(histogram, dict):
+        return None
+    values = histogram.get("values", histogram.get("bucket_upper_bounds_ms"))
+    counts = histogram.get("counts")
+    if not isinstance(values, list) or not isinstance(counts, list) or len(values) != len(counts) or not values:
+        return None
+
+    values_ms = np.asarray(values, dtype=np.float64)
+    counts_arr = np.asarray(counts, dtype=np.int64)
+    buckets = np.bincount(
+        np.searchsorted(LATENCY_BUCKET_EDGES_MS, values_ms, side="left"),
+        weights=counts_arr,
+        minlength=NUM_LATENCY_BUCKETS,
+    ).astype(np.int64)
+    bucket_indices = np.flatnonzero(buckets)
+    return LatencyHistogram(bucket_indices.astype(np.int16), buckets[bucket_indices])
+
+
+def merge_latency_histograms(histograms: Iterable[LatencyHistogram | None]) -> npt.NDArray[np.int64]:
+    """Merge sparse histograms into dense counts on the common grid. Missing histograms are skipped."""
+    merged = np.zeros(NUM_LATENCY_BUCKETS, dtype=np.int64)
+    for histogram in histograms:
+        if histogram is not None:
+            np.add.at(merged, histogram.bucket_indices, histogram.counts)
+    return merged
+
+
+def histogram_percentiles(counts: npt.NDArray[np.int64], percentiles: Iterable[float]) -> dict[float, float]:
+    """Compute percentiles (0..100) from dense counts on the common grid.
+
+    Every value is represented by the geometric center of its bucket. Returns
+    NaN for all percentiles if the histogram is empty.
+    """
+    total = int(counts.sum())
+    if total == 0:
+        return dict.fromkeys(percentiles, float("nan"))
+
+    lower_edges = np.concatenate(([LATENCY_MIN_MS / 2], LATENCY_BUCKET_EDGES_MS))
+    upper_edges = np.concatenate((LATENCY_BUCKET_EDGES_MS, [LATENCY_MAX_MS * 2]))
+    centers = np.sqrt(lower_edges * upper_edges)
+    cumulative = np.cumsum(counts)
+    return {
+        percentile: float(centers[np.searchsorted(cumulative, max(1, np.ceil(percentile / 100 * total)))])
+        for percentile in percentiles
+    }
+
+
+# Per-interval server metrics in `server_metrics["samples"]`, in addition to `elapsed_seconds`.
+SERVER_SAMPLE_SERIES: Final[tuple[str, ...]] = (
+    "rss_mb",
+    "cpu_percent",
+    "thread_count",
+    "active_sessions",
+    "completed_sessions",
+)
+# Samples in the first part of a scenario are ramp-up and excluded from steady-state metrics.
+STEADY_STATE_WARMUP_FRACTION: Final[float] = 0.2
+
+
+class ServerMetricSeries(NamedTuple):
+    """Per-interval server samples of one scenario run as compact float32 arrays.
+
+    Series the harness didn't emit are empty arrays.
+    """
+
+    elapsed_seconds: npt.NDArray[np.float32]
+    rss_mb: npt.NDArray[np.float32]
+    cpu_percent: npt.NDArray[np.float32]
+    thread_count: npt.NDArray[np.float32]
+    active_sessions: npt.NDArray[np.float32]
+    completed_sessions: npt.NDArray[np.float32]
+
+
+def parse_server_samples(server_metrics: dict[str, Any]) -> ServerMetricSeries | None:
+    """Parse the optional per-interval `samples` of a scenario's `server_metrics`.
+
+    The expected format is columnar, with one list per metric that is aligned
+    with `elapsed_seconds`:
+    `{"elapsed_seconds": [...], "rss_mb": [...], "cpu_percent": [...], "thread_count": [...],
+    "active_sessions": [...], "completed_sessions": [...]}`. Only `elapsed_seconds` is
+    required. Returns None if there are no (valid) samples.
+    """
+    samples = server_metrics.get("samples")
+    if not isinstance(samples, dict):
+        return None
+    elapsed = samples.get("elapsed_seconds")
+    if not isinstance(elapsed, list) or not elapsed:
+        return None
+
+    def series(key: str) -> npt.NDArray[np.float32]:
+        values = samples.get(key)
+        if not isinstance(values, list) or len(values) != len(elapsed):
+            return np.empty(0, dtype=np.float32)
+        return np.asarray(values, dtype=np.float32)
+
+    return ServerMetricSeries(
+        elapsed_seconds=np.asarray(elapsed, dtype=np.float32),
+        **{field: series(field) for field in SERVER_SAMPLE_SERIES},
+    )
+
+
+def leak_slope_mb_per_session(series: ServerMetricSeries | None) -> float | None:
+    """Estimate how much server RSS grows per completed session with a least-squares fit.
+
+    A steady positive slope across runs points at memory that isn't released
+    when sessions end. Returns None without RSS and completed-session samples or
+    if no sessions completed during the samples.
+    """
+    if series is None or not series.rss_mb.size or not series.completed_sessions.size:
+        return None
+    sessions = series.completed_sessions.astype(np.float64)
+    if np.ptp(sessions) == 0:
+        return None
+    slope, _intercept = np.polyfit(sessions, series.rss_mb.astype(np.float64), 1)
+    return float(slope)
+
+
+def steady_state_cpu_per_user(series: ServerMetricSeries | None, concurrent_users: int) -> float | None:
+    """Average server CPU (%) per concurrent user, excluding the ramp-up at the start of the scenario."""
+    if series is None or not series.cpu_percent.size or concurrent_users <= 0:
+        return None
+    steady_start = series.elapsed_seconds[0] + STEADY_STATE_WARMUP_FRACTION * np.ptp(series.elapsed_seconds)
+    steady_cpu = series.cpu_percent[series.elapsed_seconds >= steady_start]
+    return float(steady_cpu.mean()) / concurrent_users
+
+
+def server_samples_frame(series_by_run: Iterable[tuple[str, ServerMetricSeries | None]]) -> pd.DataFrame:
+    """Build a long table of server samples (`run`, `elapsed_seconds`, `metric`, `value`) to align runs."""
+    frames = [
+        pd.DataFrame(
+            {
+                "run": run_label,
+                "elapsed_seconds": series.elapsed_seconds,
+                "metric": field,
+                "value": getattr(series, field),
+            }
+        )
+        for run_label, series in series_by_run
+        if series is not None
+        for field in SERVER_SAMPLE_SERIES
+        if getattr(series, field).size
+    ]
+    if not frames:
+        return pd.DataFrame(columns=["run", "elapsed_seconds", "metric", "value"])
+    return pd.concat(frames, ignore_index=True)
+
+
+# A PR metric is flagged if it lies this many (robust) standard deviations beyond the develop baseline.
+REGRESSION_Z_THRESHOLD: Final[float] = 2.0
+# With fewer develop runs the baseline distribution is too uncertain to flag anything.
+MIN_BASELINE_RUNS: Final[int] = 5
+# Scales the median absolute deviation to a standard deviation for normally distributed values.
+_MAD_TO_STD: Final[float] = 1.4826
+
+
+def baseline_position(value: float, baseline: npt.NDArray[np.float64]) -> dict[str, float]:
+    """Locate a value within a baseline distribution.
+
+    The z-score uses the median and the scaled median absolute deviation, so a
+    single outlier run on develop doesn't widen the band. If more than half of
+    the baseline runs had the same value, the standard deviation is used instead.
+
+    Returns:
+        The baseline median and robust standard deviation, the z-score of the value
+        and its percentile rank (0..100) within the baseline. All are NaN without
+        baseline, the z-score and percentile are NaN if the value is NaN.
+    """
+    if not baseline.size:
+        return dict.fromkeys(("median", "std", "z_score", "percentile"), float("nan"))
+    median = float(np.median(baseline))
+    std = _MAD_TO_STD * float(np.median(np.abs(baseline - median))) or float(baseline.std())
+    if np.isnan(value):
+        return {"median": median, "std": std, "z_score": float("nan"), "percentile": float("nan")}
+    # Without any spread, every difference from the baseline is infinitely far out.
+    z_score = (value - median) / std if std else float(np.sign(value - median) * np.inf) if value != median else 0.0
+    percentile = (np.count_nonzero(baseline < value) + 0.5 * np.count_nonzero(baseline == value)) / baseline.size
+    return {"median": median, "std": std, "z_score": z_score, "percentile": 100 * percentile}
+
+
+def compare_with_baseline(
+    pr_df: pd.DataFrame,
+    baseline_df: pd.DataFrame,
+    metrics: Iterable[str],
+    z_threshold: float = REGRESSION_Z_THRESHOLD,
+    min_runs: int = MIN_BASELINE_RUNS,
+) -> pd.DataFrame:
+    """Compare the per-scenario metrics of a PR run with the distribution of many develop runs.
+
+    Both frames have one row per scenario and run with a `scenario` column and a
+    column per metric. Lower values are better for all metrics.
+
+    Returns:
+        A long table with one row per scenario and metric: the PR value, the number
+        of baseline runs, the baseline median, the band of values within
+        `z_threshold` standard deviations, the z-score and percentile of the PR
+        value and a verdict (`Regression`, `Improvement`, `Within noise`,
+        `Insufficient baseline`, `PR only` or `Develop only`).
+    """
+    metrics = list(metrics)
+
+    def long_frame(df: pd.DataFrame) -> pd.DataFrame:
+        long_df = df.reindex(columns=["scenario", *metrics]).melt(id_vars="scenario", var_name="metric")
+        long_df["value"] = pd.to_numeric(long_df["value"], errors="coerce")
+        return long_df.dropna(subset=["value"])
+
+    pr_values = long_frame(pr_df).groupby(["scenario", "metric"])["value"].mean()
+    baseline_values = {
+        key: group.to_numpy(np.float64)
+        for key, group in long_frame(baseline_df).groupby(["scenario", "metric"])["value"]
+    }
+
+    records = []
+    for scenario, metric in sorted(set(pr_values.index) | set(baseline_values)):
+        pr_value = float(pr_values.get((scenario, metric), float("nan")))
+        baseline = baseline_values.get((scenario, metric), np.empty(0))
+        position = baseline_position(pr_value, baseline)
+        if not baseline.size:
+            verdict = "PR only"
+        elif np.isnan(pr_value):
+            verdict = "Develop only"
+        elif baseline.size < min_runs:
+            verdict = "Insufficient baseline"
+        elif position["z_score"] >= z_threshold:
+            verdict = "Regression"
+        elif position["z_score"] <= -z_threshold:
+            verdict = "Improvement"
+        else:
+            verdict = "Within noise"
+        records.append(
+            {
+                "scenario": scenario,
+                "metric": metric,
+                "pr": pr_value,
+                "baseline_runs": baseline.size,
+                "baseline_median": position["median"],
+                "band_low": position["median"] - z_threshold * position["std"],
+                "band_high": position["median"] + z_threshold * position["std"],
+                "z_score": position["z_score"],
+                "percentile": position["percentile"],
+                "verdict": verdict,
+            }
+        )
+    return pd.DataFrame(
+        records,
+        columns=[
+            "scenario",
+            "metric",
+            "pr",
+            "baseline_runs",
+            "baseline_median",
+            "band_low",
+            "band_high",
+            "z_score",
+            "percentile",
+            "verdict",
+        ],
+    )
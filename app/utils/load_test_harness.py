@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import platform
+import socket
+import subprocess  # ruff: ignore[suspicious-subprocess-import]
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final, NamedTuple
+
+import numpy as np
+import psutil
+import requests
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ClientState_pb2 import ClientState
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from websockets.asyncio.client import connect
+
+from app.utils.load_test_data import SERVER_SAMPLE_SERIES
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Sequence
+
+    from websockets.asyncio.client import ClientConnection
+
+# Local load-test harness for Streamlit apps. It starts `streamlit run` for every
+# app, drives many concurrent WebSocket sessions against it and writes the same
+# JSON schema as the upstream `load-testing.yml` workflow, so the results can be
+# inspected on the load testing page. Run with:
+#
+#   python -m app.utils.load_test_harness issues/gh-10025/app.py --users 20
+
+STREAM_PATH: Final[str] = "_stcore/stream"
+HEALTH_PATH: Final[str] = "_stcore/health"
+SERVER_STARTUP_TIMEOUT_SECONDS: Final[float] = 60.0
+# Resolution of the recorded latency histograms.
+HISTOGRAM_RESOLUTION_MS: Final[float] = 0.1
+
+
+class ScenarioConfig(NamedTuple):
+    app_path: str
+    concurrent_users: int = 10
+    # Sessions every simulated user opens one after another.
+    sessions_per_user: int = 3
+    reruns_per_session: int = 5
+    # Pause between two reruns of a session ("think time").
+    rerun_interval_seconds: float = 0.5
+    # Users start evenly spread over the ramp-up period.
+    ramp_up_seconds: float = 5.0
+    script_timeout_seconds: float = 60.0
+    sample_interval_seconds: float = 1.0
+
+
+class SessionResult(NamedTuple):
+    initial_load_ms: float | None
+    rerun_ms: list[float]
+    error: str | None
+
+
+class ServerSample(NamedTuple):
+    elapsed_seconds: float
+    rss_mb: float
+    cpu_percent: float
+    thread_count: int
+    active_sessions: int
+    completed_sessions: int
+
+
+class _SessionCounters:
+    def __init__(self) -> None:
+        self.active = 0
+        self.completed = 0
+
+
+def scenario_name(app_path: str) -> str:
+    """Name a scenario after the app, e.g. `gh-10025` for `issues/gh-10025/app.py`."""
+    path = Path(app_path)
+    return path.parent.name if path.stem == "app" and path.parent.name else path.stem
+
+
+def summarize_timings(values_ms: Sequence[float]) -> dict[str, Any]:
+    """Summarise timings in the `initial_load_time_ms`/`rerun_time_ms` format, including a histogram."""
+    if not values_ms:
+        return {"p50": 0, "p95": 0, "p99": 0, "mean": 0, "min": 0, "max": 0}
+    values = np.asarray(values_ms, dtype=np.float64)
+    recorded, counts = np.unique(
+        np.round(values / HISTOGRAM_RESOLUTION_MS) * HISTOGRAM_RESOLUTION_MS, return_counts=True
+    )
+    return {
+        "p50": float(np.percentile(values, 50)),
+        "p95": float(np.percentile(values, 95)),
+        "p99": float(np.percentile(values, 99)),
+        "mean": float(values.mean()),
+        "min": float(values.min()),
+        "max": float(values.max()),
+        "histogram": {"values": recorded.round(3).tolist(), "counts": counts.tolist()},
+    }
+
+
+def summarize_server_samples(samples: Sequence[ServerSample]) -> dict[str, Any]:
+    """Summarise server samples in the `server_metrics` format, including the per-interval samples."""
+    if not samples:
+        return {
+            "memory_rss_mb_peak": 0,
+            "memory_rss_mb_growth": 0,
+            "memory_rss_mb_avg": 0,
+            "cpu_percent_avg": 0,
+            "cpu_percent_peak": 0,
+            "thread_count_max": 0,
+        }
+    rss_mb = [sample.rss_mb for sample in samples]
+    cpu_percent = [sample.cpu_percent for sample in samples]
+    return {
+        "memory_rss_mb_peak": max(rss_mb),
+        "memory_rss_mb_growth": rss_mb[-1] - rss_mb[0],
+        "memory_rss_mb_avg": sum(rss_mb) / len(rss_mb),
+        "cpu_percent_avg": sum(cpu_percent) / len(cpu_percent),
+        "cpu_percent_peak": max(cpu_percent),
+        "thread_count_max": max(sample.thread_count for sample in samples),
+        "samples": {
+            field: [getattr(sample, field) for sample in samples]
+            for field in ("elapsed_seconds", *SERVER_SAMPLE_SERIES)
+        },
+    }
+
+
+def build_scenario_result(
+    config: ScenarioConfig,
+    session_results: Sequence[SessionResult],
+    server_samples: Sequence[ServerSample],
+    duration_seconds: float,
+) -> dict[str, Any]:
+    """Build one entry of `scenarios` in the schema read by the load testing page."""
+    failed = [result for result in session_results if result.error is not None]
+    return {
+        "scenario": scenario_name(config.app_path),
+        "concurrent_users": config.concurrent_users,
+        "duration_seconds": duration_seconds,
+        "server_metrics": summarize_server_samples(server_samples),
+        "session_metrics": {
+            "total_sessions": len(session_results),
+            "sessions_completed": len(session_results) - len(failed),
+            "sessions_failed": len(failed),
+            "errors": [result.error for result in failed],
+            "initial_load_time_ms": summarize_timings(
+                [result.initial_load_ms for result in session_results if result.initial_load_ms is not None]
+            ),
+            "rerun_time_ms": summarize_timings([value for result in session_results for value in result.rerun_ms]),
+        },
+    }
+
+
+def _rerun_message() -> bytes:
+    return BackMsg(rerun_script=ClientState(query_string="", page_script_hash="")).SerializeToString()
+
+
+async def _wait_for_script_finished(websocket: ClientConnection, timeout_seconds: float) -> None:
+    async with asyncio.timeout(timeout_seconds):
+        async for message in websocket:
+            if not isinstance(message, bytes):
+                continue
+            forward_msg = ForwardMsg()
+            forward_msg.ParseFromString(message)
+            if not forward_msg.HasField("script_finished"):
+                continue
+            if forward_msg.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                msg = "Script failed to compile"
+                raise RuntimeError(msg)
+            if forward_msg.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                return
+    msg = "Connection closed before the script finished"
+    raise ConnectionError(msg)
+
+
+async def run_session(url: str, config: ScenarioConfig, counters: _SessionCounters) -> SessionResult:
+    """Simulate one browser session: connect, wait for the initial script run, then rerun a few times."""
+    initial_load_ms: float | None = None
+    rerun_ms: list[float] = []
+    counters.active += 1
+    try:
+        start = time.perf_counter()
+        async with connect(f"{url}/{STREAM_PATH}", subprotocols=["streamlit"], max_size=None) as websocket:  # type: ignore[list-item]
+            await websocket.send(_rerun_message())
+            await _wait_for_script_finished(websocket, config.script_timeout_seconds)
+            initial_load_ms = (time.perf_counter() - start) * 1000
+
+            for _ in range(config.reruns_per_session):
+                await asyncio.sleep(config.rerun_interval_seconds)
+                rerun_start = time.perf_counter()
+                await websocket.send(_rerun_message())
+                await _wait_for_script_finished(websocket, config.script_timeout_seconds)
+                rerun_ms.append((time.perf_counter() - rerun_start) * 1000)
+    except Exception as ex:
+        return SessionResult(initial_load_ms, rerun_ms, f"{type(ex).__name__}: {ex}")
+    finally:
+        counters.active -= 1
+        counters.completed += 1
+    return SessionResult(initial_load_ms, rerun_ms, None)
+
+
+async def _simulate_user(url: str, config: ScenarioConfig, start_delay: float, counters: _SessionCounters) -> list:
+    await asyncio.sleep(start_delay)
+    return [await run_session(url, config, counters) for _ in range(config.sessions_per_user)]
+
+
+def _server_processes(pid: int) -> list[psutil.Process]:
+    process = psutil.Process(pid)
+    return [process, *process.children(recursive=True)]
+
+
+async def _sample_server(
+    pid: int, interval_seconds: float, counters: _SessionCounters, samples: list[ServerSample]
+) -> None:
+    processes = _server_processes(pid)
+    for process in processes:
+        # The first call only sets the reference point for the CPU measurement.
+        process.cpu_percent(None)
+    start = time.perf_counter()
+    while True:
+        await asyncio.sleep(interval_seconds)
+        with contextlib.suppress(psutil.Error):
+            samples.append(
+                ServerSample(
+                    elapsed_seconds=round(time.perf_counter() - start, 3),
+                    rss_mb=sum(process.memory_info().rss for process in processes) / 1024 / 1024,
+                    cpu_percent=sum(process.cpu_percent(None) for process in processes),
+                    thread_count=sum(process.num_threads() for process in processes),
+                    active_sessions=counters.active,
+                    completed_sessions=counters.completed,
+                )
+            )
+
+
+async def run_scenario(url: str, server_pid: int, config: ScenarioConfig) -> dict[str, Any]:
+    """Drive `config.concurrent_users` simulated users against a running server and collect the metrics."""
+    counters = _SessionCounters()
+    samples: list[ServerSample] = []
+    sampler = asyncio.create_task(_sample_server(server_pid, config.sample_interval_seconds, counters, samples))
+    start = time.perf_counter()
+    try:
+        user_results = await asyncio.gather(
+            *(
+                _simulate_user(url, config, config.ramp_up_seconds * user / config.concurrent_users, counters)
+                for user in range(config.concurrent_users)
+            )
+        )
+    finally:
+        sampler.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await sampler
+    duration_seconds = time.perf_counter() - start
+    session_results = [result for results in user_results for result in results]
+    return build_scenario_result(config, session_results, samples, duration_seconds)
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextlib.contextmanager
+def streamlit_server(app_path: str, port: int) -> Generator[subprocess.Popen]:
+    """Start `streamlit run` for an app in headless mode and wait until it is healthy."""
+    process = subprocess.Popen(  # ruff: ignore[subprocess-without-shell-equals-true]
+        [
+            sys.executable,
+            "-m",
+            "streamlit",
+            "run",
+            app_path,
+            "--server.headless=true",
+            f"--server.port={port}",
+            "--server.address=127.0.0.1",
+            "--server.fileWatcherType=none",
+            "--browser.gatherUsageStats=false",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + SERVER_STARTUP_TIMEOUT_SECONDS
+        while True:
+            if process.poll() is not None:
+                msg = f"Streamlit exited with code {process.returncode} while starting {app_path}"
+                raise RuntimeError(msg)
+            with contextlib.suppress(requests.RequestException):
+                if requests.get(f"http://127.0.0.1:{port}/{HEALTH_PATH}", timeout=1).ok:
+                    break
+            if time.monotonic() > deadline:
+                msg = f"Streamlit didn't become healthy within {SERVER_STARTUP_TIMEOUT_SECONDS}s"
+                raise TimeoutError(msg)
+            time.sleep(0.25)
+        yield process
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def _git_output(*args: str) -> str:
+    try:
+        return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout.strip()  # ruff: ignore[subprocess-without-shell-equals-true, start-process-with-partial-path]
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def run_load_test(configs: Sequence[ScenarioConfig]) -> dict[str, Any]:
+    """Run every scenario against its own, freshly started server.
+
+    Returns:
+        A payload with `metadata` and `scenarios` in the schema of the
+        `load-testing.yml` workflow results.
+    """
+    import streamlit
+
+    scenarios = []
+    for config in configs:
+        port = _free_port()
+        with streamlit_server(config.app_path, port) as process:
+            scenarios.append(asyncio.run(run_scenario(f"ws://127.0.0.1:{port}", process.pid, config)))
+
+    return {
+        "metadata": {
+            "git_sha": _git_output("rev-parse", "HEAD") or "local",
+            "git_branch": _git_output("rev-parse", "--abbrev-ref", "HEAD") or "local",
+            "runner": f"local ({platform.node()}, {psutil.cpu_count()} CPUs)",
+            "streamlit_version": streamlit.__version__,
+            "timestamp": datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        },
+        "scenarios": scenarios,
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Load-test Streamlit apps with concurrent WebSocket sessions.")
+    parser.add_argument("apps", nargs="+", help="Streamlit app scripts, one scenario per app.")
+    parser.add_argument("--users", type=int, default=ScenarioConfig._field_defaults["concurrent_users"])
+    parser.add_argument("--sessions-per-user", type=int, default=ScenarioConfig._field_defaults["sessions_per_user"])
+    parser.add_argument("--reruns", type=int, default=ScenarioConfig._field_defaults["reruns_per_session"])
+    parser.add_argument(
+        "--rerun-interval", type=float, default=ScenarioConfig._field_defaults["rerun_interval_seconds"]
+    )
+    parser.add_argument("--ramp-up", type=float, default=ScenarioConfig._field_defaults["ramp_up_seconds"])
+    parser.add_argument("--output", default="load-test-results.json", help="Path of the results JSON file.")
+    args = parser.parse_args(argv)
+
+    configs = [
+        ScenarioConfig(
+            app_path=app_path,
+            concurrent_users=args.users,
+            sessions_per_user=args.sessions_per_user,
+            reruns_per_session=args.reruns,
+            rerun_interval_seconds=args.rerun_interval,
+            ramp_up_seconds=args.ramp_up,
+        )
+        for app_path in args.apps
+    ]
+    results = run_load_test(configs)
+    Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    for scenario in results["scenarios"]:
+        session = scenario["session_metrics"]
+        print(
+            f"{scenario['scenario']}: {session['sessions_completed']}/{session['total_sessions']} sessions, "
+            f"initial load p50 {session['initial_load_time_ms']['p50']:.0f} ms, "
+            f"rerun p50 {session['rerun_time_ms']['p50']:.0f} ms, "
+            f"peak RSS {scenario['server_metrics']['memory_rss_mb_peak']:.0f} MB"
+        )
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import concurrent.futures
+import json
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+# Workflow runs whose load test artifact expired. GitHub never restores expired
+# artifacts, so these runs are skipped instead of being downloaded on every cold load.
+EXPIRED_RUNS_PATH: Final[Path] = Path(".cache/load_tests/expired_runs.json")
+# Maximum number of runs whose artifacts are downloaded at the same time.
+HISTORY_MAX_WORKERS: Final[int] = 8
+# A run that takes longer to load is reported as failed and not waited for.
+RUN_TIMEOUT_SECONDS: Final[float] = 90.0
+# How often the loader checks for timed out runs and reports progress.
+_POLL_INTERVAL_SECONDS: Final[float] = 0.5
+
+
+class _ExpiredRunsState:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.run_ids: set[int] | None = None
+
+
+_state = _ExpiredRunsState()
+
+
+def load_expired_runs(path: Path = EXPIRED_RUNS_PATH) -> set[int]:
+    """Load the persisted IDs of runs with expired artifacts, or an empty set if there are none yet."""
+    if not path.exists():
+        return set()
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return set(json.load(f))
+    except (OSError, TypeError, ValueError):
+        return set()
+
+
+def save_expired_runs(run_ids: Iterable[int], path: Path = EXPIRED_RUNS_PATH) -> None:
+    """Persist the IDs of runs with expired artifacts atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump(sorted(run_ids), f)
+    tmp_path.replace(path)
+
+
+def _get_expired_runs() -> set[int]:
+    if _state.run_ids is None:
+        _state.run_ids = load_expired_runs()
+    return _state.run_ids
+
+
+def is_expired_run(run_id: int) -> bool:
+    """Return whether the load test artifact of a run is known to be expired."""
+    with _state.lock:
+        return run_id in _get_expired_runs()
+
+
+def mark_expired_run(run_id: int) -> None:
+    """Remember persistently that the load test artifact of a run expired."""
+    with _state.lock:
+        run_ids = _get_expired_runs()
+        if run_id in run_ids:
+            return
+        run_ids.add(run_id)
+        try:
+            save_expired_runs(run_ids)
+        except OSError as ex:
+            print(f"Failed to persist expired load test runs: {ex}")
+
+
+def load_runs_concurrently[T](
+    runs: Sequence[dict[str, Any]],
+    load: Callable[[dict[str, Any]], T | None],
+    max_workers: int = HISTORY_MAX_WORKERS,
+    timeout_seconds: float = RUN_TIMEOUT_SECONDS,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> tuple[dict[int, T], dict[int, str]]:
+    """Load the results of many workflow runs in parallel, isolating failures per run.
+
+    A run that raises or takes longer than `timeout_seconds` (counted from when
+    its download started, not when it was queued) is reported as failed without
+    affecting the other runs. Timed out runs aren't waited for.
+
+    Args:
+        runs: Workflow runs as returned by the GitHub API.
+        load: Loads the results of a single run, None if the run has no results.
+        max_workers: Maximum number of runs loaded at the same time.
+        timeout_seconds: Maximum time to load a single run.
+        on_progress: Called with the number of finished and total runs, from the calling thread.
+
+    Returns:
+        The loaded results and the error messages of failed runs, both by run ID.
+    """
+    results: dict[int, T] = {}
+    failures: dict[int, str] = {}
+    started_at: dict[int, float] = {}
+
+    def load_run(run: dict[str, Any]) -> T | None:
+        started_at[run["id"]] = time.monotonic()
+        return load(run)
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        pending = {executor.submit(load_run, run): run["id"] for run in runs}
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending, timeout=_POLL_INTERVAL_SECONDS, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                run_id = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as ex:
+                    failures[run_id] = f"{type(ex).__name__}: {ex}"
+                    continue
+                if result is not None:
+                    results[run_id] = result
+
+            now = time.monotonic()
+            for future, run_id in list(pending.items()):
+                if run_id in started_at and now - started_at[run_id] > timeout_seconds:
+                    del pending[future]
+                    failures[run_id] = f"Timed out after {timeout_seconds:g}s"
+
+            if on_progress is not None:
+                on_progress(len(runs) - len(pending), len(runs))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results, failures
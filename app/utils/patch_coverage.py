@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any, Final
+
+import pandas as pd
+import streamlit as st
+
+from app.utils.line_bitmap import LineBitmap
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# `@@ -old_start,old_count +new_start,new_count @@`, the counts are optional.
+_HUNK_HEADER: Final[re.Pattern[str]] = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,\d+)? @@")
+
+PATCH_COVERAGE_COLUMNS: Final[list[str]] = [
+    "path",
+    "added_lines",
+    "executable_lines",
+    "covered_lines",
+    "uncovered_lines",
+    "patch_coverage_pct",
+    "uncovered_line_ranges",
+]
+
+
+def added_line_ranges(patch: str) -> list[tuple[int, int]]:
+    """Return the lines added by a unified diff `patch` as inclusive ranges in the new file."""
+    ranges: list[tuple[int, int]] = []
+    line_number = 0
+    for diff_line in patch.splitlines():
+        hunk = _HUNK_HEADER.match(diff_line)
+        if hunk is not None:
+            line_number = int(hunk.group(1))
+        elif diff_line.startswith("+"):
+            if ranges and ranges[-1][1] == line_number - 1:
+                ranges[-1] = (ranges[-1][0], line_number)
+            else:
+                ranges.append((line_number, line_number))
+            line_number += 1
+        elif diff_line.startswith(" ") or not diff_line:
+            # Context line, GitHub strips the leading space of empty context lines.
+            line_number += 1
+        # Removed lines and "\\ No newline at end of file" don't exist in the new file.
+    return ranges
+
+
+def format_line_ranges(lines: LineBitmap) -> str:
+    """Format lines compactly, e.g. `3-5, 9`."""
+    return ", ".join(str(start) if start == end else f"{start}-{end}" for start, end in lines.to_ranges())
+
+
+def compute_patch_coverage(
+    pr_files: Iterable[dict[str, Any]],
+    coverage_data: dict[str, dict[str, Any]],
+    path_prefix: str = "",
+) -> pd.DataFrame:
+    """Compute the coverage of the lines a PR added or changed.
+
+    Works with every coverage mapping that has `executed_lines` and
+    `missing_lines` bitmaps per file, e.g. from `parse_python_coverage_payload`.
+    Added lines that aren't executable (comments, blank lines, ...) are neither
+    covered nor uncovered.
+
+    Args:
+        pr_files: Changed files of the PR as returned by `fetch_pull_request_files_payload`.
+        coverage_data: Normalized coverage data of the PR head commit by path.
+        path_prefix: Prefix of the repository paths that the coverage paths don't have, e.g. `lib/`.
+
+    Returns:
+        One row per changed file with coverage data (see `PATCH_COVERAGE_COLUMNS`).
+    """
+    records = []
+    for pr_file in pr_files:
+        if pr_file.get("status") == "removed" or not pr_file.get("patch"):
+            continue
+        file_coverage = coverage_data.get(pr_file["filename"].removeprefix(path_prefix))
+        if file_coverage is None:
+            continue
+
+        ranges = added_line_ranges(pr_file["patch"])
+        added = LineBitmap.from_ranges([start for start, _ in ranges], [end for _, end in ranges])
+        covered = added & file_coverage["executed_lines"]
+        uncovered = added & file_coverage["missing_lines"]
+        executable = len(covered) + len(uncovered)
+        records.append(
+            {
+                "path": pr_file["filename"],
+                "added_lines": len(added),
+                "executable_lines": executable,
+                "covered_lines": len(covered),
+                "uncovered_lines": len(uncovered),
+                "patch_coverage_pct": len(covered) / executable * 100 if executable else None,
+                "uncovered_line_ranges": format_line_ranges(uncovered),
+            }
+        )
+    return pd.DataFrame(records, columns=PATCH_COVERAGE_COLUMNS)
+
+
+def display_patch_coverage(
+    pr_files: Iterable[dict[str, Any]],
+    line_coverage: dict[str, dict[str, Any]],
+    path_prefix: str,
+) -> None:
+    """Display the coverage of the lines added or changed by a PR.
+
+    Args:
+        pr_files: Changed files of the PR as returned by `fetch_pull_request_files_payload`.
+        line_coverage: Normalized line coverage of the PR head commit by path.
+        path_prefix: Prefix of the repository paths that the coverage paths don't have, e.g. `lib/`.
+    """
+    st.subheader("Patch Coverage")
+    st.caption(
+        "Coverage of the executable lines the PR adds or changes, based on the PR diff and the line coverage of the "
+        "PR head commit. Lines that aren't executable (comments, blank lines, ...) are ignored."
+    )
+
+    patch_df = compute_patch_coverage(pr_files, line_coverage, path_prefix=path_prefix)
+    executable_lines = patch_df["executable_lines"].sum()
+    if executable_lines == 0:
+        st.info("The PR doesn't change any executable lines of files with coverage data.")
+        return
+
+    covered_lines = patch_df["covered_lines"].sum()
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Patch Coverage", f"{covered_lines / executable_lines * 100:.2f}%")
+    col2.metric("Covered Changed Lines", covered_lines)
+    col3.metric("Uncovered Changed Lines", executable_lines - covered_lines)
+
+    st.dataframe(
+        patch_df.sort_values(["uncovered_lines", "path"], ascending=[False, True]),
+        column_config={
+            "path": st.column_config.TextColumn("File", pinned=True),
+            "added_lines": st.column_config.NumberColumn("Changed Lines"),
+            "executable_lines": st.column_config.NumberColumn("Executable"),
+            "covered_lines": st.column_config.NumberColumn("Covered"),
+            "uncovered_lines": st.column_config.NumberColumn("Uncovered"),
+            "patch_coverage_pct": st.column_config.ProgressColumn(
+                "Patch Coverage %",
+                format="%.1f%%",
+                min_value=0,
+                max_value=100,
+            ),
+            "uncovered_line_ranges": st.column_config.TextColumn("Uncovered Lines"),
+        },
+        hide_index=True,
+    )
@@ -0,0 +1,197 @@
+import shutil
+import threading
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from mimetypes import guess_type
+from typing import Any, cast
+from urllib.parse import quote, unquote, urlsplit
+from zipfile import ZipFile
+
+import streamlit as st
+
+from app.utils.github_utils import download_artifact, fetch_artifacts
+
+# The server is only reachable from this machine, so local serving only works if
+# the app runs locally. Deployed apps publish the reports to smokeshow instead.
+REPORT_SERVER_HOST = "127.0.0.1"
+# Reports are kept in memory, the least recently opened ones are dropped first.
+REPORT_SERVER_MAX_REPORTS = 8
+# Report IDs are artifact IDs and artifacts never change, so browsers can cache files forever.
+_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+_COPY_CHUNK_SIZE = 1 << 16
+
+
+class _ReportHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], report_server: "CoverageReportServer") -> None:
+        super().__init__(address, _ReportRequestHandler)
+        self.report_server = report_server
+
+
+class _ReportRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        """Serve a report file."""
+        self._serve(send_body=True)
+
+    def do_HEAD(self) -> None:
+        """Serve the headers of a report file."""
+        self._serve(send_body=False)
+
+    def log_message(self, format: str, *args: Any) -> None:  # ruff:ignore[builtin-argument-shadowing]
+        """Don't log every request."""
+
+    def _serve(self, *, send_body: bool) -> None:
+        report_id, _, member_path = unquote(urlsplit(self.path).path).lstrip("/").partition("/")
+        report_server = cast("_ReportHTTPServer", self.server).report_server
+        zip_file = report_server.get_report(report_id)
+        if zip_file is None:
+            self.send_error(HTTPStatus.NOT_FOUND, "Unknown report")
+            return
+        if not member_path or member_path.endswith("/"):
+            member_path += "index.html"
+        try:
+            info = zip_file.getinfo(member_path)
+        except KeyError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found in report")
+            return
+
+        etag = f'"{report_id}-{info.CRC:08x}-{info.file_size}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", _IMMUTABLE_CACHE_CONTROL)
+            self.end_headers()
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", guess_type(member_path)[0] or "application/octet-stream")
+        self.send_header("Content-Length", str(info.file_size))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", _IMMUTABLE_CACHE_CONTROL)
+        self.end_headers()
+        if send_body:
+            # Only the requested file is decompressed, in chunks.
+            with zip_file.open(info) as member:
+                shutil.copyfileobj(member, self.wfile, _COPY_CHUNK_SIZE)
+
+
+class CoverageReportServer:
+    """HTTP server that serves zipped HTML reports straight from memory.
+
+    Files are decompressed from the artifact zip when they are requested, with
+    caching headers, so opening a report needs neither extracting nor uploading it.
+
+    Example:
+        >>> server = CoverageReportServer()
+        >>> url = server.add_report("1234", artifact_content)
+    """
+
+    def __init__(
+        self, host: str = REPORT_SERVER_HOST, port: int = 0, max_reports: int = REPORT_SERVER_MAX_REPORTS
+    ) -> None:
+        self._reports: OrderedDict[str, ZipFile] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_reports = max_reports
+        self._httpd = _ReportHTTPServer((host, port), self)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="coverage-report-server", daemon=True)
+        self._thread.start()
+
+    @property
+    def base_url(self) -> str:
+        """URL of the server, e.g. http://127.0.0.1:43210."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def report_url(self, report_id: str) -> str | None:
+        """Return the URL of the index page of a report, None if it isn't served (anymore)."""
+        if self.get_report(report_id) is None:
+            return None
+        return self._index_url(report_id)
+
+    def _index_url(self, report_id: str) -> str:
+        return f"{self.base_url}/{quote(report_id, safe='')}/index.html"
+
+    def get_report(self, report_id: str) -> ZipFile | None:
+        """Return the zip of a served report and mark it as recently used."""
+        with self._lock:
+            zip_file = self._reports.get(report_id)
+            if zip_file is not None:
+                self._reports.move_to_end(report_id)
+            return zip_file
+
+    def add_report(self, report_id: str, artifact_content: bytes) -> str:
+        """Serve a zipped HTML report and return the URL of its index page.
+
+        Args:
+            report_id: Unique ID of the report content, e.g. the artifact ID.
+            artifact_content: The zipped report.
+        """
+        zip_file = ZipFile(BytesIO(artifact_content))
+        with self._lock:
+            self._reports[report_id] = zip_file
+            self._reports.move_to_end(report_id)
+            while len(self._reports) > self._max_reports:
+                # Don't close the evicted zip: handlers that already got it from `get_report` may not have
+                # opened their file yet. It only wraps bytes in memory and is freed once they are done.
+                self._reports.popitem(last=False)
+        return self._index_url(report_id)
+
+    def close(self) -> None:
+        """Stop the server and drop all reports."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        with self._lock:
+            for zip_file in self._reports.values():
+                zip_file.close()
+            self._reports.clear()
+
+
+@st.cache_resource(show_spinner=False)
+def get_report_server() -> CoverageReportServer:
+    """Return the report server of this app process, starting it on first use."""
+    return CoverageReportServer()
+
+
+def serve_reports_locally_toggle() -> bool:
+    """Show the sidebar toggle that chooses between serving reports locally and publishing them to smokeshow."""
+    return st.sidebar.toggle(
+        "Serve HTML reports locally",
+        value=not st.secrets.get("smokeshow_auth_key"),
+        help="Serve the HTML coverage reports from this app instead of publishing them to smokeshow. "
+        "This is much faster and needs no smokeshow key, but only works if the app runs on your machine.",
+    )
+
+
+def serve_coverage_report(run_id: int, artifact_name: str) -> str | None:
+    """Serve the HTML coverage report of a workflow run from the local report server, without uploading it.
+
+    Args:
+        run_id: ID of the workflow run.
+        artifact_name: Name of the artifact with the zipped HTML report.
+
+    Returns:
+        The URL of the index page of the report, None if the report isn't available.
+    """
+    artifacts = fetch_artifacts(run_id)
+    html_report_artifact = next((artifact for artifact in artifacts if artifact["name"] == artifact_name), None)
+
+    if not html_report_artifact:
+        st.error("No HTML coverage report found for this run.")
+        return None
+
+    report_server = get_report_server()
+    report_id = str(html_report_artifact["id"])
+    report_url = report_server.report_url(report_id)
+    if report_url:
+        return report_url
+
+    artifact_content = download_artifact(html_report_artifact["archive_download_url"])
+
+    if not artifact_content:
+        st.error("Failed to download the HTML coverage report.")
+        return None
+
+    return report_server.add_report(report_id, artifact_content)
@@ -1,8 +1,15 @@
 import asyncio
-import tempfile
+import hashlib
+import json
+import posixpath
+import re
+import threading
+import time
+from collections.abc import Iterable, Mapping
 from io import BytesIO
 from mimetypes import guess_type
-from pathlib import Path
+from pathlib import Path, PurePosixPath
+from typing import Any, NamedTuple
 from zipfile import ZipFile
 
 import httpx
@@ -15,101 +22,270 @@ SMOKESHOW_REQUEST_RETRIES = 5
 SMOKESHOW_DEFAULT_TIMEOUT = 50  # seconds
 SMOKESHOW_UPLOAD_TIMEOUT = 400  # seconds
 SMOKESHOW_MAX_CONCURRENT_UPLOADS = 20
+# Sites created by previous uploads (the shared asset site and whole reports) are
+# reused for this long, well within the lifetime of an ephemeral smokeshow site.
+SMOKESHOW_SITE_REUSE_SECONDS = 24 * 60 * 60
+SMOKESHOW_STATE_PATH = Path(".cache/smokeshow/state.json")
+
+# Static files of the HTML reports (styles, scripts, images) are the same for most
+# runs. They are uploaded once, by content hash, to a shared site that the pages link to.
+_SHARED_ASSET_SUFFIXES = frozenset({".css", ".js", ".png", ".gif", ".svg", ".ico", ".woff", ".woff2"})
+# Relative href/src attribute values, absolute URLs contain a colon.
+_ASSET_REFERENCE = re.compile(rb"""(?P<attr>\b(?:href|src)=(?P<quote>["']))(?P<ref>[^"'#?:]+)""")
+# Relative url() references of stylesheets, e.g. url(sort-arrow-sprite.png).
+_CSS_URL_REFERENCE = re.compile(rb"""(?P<attr>\burl\(\s*(?P<quote>["']?))(?P<ref>[^"'()#?:\s]+)""")
+
+_state_lock = threading.Lock()
+
+
+class ReportFile(NamedTuple):
+    """A file of an HTML report artifact."""
+
+    path: str
+    digest: str  # SHA-256 of the content
+
+
+def hash_report_files(zip_file: ZipFile) -> list[ReportFile]:
+    """Hash every file of a report, streaming the content from the zip."""
+    files = []
+    for info in zip_file.infolist():
+        if info.is_dir():
+            continue
+        digest = hashlib.sha256()
+        with zip_file.open(info) as member:
+            while chunk := member.read(1 << 16):
+                digest.update(chunk)
+        files.append(ReportFile(info.filename, digest.hexdigest()))
+    return files
+
+
+def report_digest(files: Iterable[ReportFile]) -> str:
+    """Content hash of a whole report, identical reports have the same digest."""
+    digest = hashlib.sha256()
+    for file in sorted(files):
+        digest.update(f"{file.path}\0{file.digest}\n".encode())
+    return digest.hexdigest()
+
+
+def is_shared_asset(path: str) -> bool:
+    """Return whether a report file is served from the shared asset site."""
+    return PurePosixPath(path).suffix.lower() in _SHARED_ASSET_SUFFIXES
+
+
+def shared_asset_path(file: ReportFile) -> str:
+    """Content-addressed path of a report file on the shared asset site."""
+    return file.digest[:32] + PurePosixPath(file.path).suffix.lower()
+
+
+def _rewrite_references(
+    content: bytes, file_path: str, asset_urls: Mapping[str, str], pattern: re.Pattern[bytes]
+) -> bytes:
+    file_dir = posixpath.dirname(file_path)
+
+    def replace(match: re.Match[bytes]) -> bytes:
+        target = posixpath.normpath(posixpath.join(file_dir, match["ref"].decode(errors="replace")))
+        url = asset_urls.get(target)
+        return match.group() if url is None else match["attr"] + url.encode()
+
+    return pattern.sub(replace, content)
+
+
+def rewrite_asset_references(html: bytes, page_path: str, asset_urls: Mapping[str, str]) -> bytes:
+    """Point the relative links of a report page to shared assets at their absolute URLs.
+
+    Args:
+        html: Content of the page.
+        page_path: Path of the page in the report, relative links are resolved against it.
+        asset_urls: Absolute URL of every shared asset by its path in the report.
+    """
+    return _rewrite_references(html, page_path, asset_urls, _ASSET_REFERENCE)
+
+
+def rewrite_stylesheet_references(css: bytes, stylesheet_path: str, asset_urls: Mapping[str, str]) -> bytes:
+    """Point the relative `url()` references of a stylesheet to shared assets at their absolute URLs.
+
+    Shared stylesheets are served under content-hashed names, so references to
+    the original file names next to them would break.
+    """
+    return _rewrite_references(css, stylesheet_path, asset_urls, _CSS_URL_REFERENCE)
+
+
+def _is_stylesheet(path: str) -> bool:
+    return path.lower().endswith(".css")
+
+
+def _read_report_file(zip_file: ZipFile, path: str, asset_urls: Mapping[str, str]) -> bytes:
+    content = zip_file.read(path)
+    if path.endswith((".html", ".htm")):
+        content = rewrite_asset_references(content, path, asset_urls)
+    elif _is_stylesheet(path):
+        content = rewrite_stylesheet_references(content, path, asset_urls)
+    return content
+
+
+def _hash_stylesheets(zip_file: ZipFile, paths: Iterable[str], asset_urls: Mapping[str, str]) -> list[ReportFile]:
+    # Stylesheets are stored under the hash of their rewritten content, which depends on the referenced assets.
+    return [
+        ReportFile(path, hashlib.sha256(_read_report_file(zip_file, path, asset_urls)).hexdigest()) for path in paths
+    ]
+
+
+def load_smokeshow_state(path: Path = SMOKESHOW_STATE_PATH) -> dict[str, Any]:
+    """Load the persisted shared asset site and deployed reports, or an empty state if there is none yet."""
+    state: dict[str, Any] = {"asset_site": None, "reports": {}}
+    if not path.exists():
+        return state
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            state.update(json.load(f))
+    except (OSError, TypeError, ValueError):
+        pass
+    return state
+
+
+def save_smokeshow_state(state: dict[str, Any], path: Path = SMOKESHOW_STATE_PATH) -> None:
+    """Persist the shared asset site and deployed reports atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump(state, f)
+    tmp_path.replace(path)
+
+
+def _is_reusable(site: dict[str, Any] | None, now: float) -> bool:
+    return site is not None and now - site["created_at"] < SMOKESHOW_SITE_REUSE_SECONDS
 
 
 @st.cache_data(show_spinner=False)
-def extract_and_upload_coverage_report(artifact_content: bytes) -> str | None:
-    """Extract coverage HTML report from artifact and upload to smokeshow."""
-    # Create a temporary directory to extract files
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
+def upload_coverage_report(artifact_content: bytes) -> str | None:
+    """Upload the coverage HTML report of an artifact to smokeshow."""
+    try:
+        return asyncio.run(upload_to_smokeshow(artifact_content))
+    except Exception as e:
+        st.error(f"Error processing coverage report: {e}")
+        return None
 
-        try:
-            with ZipFile(BytesIO(artifact_content)) as zip_file:
-                # Extract all HTML files
-                for file in zip_file.namelist():
-                    zip_file.extract(file, temp_path)
 
-                # Upload the directory to smokeshow
-                url = asyncio.run(upload_to_smokeshow(temp_path))
-                return url
-        except Exception as e:
-            st.error(f"Error processing coverage report: {e}")
-            return None
+async def _create_site(client: httpx.AsyncClient, auth_key: str) -> dict[str, Any]:
+    try:
+        r = await client.post(
+            SMOKESHOW_ROOT_URL + "/create/",
+            headers={"Authorisation": auth_key, "User-Agent": SMOKESHOW_USER_AGENT},
+        )
+    except httpx.HTTPError as err:
+        msg = f"Error creating ephemeral site {err}"
+        raise ValueError(msg) from err
+
+    if r.status_code != 200:
+        msg = f"Error creating ephemeral site {r.status_code}, response:\n{r.text}"
+        raise ValueError(msg)
+
+    obj = r.json()
+    return {"url": obj["url"], "secret_key": obj["secret_key"], "created_at": time.time(), "assets": []}
 
 
-async def upload_to_smokeshow(directory_path: Path) -> str:
-    """Upload a directory to smokeshow and return the URL."""
+async def upload_to_smokeshow(artifact_content: bytes, state_path: Path = SMOKESHOW_STATE_PATH) -> str:
+    """Upload a zipped HTML report to smokeshow and return the URL.
+
+    Files are streamed from the zip, and read and hashed off the event loop. A
+    report that was already uploaded isn't uploaded again, and static assets
+    are only uploaded to the shared asset site if they aren't there yet.
+    """
     auth_key = st.secrets.get("smokeshow_auth_key")
     if not auth_key:
         msg = "Smokeshow auth key not found in secrets"
         raise ValueError(msg)
 
-    transport = httpx.AsyncHTTPTransport(retries=SMOKESHOW_REQUEST_RETRIES)
-    async with httpx.AsyncClient(
-        timeout=SMOKESHOW_DEFAULT_TIMEOUT,
-        transport=transport,
-    ) as client:
-        try:
-            r = await client.post(
-                SMOKESHOW_ROOT_URL + "/create/",
-                headers={"Authorisation": auth_key, "User-Agent": SMOKESHOW_USER_AGENT},
+    with ZipFile(BytesIO(artifact_content)) as zip_file:
+        files = await asyncio.to_thread(hash_report_files, zip_file)
+        digest = report_digest(files)
+        with _state_lock:
+            state = load_smokeshow_state(state_path)
+        now = time.time()
+        deployed_report = state["reports"].get(digest)
+        if _is_reusable(deployed_report, now):
+            return deployed_report["url"]
+
+        transport = httpx.AsyncHTTPTransport(retries=SMOKESHOW_REQUEST_RETRIES)
+        async with httpx.AsyncClient(
+            timeout=SMOKESHOW_DEFAULT_TIMEOUT,
+            transport=transport,
+        ) as client:
+            asset_site = state["asset_site"]
+            if not _is_reusable(asset_site, now):
+                asset_site = await _create_site(client, auth_key)
+            report_site = await _create_site(client, auth_key)
+
+            assets = [file for file in files if is_shared_asset(file.path) and not _is_stylesheet(file.path)]
+            asset_urls = {file.path: asset_site["url"] + shared_asset_path(file) for file in assets}
+            stylesheets = await asyncio.to_thread(
+                _hash_stylesheets,
+                zip_file,
+                [file.path for file in files if is_shared_asset(file.path) and _is_stylesheet(file.path)],
+                asset_urls,
             )
-        except httpx.HTTPError as err:
-            msg = f"Error creating ephemeral site {err}"
-            raise ValueError(msg) from err
-
-        if r.status_code != 200:
-            msg = f"Error creating ephemeral site {r.status_code}, response:\n{r.text}"
-            raise ValueError(msg)
-
-        obj = r.json()
-        secret_key: str = obj["secret_key"]
-        upload_root: str = obj["url"]
-
-        # Create a list of files to upload
-        files_to_upload = [(p, p.relative_to(directory_path)) for p in directory_path.glob("**/*") if p.is_file()]  # ruff:ignore[blocking-path-method-in-async-function]
-
-        # Create a semaphore to limit concurrent uploads to 60
-        semaphore = asyncio.Semaphore(SMOKESHOW_MAX_CONCURRENT_UPLOADS)
-
-        # Define a wrapper function that uses the semaphore
-        async def upload_with_semaphore(file_path: Path, rel_path: Path) -> None:
-            async with semaphore:
-                await _upload_file(
-                    client,
-                    secret_key,
-                    upload_root,
-                    file_path,
-                    rel_path,
-                    SMOKESHOW_UPLOAD_TIMEOUT,
-                )
-
-        # Create and schedule all tasks
-        tasks = [
-            asyncio.create_task(upload_with_semaphore(file_path, rel_path)) for file_path, rel_path in files_to_upload
-        ]
+            assets += stylesheets
+            asset_urls.update({file.path: asset_site["url"] + shared_asset_path(file) for file in stylesheets})
+            uploaded_assets = set(asset_site["assets"])
+            new_assets = {
+                shared_asset_path(file): file.path for file in assets if shared_asset_path(file) not in uploaded_assets
+            }
+            report_pages = [file.path for file in files if not is_shared_asset(file.path)]
+
+            # Create a semaphore to limit concurrent uploads
+            semaphore = asyncio.Semaphore(SMOKESHOW_MAX_CONCURRENT_UPLOADS)
+
+            async def upload_with_semaphore(site: dict[str, Any], url_path: str, report_path: str) -> None:
+                async with semaphore:
+                    content = await asyncio.to_thread(_read_report_file, zip_file, report_path, asset_urls)
+                    await _upload_file(
+                        client,
+                        site["secret_key"],
+                        site["url"],
+                        url_path,
+                        content,
+                        SMOKESHOW_UPLOAD_TIMEOUT,
+                    )
 
+            tasks = [
+                *(
+                    asyncio.create_task(upload_with_semaphore(asset_site, url_path, report_path))
+                    for url_path, report_path in new_assets.items()
+                ),
+                *(asyncio.create_task(upload_with_semaphore(report_site, path, path)) for path in report_pages),
+            ]
+
+            try:
+                await asyncio.gather(*tasks)
+            except Exception as e:
+                st.error(f"Error uploading files: {e}")
+                raise
+
+    with _state_lock:
+        state = load_smokeshow_state(state_path)
+        if state["asset_site"] is not None and state["asset_site"]["url"] == asset_site["url"]:
+            uploaded_assets.update(state["asset_site"]["assets"])
+        state["asset_site"] = {**asset_site, "assets": sorted(uploaded_assets | new_assets.keys())}
+        state["reports"] = {report: site for report, site in state["reports"].items() if _is_reusable(site, now)} | {
+            digest: {"url": report_site["url"], "created_at": report_site["created_at"]}
+        }
         try:
-            await asyncio.gather(*tasks)
-        except Exception as e:
-            st.error(f"Error uploading files: {e}")
-            raise
+            save_smokeshow_state(state, state_path)
+        except OSError as ex:
+            print(f"Failed to persist the smokeshow state: {ex}")
 
-        return upload_root
+    return report_site["url"]
 
 
 async def _upload_file(
     client: httpx.AsyncClient,
     secret_key: str,
     upload_root: str,
-    file_path: Path,
-    rel_path: Path,
+    url_path: str,
+    content: bytes,
     timeout: int,  # ruff:ignore[async-function-with-timeout]
 ) -> None:
     """Upload a single file to smokeshow."""
-    url_path = str(rel_path)
-
     headers = {"Authorisation": secret_key, "User-Agent": SMOKESHOW_USER_AGENT}
 
     ct = guess_type(url_path)[0]
@@ -119,7 +295,7 @@ async def _upload_file(
     try:
         response = await client.post(
             upload_root + url_path,
-            content=file_path.read_bytes(),  # ruff:ignore[blocking-path-method-in-async-function]
+            content=content,
             headers=headers,
             timeout=timeout,
         )
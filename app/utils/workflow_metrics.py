@@ -0,0 +1,368 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from datetime import date, datetime, timedelta
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+from zipfile import ZipFile
+
+import numpy as np
+import pandas as pd
+
+from app.utils.coverage_parsers import (
+    find_coverage_summary_json,
+    read_python_coverage_summaries,
+    summarize_python_coverage_totals,
+)
+from app.utils.github_utils import download_artifact, fetch_artifacts, fetch_workflow_runs
+from app.utils.json_stream import JsonScanner
+from app.utils.load_test_history import load_runs_concurrently
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+    import numpy.typing as npt
+
+# Per-run KPIs of the develop workflows (coverage, package sizes, test counts). Every
+# KPI is extracted from the artifacts of a run once, by whichever page processes the
+# run first or by the background sync, and window queries are answered from this table.
+WORKFLOW_METRICS_PATH: Final[Path] = Path(".cache/workflow_metrics/metrics.parquet")
+WORKFLOW_METRICS_COLUMNS: Final[list[str]] = ["workflow", "run_id", "created_at", "metric", "value"]
+
+PYTHON_COVERAGE: Final[str] = "python_coverage_pct"
+FRONTEND_COVERAGE: Final[str] = "frontend_coverage_pct"
+WHEEL_SIZE: Final[str] = "wheel_size_bytes"
+BUNDLE_TOTAL_GZIP: Final[str] = "bundle_total_gzip_bytes"
+BUNDLE_ENTRY_GZIP: Final[str] = "bundle_entry_gzip_bytes"
+PLAYWRIGHT_TEST_COUNT: Final[str] = "playwright_test_count"
+
+# The longest timeframe of the interrupt rotation dashboard.
+SYNC_LOOKBACK_DAYS: Final[int] = 14
+# Listing runs is cheap, only the runs at window boundaries are downloaded.
+SYNC_RUN_LIMIT: Final[int] = 500
+# Minimum time between two background syncs that weren't explicitly requested.
+SYNC_INTERVAL_SECONDS: Final[int] = 30 * 60
+
+_lock = threading.Lock()
+
+
+class _SyncState:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.thread: threading.Thread | None = None
+        self.last_started = float("-inf")
+
+
+_sync_state = _SyncState()
+
+
+def _find_artifact(artifacts: Sequence[dict[str, Any]], name_prefix: str) -> dict[str, Any] | None:
+    return next((artifact for artifact in artifacts if artifact["name"].startswith(name_prefix)), None)
+
+
+def _open_artifact(artifact: dict[str, Any]) -> ZipFile | None:
+    content = download_artifact(artifact["archive_download_url"])
+    return ZipFile(BytesIO(content)) if content else None
+
+
+def _first_json_file(file_list: Sequence[str]) -> str | None:
+    return next((name for name in file_list if name.endswith(".json")), None)
+
+
+def extract_python_tests_metrics(artifacts: Sequence[dict[str, Any]]) -> dict[str, float] | None:
+    """Extract the line coverage from the `combined_coverage_json` artifact of a python-tests.yml run."""
+    artifact = _find_artifact(artifacts, "combined_coverage_json")
+    if artifact is None:
+        return {PYTHON_COVERAGE: np.nan}
+    zip_file = _open_artifact(artifact)
+    if zip_file is None:
+        return None
+    with zip_file, zip_file.open("coverage.json") as f:
+        totals, file_summaries = read_python_coverage_summaries(f)
+    return {PYTHON_COVERAGE: summarize_python_coverage_totals(totals, len(file_summaries))["coverage_pct"]}
+
+
+def extract_js_tests_metrics(artifacts: Sequence[dict[str, Any]]) -> dict[str, float] | None:
+    """Extract the line coverage from the `vitest_coverage_json` artifact of a js-tests.yml run."""
+    artifact = _find_artifact(artifacts, "vitest_coverage_json")
+    if artifact is None:
+        return {FRONTEND_COVERAGE: np.nan}
+    zip_file = _open_artifact(artifact)
+    if zip_file is None:
+        return None
+    with zip_file:
+        json_file = find_coverage_summary_json(zip_file.namelist())
+        if json_file is None:
+            return {FRONTEND_COVERAGE: np.nan}
+        with zip_file.open(json_file) as f:
+            # Only the totals are decoded, not the summary of every file.
+            scanner = JsonScanner(f)
+            for key in scanner.iter_object():
+                if key == "total":
+                    return {FRONTEND_COVERAGE: scanner.read_value()["lines"]["pct"]}
+    return {FRONTEND_COVERAGE: np.nan}
+
+
+def extract_pr_preview_metrics(artifacts: Sequence[dict[str, Any]]) -> dict[str, float] | None:
+    """Extract the wheel size and gzipped bundle sizes from the artifacts of a pr-preview.yml run."""
+    wheel = _find_artifact(artifacts, "whl_file")
+    metrics = {
+        WHEEL_SIZE: wheel["size_in_bytes"] if wheel else np.nan,
+        BUNDLE_TOTAL_GZIP: np.nan,
+        BUNDLE_ENTRY_GZIP: np.nan,
+    }
+    artifact = _find_artifact(artifacts, "bundle_analysis_json")
+    if artifact is None:
+        return metrics
+    zip_file = _open_artifact(artifact)
+    if zip_file is None:
+        return None
+    with zip_file:
+        json_file = _first_json_file(zip_file.namelist())
+        if json_file is None:
+            return metrics
+        with zip_file.open(json_file) as f:
+            bundle_data = json.load(f)
+    metrics[BUNDLE_TOTAL_GZIP] = sum(item.get("gzipSize", 0) for item in bundle_data)
+    metrics[BUNDLE_ENTRY_GZIP] = sum(item.get("gzipSize", 0) for item in bundle_data if item.get("isEntry"))
+    return metrics
+
+
+def extract_playwright_metrics(artifacts: Sequence[dict[str, Any]]) -> dict[str, float] | None:
+    """Extract the number of E2E tests from the `playwright_test_stats` artifact of a playwright.yml run."""
+    artifact = _find_artifact(artifacts, "playwright_test_stats")
+    if artifact is None:
+        return {PLAYWRIGHT_TEST_COUNT: np.nan}
+    zip_file = _open_artifact(artifact)
+    if zip_file is None:
+        return None
+    with zip_file:
+        json_file = _first_json_file(zip_file.namelist())
+        if json_file is None:
+            return {PLAYWRIGHT_TEST_COUNT: np.nan}
+        with zip_file.open(json_file) as f:
+            stats = json.load(f)
+    return {PLAYWRIGHT_TEST_COUNT: stats.get("summary", {}).get("total_tests", 0)}
+
+
+# Extracts all metrics of a workflow from the artifacts of one of its runs. A missing
+# artifact yields NaN values (the run is not looked at again), a failed download None.
+WORKFLOW_METRIC_EXTRACTORS: Final[dict[str, Callable[[Sequence[dict[str, Any]]], dict[str, float] | None]]] = {
+    "python-tests.yml": extract_python_tests_metrics,
+    "js-tests.yml": extract_js_tests_metrics,
+    "pr-preview.yml": extract_pr_preview_metrics,
+    "playwright.yml": extract_playwright_metrics,
+}
+WORKFLOW_METRICS: Final[dict[str, tuple[str, ...]]] = {
+    "python-tests.yml": (PYTHON_COVERAGE,),
+    "js-tests.yml": (FRONTEND_COVERAGE,),
+    "pr-preview.yml": (WHEEL_SIZE, BUNDLE_TOTAL_GZIP, BUNDLE_ENTRY_GZIP),
+    "playwright.yml": (PLAYWRIGHT_TEST_COUNT,),
+}
+
+
+def workflow_metrics_frame(
+    workflow: str, run_ids: Sequence[int], created_at: Sequence[datetime], metrics: Mapping[str, npt.ArrayLike]
+) -> pd.DataFrame:
+    """Build the rows of the metrics table for some runs of a workflow.
+
+    Args:
+        workflow: File name of the workflow, e.g. python-tests.yml.
+        run_ids: IDs of the workflow runs.
+        created_at: When each workflow run was created.
+        metrics: Value of each run by metric name, NaN if the run has no value.
+    """
+    num_runs = len(run_ids)
+    return pd.DataFrame(
+        {
+            "workflow": pd.Series([workflow] * num_runs * len(metrics), dtype=str),
+            "run_id": np.tile(np.asarray(run_ids, dtype=np.int64), len(metrics)),
+            "created_at": pd.Series(list(created_at) * len(metrics), dtype="datetime64[us]"),
+            "metric": pd.Series([metric for metric in metrics for _ in range(num_runs)], dtype=str),
+            "value": np.concatenate([np.asarray(values, dtype=np.float64) for values in metrics.values()])
+            if metrics
+            else np.empty(0),
+        },
+        columns=WORKFLOW_METRICS_COLUMNS,
+    )
+
+
+def _empty_metrics() -> pd.DataFrame:
+    return workflow_metrics_frame("", [], [], {})
+
+
+def load_workflow_metrics(path: Path = WORKFLOW_METRICS_PATH) -> pd.DataFrame:
+    """Load the persisted metrics table, or an empty table if there is none yet."""
+    if not path.exists():
+        return _empty_metrics()
+    try:
+        return pd.read_parquet(path, columns=WORKFLOW_METRICS_COLUMNS)
+    except (OSError, ValueError) as ex:
+        print(f"Failed to read the workflow metrics {path}: {ex}")
+        return _empty_metrics()
+
+
+def save_workflow_metrics(metrics: pd.DataFrame, path: Path = WORKFLOW_METRICS_PATH) -> None:
+    """Persist the metrics table atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    metrics.to_parquet(tmp_path, index=False)
+    tmp_path.replace(path)
+
+
+def record_workflow_metrics(new_rows: pd.DataFrame, path: Path = WORKFLOW_METRICS_PATH) -> pd.DataFrame:
+    """Add new rows to the persisted metrics table.
+
+    Metrics that are already known for a run are kept as they are.
+
+    Returns:
+        The updated table, sorted by run.
+    """
+    with _lock:
+        metrics = load_workflow_metrics(path)
+        known = pd.MultiIndex.from_frame(metrics[["run_id", "metric"]])
+        new_rows = new_rows[~pd.MultiIndex.from_frame(new_rows[["run_id", "metric"]]).isin(known)]
+        new_rows = new_rows.drop_duplicates(["run_id", "metric"])
+        if new_rows.empty:
+            return metrics
+        metrics = pd.concat([metrics, new_rows[WORKFLOW_METRICS_COLUMNS]], ignore_index=True)
+        metrics = metrics.sort_values(["workflow", "created_at", "run_id", "metric"], ignore_index=True)
+        try:
+            save_workflow_metrics(metrics, path)
+        except OSError as ex:
+            print(f"Failed to persist the workflow metrics {path}: {ex}")
+        return metrics
+
+
+def record_run_metrics(
+    workflow: str, runs: pd.DataFrame, columns: Mapping[str, str], path: Path = WORKFLOW_METRICS_PATH
+) -> None:
+    """Record metrics that a page already computed per run, so they are not extracted again.
+
+    Args:
+        workflow: File name of the workflow of the runs.
+        runs: One row per run with `run_id` and `created_at` columns.
+        columns: Name of the column with the values of each metric.
+        path: Path of the metrics table.
+    """
+    record_workflow_metrics(
+        workflow_metrics_frame(
+            workflow,
+            runs["run_id"].to_list(),
+            # Pages parse the creation times of runs as naive or as UTC timestamps.
+            pd.to_datetime(runs["created_at"], utc=True).dt.tz_localize(None).to_list(),
+            {metric: runs[column].to_numpy() for metric, column in columns.items()},
+        ),
+        path,
+    )
+
+
+def metric_window(metrics: pd.DataFrame, metric: str, since: date) -> tuple[float, float] | None:
+    """Return the latest value of a metric and its change since the start of a window.
+
+    The change is measured from the first run created after the day `since`, like
+    the `created:>since` filter of the run listing that the sync uses. If no run
+    has a value in the window, the latest value is returned with no change.
+
+    Returns:
+        The latest value and the change, None if the metric has no value at all.
+    """
+    values = metrics[(metrics["metric"] == metric) & metrics["value"].notna()]
+    if values.empty:
+        return None
+    values = values.sort_values(["created_at", "run_id"])
+    latest = float(values["value"].iloc[-1])
+    in_window = values[values["created_at"] >= pd.Timestamp(since + timedelta(days=1))]
+    if in_window.empty:
+        return latest, 0.0
+    return latest, latest - float(in_window["value"].iloc[0])
+
+
+def _parse_created_at(run: dict[str, Any]) -> datetime:
+    return datetime.strptime(run["created_at"], "%Y-%m-%dT%H:%M:%SZ")
+
+
+def window_boundary_runs(runs: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Select the runs needed to answer window queries for any start day: the latest run and the first run of each day.
+
+    Args:
+        runs: Workflow runs as returned by the GitHub API, in any order.
+    """
+    by_created_at = sorted(runs, key=_parse_created_at)
+    first_of_day = {}
+    for run in reversed(by_created_at):
+        first_of_day[_parse_created_at(run).date()] = run
+    selected = {run["id"]: run for run in first_of_day.values()}
+    if by_created_at:
+        selected[by_created_at[-1]["id"]] = by_created_at[-1]
+    return list(selected.values())
+
+
+def sync_workflow_metrics(
+    workflow: str, today: date | None = None, path: Path = WORKFLOW_METRICS_PATH
+) -> tuple[int, dict[int, str]]:
+    """Extract the metrics of the window boundary runs of a workflow that aren't in the table yet.
+
+    Returns:
+        The number of runs that were added and the error messages of failed runs by run ID.
+    """
+    since = (today or date.today()) - timedelta(days=SYNC_LOOKBACK_DAYS)
+    runs = fetch_workflow_runs(workflow, limit=SYNC_RUN_LIMIT, since=since)
+    if not runs:
+        # Nothing ran in the lookback, the latest run still gives the current values.
+        runs = fetch_workflow_runs(workflow, limit=1)
+    metric_names = WORKFLOW_METRICS[workflow]
+    known = load_workflow_metrics(path)
+    known_metrics = known[known["metric"].isin(metric_names)].groupby("run_id")["metric"].nunique()
+    complete_runs = set(known_metrics[known_metrics == len(metric_names)].index)
+    missing_runs = [run for run in window_boundary_runs(runs) if run["id"] not in complete_runs]
+    if not missing_runs:
+        return 0, {}
+
+    extract = WORKFLOW_METRIC_EXTRACTORS[workflow]
+    results, failures = load_runs_concurrently(missing_runs, lambda run: extract(fetch_artifacts(run["id"])))
+    extracted = [run for run in missing_runs if run["id"] in results]
+    record_workflow_metrics(
+        workflow_metrics_frame(
+            workflow,
+            [run["id"] for run in extracted],
+            [_parse_created_at(run) for run in extracted],
+            {metric: [results[run["id"]][metric] for run in extracted] for metric in metric_names},
+        ),
+        path,
+    )
+    return len(extracted), failures
+
+
+def _sync_all_workflows() -> None:
+    for workflow in WORKFLOW_METRIC_EXTRACTORS:
+        try:
+            _, failures = sync_workflow_metrics(workflow)
+        except Exception as ex:
+            print(f"Failed to sync the metrics of {workflow}: {ex}")
+            continue
+        for run_id, error in failures.items():
+            print(f"Failed to extract the metrics of {workflow} run {run_id}: {error}")
+
+
+def start_workflow_metrics_sync(force: bool = False) -> bool:
+    """Sync the metrics table in a background thread, at most every `SYNC_INTERVAL_SECONDS` unless forced.
+
+    Returns:
+        Whether a sync is running.
+    """
+    with _sync_state.lock:
+        if _sync_state.thread is not None and _sync_state.thread.is_alive():
+            return True
+        now = time.monotonic()
+        if not force and now - _sync_state.last_started < SYNC_INTERVAL_SECONDS:
+            return False
+        if force:
+            fetch_workflow_runs.clear()
+        _sync_state.last_started = now
+        _sync_state.thread = threading.Thread(target=_sync_all_workflows, name="workflow-metrics-sync", daemon=True)
+        _sync_state.thread.start()
+        return True
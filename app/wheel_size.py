@@ -8,6 +8,7 @@ import plotly.express as px
 import streamlit as st
 
 from app.utils.github_utils import fetch_artifacts, fetch_workflow_runs
+from app.utils.workflow_metrics import WHEEL_SIZE, record_run_metrics
 
 st.set_page_config(page_title="Wheel size", page_icon="🛞")
 
@@ -82,6 +83,7 @@ with st.spinner("Fetching data..."):
     if wheel_sizes:
         df = pd.DataFrame(wheel_sizes)
         df = df.sort_values("created_at")
+        record_run_metrics("pr-preview.yml", df, {WHEEL_SIZE: "size_bytes"})
     else:
         st.warning("No wheel artifacts found in the workflow runs.")
         st.stop()
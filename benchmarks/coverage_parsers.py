@@ -0,0 +1,298 @@
+"""Benchmark the coverage parsers on generated, real-size coverage reports.
+
+The reports are generated with a fixed seed, so the benchmark runs offline and
+results are comparable between runs. Measure every new parser or coverage
+representation against it:
+
+    uv run python -m benchmarks.coverage_parsers
+    uv run python -m benchmarks.coverage_parsers --json before.json
+    uv run python -m benchmarks.coverage_parsers --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import io
+import json
+import pickle  # ruff:ignore[suspicious-pickle-import]
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
+
+from app.utils.coverage_parsers import (
+    VITEST_CI_PATH_PREFIX,
+    compare_python_coverage,
+    extract_python_coverage_summary,
+    parse_istanbul_coverage_final,
+    parse_python_coverage_payload,
+    parse_vitest_coverage_payload,
+    read_python_coverage_summaries,
+)
+from app.utils.coverage_rollup import rollup_coverage
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Roughly the size of the combined coverage.py report of streamlit/lib.
+DEFAULT_FILES = 1_500
+DEFAULT_LINES = 200_000
+DEFAULT_REPEAT = 5
+_SEED = 20260101
+_DIRECTORIES = ["elements", "runtime", "web/server", "connections", "commands", "components/v1", "testing/v1"]
+
+
+class BenchmarkResult(NamedTuple):
+    """Timings and memory of a benchmarked function."""
+
+    name: str
+    min_seconds: float
+    median_seconds: float
+    peak_memory_bytes: int
+    result_bytes: int | None  # Pickled size of the result, i.e. what st.cache_data stores
+
+
+def _file_paths(rng: np.random.Generator, num_files: int, suffix: str) -> list[str]:
+    directories = rng.choice(_DIRECTORIES, size=num_files)
+    return [f"{directory}/module_{index}{suffix}" for index, directory in enumerate(directories)]
+
+
+def _statement_counts(rng: np.random.Generator, num_files: int, num_lines: int) -> np.ndarray:
+    # File sizes are skewed, a few large modules and many small ones.
+    weights = rng.lognormal(mean=0, sigma=1, size=num_files)
+    return np.maximum(1, np.round(weights / weights.sum() * num_lines)).astype(np.int64)
+
+
+def make_python_coverage_payload(num_files: int = DEFAULT_FILES, num_lines: int = DEFAULT_LINES) -> dict[str, Any]:
+    """Generate a coverage.py JSON report with about `num_lines` statements over `num_files` files."""
+    rng = np.random.default_rng(_SEED)
+    files: dict[str, Any] = {}
+    total_statements = 0
+    total_covered = 0
+    for path, num_statements in zip(
+        _file_paths(rng, num_files, ".py"), _statement_counts(rng, num_files, num_lines), strict=True
+    ):
+        # Statements are spread over the file with blank lines, comments and docstrings in between.
+        lines = np.cumsum(rng.integers(1, 4, size=num_statements))
+        executed = rng.random(num_statements) < rng.beta(8, 2)
+        executed_lines = lines[executed].tolist()
+        missing_lines = lines[~executed].tolist()
+        total_statements += len(lines)
+        total_covered += len(executed_lines)
+        files[path] = {
+            "executed_lines": executed_lines,
+            "summary": {
+                "covered_lines": len(executed_lines),
+                "num_statements": len(lines),
+                "percent_covered": len(executed_lines) / len(lines) * 100,
+                "percent_covered_display": f"{len(executed_lines) / len(lines) * 100:.0f}",
+                "missing_lines": len(missing_lines),
+                "excluded_lines": 0,
+            },
+            "missing_lines": missing_lines,
+            "excluded_lines": [],
+        }
+    return {
+        "meta": {"version": "7.6.1", "timestamp": "2026-01-01T00:00:00", "branch_coverage": False},
+        "files": files,
+        "totals": {
+            "covered_lines": total_covered,
+            "num_statements": total_statements,
+            "percent_covered": total_covered / total_statements * 100,
+            "missing_lines": total_statements - total_covered,
+            "excluded_lines": 0,
+        },
+    }
+
+
+def make_pr_coverage_payload(develop_payload: dict[str, Any], changed_fraction: float = 0.05) -> dict[str, Any]:
+    """Derive the report of a PR from a develop report, with some files gaining or losing coverage."""
+    rng = np.random.default_rng(_SEED + 1)
+    files = dict(develop_payload["files"])
+    for path in rng.choice(list(files), size=int(len(files) * changed_fraction), replace=False):
+        lines = sorted(files[path]["executed_lines"] + files[path]["missing_lines"])
+        executed = rng.random(len(lines)) < 0.8
+        files[path] = {
+            **files[path],
+            "executed_lines": [line for line, hit in zip(lines, executed, strict=True) if hit],
+            "missing_lines": [line for line, hit in zip(lines, executed, strict=True) if not hit],
+        }
+    return {**develop_payload, "files": files}
+
+
+def _summary(total: int, covered: int) -> dict[str, Any]:
+    return {"total": total, "covered": covered, "skipped": 0, "pct": covered / total * 100 if total else 100}
+
+
+def make_vitest_summary_payload(num_files: int = DEFAULT_FILES, num_lines: int = DEFAULT_LINES) -> dict[str, Any]:
+    """Generate a Vitest `coverage-summary.json` with absolute CI paths like the real reports."""
+    rng = np.random.default_rng(_SEED + 2)
+    payload: dict[str, Any] = {}
+    totals = np.zeros((4, 2), dtype=np.int64)
+    for path, num_statements in zip(
+        _file_paths(rng, num_files, ".tsx"), _statement_counts(rng, num_files, num_lines), strict=True
+    ):
+        counts = np.array([num_statements, num_statements, max(1, num_statements // 8), num_statements // 4])
+        covered = np.round(counts * rng.beta(8, 2)).astype(np.int64)
+        totals += np.column_stack([counts, covered])
+        payload[f"{VITEST_CI_PATH_PREFIX}lib/src/{path}"] = {
+            key: _summary(int(count), int(hits))
+            for key, count, hits in zip(("lines", "statements", "functions", "branches"), counts, covered, strict=True)
+        }
+    payload["total"] = {
+        key: _summary(int(count), int(hits))
+        for key, (count, hits) in zip(("lines", "statements", "functions", "branches"), totals, strict=True)
+    }
+    return payload
+
+
+def _location(line: int) -> dict[str, Any]:
+    return {"start": {"line": line, "column": 2}, "end": {"line": line, "column": 40}}
+
+
+def make_istanbul_coverage_final(num_files: int = DEFAULT_FILES, num_lines: int = DEFAULT_LINES) -> dict[str, Any]:
+    """Generate an Istanbul `coverage-final.json` (Vitest `json` reporter) with statements and branches."""
+    rng = np.random.default_rng(_SEED + 3)
+    payload: dict[str, Any] = {}
+    for path, num_statements in zip(
+        _file_paths(rng, num_files, ".tsx"), _statement_counts(rng, num_files, num_lines), strict=True
+    ):
+        lines = np.cumsum(rng.integers(1, 3, size=num_statements)).tolist()
+        hits = (rng.random(num_statements) < 0.85) * rng.integers(1, 50, size=num_statements)
+        branch_lines = lines[:: max(1, num_statements // 8)]
+
+        full_path = f"{VITEST_CI_PATH_PREFIX}lib/src/{path}"
+        payload[full_path] = {
+            "path": full_path,
+            "statementMap": {str(index): _location(line) for index, line in enumerate(lines)},
+            "s": {str(index): int(count) for index, count in enumerate(hits)},
+            "fnMap": {
+                str(index): {"name": f"fn{index}", "decl": _location(line), "loc": _location(line), "line": line}
+                for index, line in enumerate(branch_lines)
+            },
+            "f": {str(index): int(rng.integers(0, 3)) for index in range(len(branch_lines))},
+            "branchMap": {
+                str(index): {
+                    "type": "if",
+                    "loc": _location(line),
+                    "locations": [_location(line), _location(line)],
+                    "line": line,
+                }
+                for index, line in enumerate(branch_lines)
+            },
+            "b": {str(index): rng.integers(0, 3, size=2).tolist() for index in range(len(branch_lines))},
+        }
+    return payload
+
+
+def measure(
+    name: str, function: Callable[[], Any], repeat: int = DEFAULT_REPEAT, *, measure_result: bool = True
+) -> BenchmarkResult:
+    """Time a function and measure its peak memory and the pickled size of its result.
+
+    The peak memory is measured in a separate run, since tracing allocations slows
+    the function down.
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+        del result
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    result_bytes = len(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)) if measure_result else None
+    return BenchmarkResult(name, min(timings), statistics.median(timings), peak_memory, result_bytes)
+
+
+def run_benchmarks(
+    num_files: int = DEFAULT_FILES, num_lines: int = DEFAULT_LINES, repeat: int = DEFAULT_REPEAT
+) -> list[BenchmarkResult]:
+    """Generate the reports and benchmark every coverage parser on them."""
+    develop_payload = make_python_coverage_payload(num_files, num_lines)
+    pr_payload = make_pr_coverage_payload(develop_payload)
+    coverage_json = json.dumps(develop_payload).encode()
+    vitest_payload = make_vitest_summary_payload(num_files, num_lines)
+    istanbul_json = json.dumps(make_istanbul_coverage_final(num_files, num_lines)).encode()
+    develop_coverage = parse_python_coverage_payload(develop_payload)
+    pr_coverage = parse_python_coverage_payload(pr_payload)
+    paths = list(develop_coverage)
+    stmts = [file_info["total_lines"] for file_info in develop_coverage.values()]
+    covered = [len(file_info["executed_lines"]) for file_info in develop_coverage.values()]
+
+    return [
+        measure("json.load coverage.json", lambda: json.load(io.BytesIO(coverage_json)), repeat, measure_result=False),
+        measure("parse_python_coverage_payload", lambda: parse_python_coverage_payload(develop_payload), repeat),
+        measure("extract_python_coverage_summary", lambda: extract_python_coverage_summary(develop_coverage), repeat),
+        measure(
+            "read_python_coverage_summaries", lambda: read_python_coverage_summaries(io.BytesIO(coverage_json)), repeat
+        ),
+        measure(
+            "compare_python_coverage (PR merge)", lambda: compare_python_coverage(pr_coverage, develop_coverage), repeat
+        ),
+        measure("parse_vitest_coverage_payload", lambda: parse_vitest_coverage_payload(vitest_payload), repeat),
+        measure(
+            "parse_istanbul_coverage_final", lambda: parse_istanbul_coverage_final(io.BytesIO(istanbul_json)), repeat
+        ),
+        measure("rollup_coverage", lambda: rollup_coverage(paths, stmts, covered), repeat),
+    ]
+
+
+def _format_bytes(num_bytes: int | None) -> str:
+    return "-" if num_bytes is None else f"{num_bytes / 1024 / 1024:,.1f} MiB"
+
+
+def format_results(results: list[BenchmarkResult], baseline: dict[str, dict[str, Any]] | None = None) -> str:
+    """Format the results as a table, with the change of the median time against a baseline."""
+    header = f"{'Benchmark':<38} {'Min':>10} {'Median':>10} {'Peak memory':>13} {'Result size':>13}"
+    if baseline is not None:
+        header += f" {'vs. baseline':>13}"
+    rows = [header, "-" * len(header)]
+    for result in results:
+        row = (
+            f"{result.name:<38} {result.min_seconds * 1000:>8.1f}ms {result.median_seconds * 1000:>8.1f}ms"
+            f" {_format_bytes(result.peak_memory_bytes):>13} {_format_bytes(result.result_bytes):>13}"
+        )
+        if baseline is not None:
+            previous = baseline.get(result.name)
+            change = "new" if previous is None else f"{result.median_seconds / previous['median_seconds'] - 1:+.1%}"
+            row += f" {change:>13}"
+        rows.append(row)
+    return "\n".join(rows)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=DEFAULT_FILES, help="Number of files in the reports.")
+    parser.add_argument("--lines", type=int, default=DEFAULT_LINES, help="Number of statements in the reports.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per benchmark.")
+    parser.add_argument("--json", type=Path, help="Write the results to this JSON file.")
+    parser.add_argument("--compare", type=Path, help="Compare the median times with a previous JSON result.")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.files, args.lines, args.repeat)
+    baseline = None
+    if args.compare:
+        baseline = {entry["name"]: entry for entry in json.loads(args.compare.read_text(encoding="utf-8"))}
+    print(f"{args.files:,} files, {args.lines:,} statements, {args.repeat} runs each\n")
+    print(format_results(results, baseline))
+    if args.json:
+        args.json.write_text(json.dumps([result._asdict() for result in results], indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
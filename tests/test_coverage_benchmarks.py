@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from app.utils.coverage_parsers import (
+    extract_python_coverage_summary,
+    parse_python_coverage_payload,
+    parse_vitest_coverage_payload,
+)
+from benchmarks.coverage_parsers import (
+    format_results,
+    make_python_coverage_payload,
+    make_vitest_summary_payload,
+    run_benchmarks,
+)
+
+
+def test_generated_reports_are_consistent() -> None:
+    python_payload = make_python_coverage_payload(num_files=50, num_lines=2_000)
+    summary = extract_python_coverage_summary(parse_python_coverage_payload(python_payload))
+
+    assert summary["total_files"] == 50
+    assert summary["total_stmts"] == python_payload["totals"]["num_statements"]
+    assert summary["covered_stmts"] == python_payload["totals"]["covered_lines"]
+    assert make_python_coverage_payload(num_files=50, num_lines=2_000) == python_payload
+
+    files, totals = parse_vitest_coverage_payload(make_vitest_summary_payload(num_files=50, num_lines=2_000))
+    assert sum(file_info["lines_total"] for file_info in files.values()) == totals["lines"]["total"]
+
+
+def test_run_benchmarks_measures_every_parser() -> None:
+    results = run_benchmarks(num_files=20, num_lines=500, repeat=1)
+
+    assert len({result.name for result in results}) == len(results) == 8
+    assert all(result.min_seconds > 0 and result.peak_memory_bytes > 0 for result in results)
+    table = format_results(results, baseline={"rollup_coverage": results[-1]._asdict()})
+    assert "+0.0%" in table
+    assert "new" in table
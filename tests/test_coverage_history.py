@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import pandas as pd
+import pytest
+
+from app.utils.coverage_history import (
+    coverage_decay,
+    file_history_frame,
+    load_coverage_history,
+    record_coverage_runs,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _history(runs: dict[int, dict[str, tuple[int, int]]]) -> pd.DataFrame:
+    frames = [file_history_frame(run_id, datetime(2026, 1, run_id), stats) for run_id, stats in runs.items()]
+    return pd.concat(frames, ignore_index=True).astype({"path": "category"})
+
+
+def test_record_coverage_runs_appends_new_runs_only(tmp_path: Path) -> None:
+    path = tmp_path / "coverage" / "history.parquet"
+    assert load_coverage_history(path).empty
+
+    record_coverage_runs([file_history_frame(1, datetime(2026, 1, 1), {"a.py": (10, 8), "b.py": (4, 4)})], path)
+    history = record_coverage_runs(
+        [
+            file_history_frame(1, datetime(2026, 1, 1), {"a.py": (10, 0)}),
+            file_history_frame(2, datetime(2026, 1, 2), {"a.py": (10, 7)}),
+        ],
+        path,
+    )
+
+    assert history.equals(load_coverage_history(path))
+    assert history[["run_id", "path", "stmts", "covered"]].astype({"path": str}).to_numpy().tolist() == [
+        [1, "a.py", 10, 8],
+        [1, "b.py", 4, 4],
+        [2, "a.py", 10, 7],
+    ]
+    path.write_bytes(b"not parquet")
+    assert load_coverage_history(path).empty
+
+
+def test_coverage_decay_ranks_files_by_drop_over_the_window() -> None:
+    history = _history(
+        {
+            1: {"a.py": (10, 9), "b.py": (10, 10), "gone.py": (10, 10), "stable.py": (5, 5)},
+            2: {"a.py": (10, 10), "b.py": (10, 9), "gone.py": (10, 1), "stable.py": (5, 5)},
+            3: {"a.py": (10, 6), "b.py": (10, 9), "new.py": (0, 0), "stable.py": (5, 5)},
+            4: {"a.py": (12, 8), "b.py": (10, 9), "new.py": (4, 2), "stable.py": (5, 5)},
+        }
+    )
+
+    report = coverage_decay(history)
+
+    assert report["path"].tolist() == ["new.py", "a.py", "b.py"]
+    a = report.set_index("path").loc["a.py"]
+    assert a["coverage_change"] == pytest.approx((8 / 12 - 0.9) * 100)
+    assert a["change_from_peak"] == pytest.approx((8 / 12 - 1) * 100)
+    assert a["missed_change"] == 3
+    assert a["worst_run_id"] == 3
+    assert a["runs"] == 4
+
+    window = coverage_decay(history, run_ids=[2, 3])
+    assert window["path"].tolist() == ["a.py"]
+    assert coverage_decay(history, run_ids=[]).empty
@@ -1,9 +1,16 @@
+import io
+import json
+
 import pytest
 
 from app.utils.coverage_parsers import (
     extract_python_coverage_summary,
+    newly_uncovered_lines,
+    parse_istanbul_coverage_final,
     parse_python_coverage_payload,
     parse_vitest_coverage_payload,
+    read_python_coverage_summaries,
+    summarize_python_coverage_totals,
 )
 
 
@@ -26,6 +33,41 @@ def test_parse_python_coverage_payload_and_summary() -> None:
     assert summary["coverage_pct"] == pytest.approx(50.0)
 
 
+def test_streamed_python_coverage_summary_matches_full_parse() -> None:
+    payload = {
+        "meta": {"version": "7.6.1"},
+        "files": {
+            "lib/streamlit/foo.py": {
+                "executed_lines": [1, 2, 3],
+                "summary": {"covered_lines": 3, "num_statements": 4, "missing_lines": 1},
+                "missing_lines": [4],
+                "functions": {"foo": {"executed_lines": [2], "summary": {"covered_lines": 1}}},
+            },
+            "lib/streamlit/bar.py": {
+                "executed_lines": [10],
+                "summary": {"covered_lines": 1, "num_statements": 4, "missing_lines": 3},
+                "missing_lines": [11, 12, 13],
+            },
+        },
+        "totals": {"covered_lines": 4, "num_statements": 8, "missing_lines": 4, "percent_covered": 50.0},
+    }
+
+    totals, file_summaries = read_python_coverage_summaries(io.BytesIO(json.dumps(payload).encode()))
+
+    assert totals["percent_covered"] == pytest.approx(50.0)
+    assert file_summaries["lib/streamlit/foo.py"]["covered_lines"] == 3
+    assert summarize_python_coverage_totals(totals, len(file_summaries)) == extract_python_coverage_summary(
+        parse_python_coverage_payload(payload)
+    )
+
+
+def test_newly_uncovered_lines() -> None:
+    develop = parse_python_coverage_payload({"files": {"foo.py": {"executed_lines": [1, 2, 3], "missing_lines": [4]}}})
+    pr = parse_python_coverage_payload({"files": {"foo.py": {"executed_lines": [1], "missing_lines": [2, 4, 5]}}})
+
+    assert newly_uncovered_lines(pr["foo.py"], develop["foo.py"]).to_list() == [2]
+
+
 def test_parse_vitest_coverage_payload_removes_ci_prefix() -> None:
     payload = {
         "/home/runner/work/streamlit/streamlit/frontend/src/foo.ts": {
@@ -45,3 +87,32 @@ def test_parse_vitest_coverage_payload_removes_ci_prefix() -> None:
     assert "src/foo.ts" in parsed
     assert parsed["src/foo.ts"]["file_name"] == "foo.ts"
     assert totals["lines"]["pct"] == 80
+
+
+def test_parse_istanbul_coverage_final_builds_line_and_branch_bitmaps() -> None:
+    def loc(line: int) -> dict:
+        return {"start": {"line": line, "column": 0}, "end": {"line": line, "column": 10}}
+
+    payload = {
+        "/home/runner/work/streamlit/streamlit/frontend/lib/src/foo.ts": {
+            "path": "/home/runner/work/streamlit/streamlit/frontend/lib/src/foo.ts",
+            "statementMap": {"0": loc(1), "1": loc(2), "2": loc(2), "3": loc(5), "4": loc(7)},
+            "s": {"0": 3, "1": 0, "2": 1, "3": 0, "4": 0},
+            "fnMap": {"0": {"name": "foo", "loc": loc(1)}},
+            "f": {"0": 3},
+            "branchMap": {"0": {"loc": loc(2), "type": "if", "locations": [loc(2), {"start": {}, "end": {}}]}},
+            "b": {"0": [1, 0]},
+        }
+    }
+
+    parsed = parse_istanbul_coverage_final(io.BytesIO(json.dumps(payload).encode()))
+    info = parsed["lib/src/foo.ts"]
+
+    assert info["executed_lines"].to_list() == [1, 2]
+    assert info["missing_lines"].to_list() == [5, 7]
+    assert (info["lines_total"], info["lines_covered"]) == (4, 2)
+    assert info["coverage_pct"] == pytest.approx(50.0)
+    assert (info["functions_total"], info["functions_covered"]) == (1, 1)
+    assert (info["branches_total"], info["branches_covered"]) == (2, 1)
+    assert info["executed_branch_lines"].to_list() == [2]
+    assert info["missing_branch_lines"].to_list() == [2]
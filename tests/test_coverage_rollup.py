@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pytest
+
+from app.utils.coverage_rollup import coverage_rollup_figure, directory_children, rollup_coverage
+
+
+def test_rollup_coverage_aggregates_files_up_the_directory_tree() -> None:
+    rollup = rollup_coverage(
+        ["lib/src/a.ts", "lib/src/b.ts", "lib/c.ts", "app/d.ts", "e.ts"],
+        [10, 20, 0, 5, 4],
+        [5, 20, 0, 1, 4],
+    ).set_index("id")
+
+    assert rollup.loc["lib", ["parent", "name", "depth", "is_dir", "files", "stmts", "covered", "missed"]].tolist() == [
+        "",
+        "lib",
+        1,
+        True,
+        3,
+        30,
+        25,
+        5,
+    ]
+    assert rollup.loc["lib/src", "coverage_pct"] == pytest.approx(25 / 30 * 100)
+    assert rollup.loc["lib/src/a.ts", ["parent", "name", "depth", "is_dir", "files"]].tolist() == [
+        "lib/src",
+        "a.ts",
+        3,
+        False,
+        1,
+    ]
+    assert rollup.loc["lib/c.ts", "coverage_pct"] == 100
+    assert not rollup.loc["e.ts", "parent"]
+    assert len(rollup) == 8
+
+
+def test_directory_children_lists_directories_first_by_missed_statements() -> None:
+    rollup = rollup_coverage(["lib/a.ts", "lib/b.ts", "lib/sub/c.ts"], [10, 10, 10], [9, 2, 10])
+
+    assert directory_children(rollup, "lib")["id"].tolist() == ["lib/sub", "lib/b.ts", "lib/a.ts"]
+    assert directory_children(rollup)["id"].tolist() == ["lib"]
+    assert rollup_coverage([], [], []).empty
+
+
+def test_coverage_rollup_figure_only_contains_directories() -> None:
+    rollup = rollup_coverage(["lib/src/a.ts", "lib/b.ts"], [10, 10], [5, 10])
+
+    figure = coverage_rollup_figure(rollup)
+
+    assert list(figure.data[0].ids) == ["lib", "lib/src"]
+    assert list(coverage_rollup_figure(rollup, max_depth=1).data[0].ids) == ["lib"]
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, datetime
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from app.utils import interrupt_data
+from app.utils.workflow_metrics import BUNDLE_ENTRY_GZIP, BUNDLE_TOTAL_GZIP, WHEEL_SIZE, workflow_metrics_frame
 
 if TYPE_CHECKING:
     import pytest
@@ -226,3 +229,18 @@ def test_get_monitored_repo_open_prs(monkeypatch: pytest.MonkeyPatch) -> None:
         "streamlit/streamlit-bokeh",
     ]
     assert list(monitored_prs["Draft"]) == [False, False, True, False]
+
+
+def test_ci_metrics_are_none_until_known(monkeypatch: pytest.MonkeyPatch) -> None:
+    metrics = workflow_metrics_frame(
+        "pr-preview.yml",
+        [1, 2],
+        [datetime(2026, 2, 1), datetime(2026, 2, 5)],
+        {WHEEL_SIZE: [1000.0, 1200.5], BUNDLE_TOTAL_GZIP: [10.0, 12.0], BUNDLE_ENTRY_GZIP: [np.nan, np.nan]},
+    )
+    monkeypatch.setattr(interrupt_data, "load_workflow_metrics", lambda: metrics)
+
+    assert interrupt_data.get_wheel_size_metrics(date(2026, 1, 31)) == (1200, 200)
+    assert interrupt_data.get_bundle_size_metrics(date(2026, 1, 31)) == ((12, 2), None)
+    assert interrupt_data.get_python_test_coverage_metrics(date(2026, 1, 31)) is None
+    assert interrupt_data.get_playwright_test_count_metrics(date(2026, 1, 31)) is None
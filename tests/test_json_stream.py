@@ -0,0 +1,76 @@
+import io
+import json
+
+import pytest
+
+from app.utils.json_stream import JsonScanner
+
+DOCUMENT = {
+    "meta": {"format": 3, "note": 'quotes " and brackets ] } in a string'},
+    "files": {
+        "a.py": {"executed_lines": [1, 2, 3], "summary": {"covered_lines": 3}, "functions": {"f": {"lines": [1]}}},
+        "b \\ c.py": {"summary": {"covered_lines": 0}, "missing_lines": []},
+    },
+    "empty": {},
+    "flags": [True, False, None, -1.5e3],
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_scanner_reads_selected_values_across_chunks(chunk_size: int) -> None:
+    scanner = JsonScanner(io.BytesIO(json.dumps(DOCUMENT, indent=2).encode()), chunk_size=chunk_size)
+
+    summaries = {}
+    values = {}
+    for key in scanner.iter_object():
+        if key == "files":
+            for file_path in scanner.iter_object():
+                for file_key in scanner.iter_object():
+                    if file_key == "summary":
+                        summaries[file_path] = scanner.read_value()
+        elif key != "empty":
+            values[key] = scanner.read_value()
+
+    assert summaries == {"a.py": {"covered_lines": 3}, "b \\ c.py": {"covered_lines": 0}}
+    assert values == {"meta": DOCUMENT["meta"], "flags": DOCUMENT["flags"]}
+
+
+def test_scanner_rejects_truncated_documents() -> None:
+    scanner = JsonScanner(io.StringIO('{"files": {"a.py": [1, 2'))
+
+    with pytest.raises(ValueError, match="end of JSON"):
+        list(scanner.iter_object())
+
+
+def test_scanner_rejects_truncated_values() -> None:
+    scanner = JsonScanner(io.StringIO('{"totals": {"covered_lines": 3'), chunk_size=4)
+    assert next(scanner.iter_object()) == "totals"
+
+    with pytest.raises(ValueError, match="Expecting"):
+        scanner.read_value()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7])
+def test_scanner_reads_scalars_split_across_chunks(chunk_size: int) -> None:
+    scanner = JsonScanner(
+        io.StringIO('{"a": 1.5e3, "b": -12.25, "c": 1E-2,"d": true, "e": "x", "f": 7}'), chunk_size=chunk_size
+    )
+
+    assert {key: scanner.read_value() for key in scanner.iter_object()} == {
+        "a": 1500.0,
+        "b": -12.25,
+        "c": 0.01,
+        "d": True,
+        "e": "x",
+        "f": 7,
+    }
+
+
+def test_scanner_rejects_malformed_values_without_reading_ahead() -> None:
+    stream = io.StringIO('{"a": [1, 2 x], "b": [' + "0, " * 10_000 + "0]}")
+    scanner = JsonScanner(stream, chunk_size=16)
+    assert next(scanner.iter_object()) == "a"
+
+    with pytest.raises(ValueError, match="Expecting"):
+        scanner.read_value()
+    assert stream.tell() < 100
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pytest
+
+from app.perf.utils.lighthouse_metrics import (
+    extract_lighthouse_metrics,
+    lighthouse_app_key,
+    lighthouse_metrics_frame,
+    metric_label,
+)
+
+
+def _report(score: float, lcp: float) -> dict:
+    return {
+        "categories": {"performance": {"score": score}},
+        "audits": {
+            "largest-contentful-paint": {"numericValue": lcp},
+            "cumulative-layout-shift": {"numericValue": 0.01},
+            "total-blocking-time": {"numericValue": None},
+            "mainthread-work-breakdown": {
+                "numericValue": 900.0,
+                "details": {
+                    "items": [
+                        {"group": "scriptEvaluation", "duration": 600.0},
+                        {"group": "styleLayout", "duration": 300.0},
+                    ]
+                },
+            },
+        },
+    }
+
+
+def test_extract_lighthouse_metrics() -> None:
+    metrics = extract_lighthouse_metrics(_report(0.91, 1234.5))
+
+    assert metrics == {
+        "score": pytest.approx(0.91),
+        "lcp_ms": pytest.approx(1234.5),
+        "cls": pytest.approx(0.01),
+        "main_thread_ms": pytest.approx(900.0),
+        "main_thread_scriptEvaluation_ms": pytest.approx(600.0),
+        "main_thread_styleLayout_ms": pytest.approx(300.0),
+    }
+
+
+def test_lighthouse_metrics_frame_is_compact() -> None:
+    frame = lighthouse_metrics_frame(
+        [
+            ("lighthouse/2025_-_hello_-_mobile_-_report.json", _report(0.9, 1000.0)),
+            ("lighthouse/2025_-_hello_-_desktop_-_report.json", _report(1.0, 500.0)),
+        ]
+    )
+
+    assert frame["app_name"].dtype == "category"
+    assert frame["value"].dtype == "float32"
+    lcp = frame[frame["metric"] == "lcp_ms"]
+    assert dict(zip(lcp["app_name"], lcp["value"], strict=True)) == {"hello_mobile": 1000.0, "hello_desktop": 500.0}
+
+
+def test_lighthouse_app_key_and_labels() -> None:
+    assert lighthouse_app_key("2025_-_hello_-_mobile_-_report.json") == "hello_mobile"
+    assert lighthouse_app_key("report.json") == "report.json"
+    assert metric_label("lcp_ms") == "Largest Contentful Paint (ms)"
+    assert metric_label("main_thread_scriptEvaluation_ms") == "Main-thread work: scriptEvaluation (ms)"
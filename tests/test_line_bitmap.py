@@ -0,0 +1,41 @@
+import pickle
+
+import pytest
+
+from app.utils.line_bitmap import LineBitmap
+
+
+def test_line_bitmap_set_operations() -> None:
+    covered = LineBitmap.from_lines([1, 2, 3, 10, 200])
+    changed = LineBitmap.from_lines([3, 4, 200])
+
+    assert len(covered) == 5
+    assert (covered | changed).to_list() == [1, 2, 3, 4, 10, 200]
+    assert (covered & changed).to_list() == [3, 200]
+    assert (covered - changed).to_list() == [1, 2, 10]
+    assert (changed - covered).to_list() == [4]
+    assert covered - covered == LineBitmap()
+    assert len(LineBitmap.from_lines([])) == 0
+
+
+def test_line_bitmap_is_compact_and_picklable() -> None:
+    # Executed lines of a large, well-covered module.
+    lines = [line for line in range(1, 5000) if line % 7]
+    bitmap = LineBitmap.from_lines(lines)
+
+    pickled = pickle.dumps(bitmap)
+    assert pickle.loads(pickled) == bitmap
+    assert len(pickled) * 10 < len(pickle.dumps(lines))
+
+
+def test_line_bitmap_rejects_negative_lines() -> None:
+    with pytest.raises(ValueError, match="negative"):
+        LineBitmap.from_lines([-1, 2])
+
+
+def test_line_bitmap_ranges() -> None:
+    bitmap = LineBitmap.from_ranges([3, 10, 5], [5, 10, 6])
+
+    assert bitmap.to_list() == [3, 4, 5, 6, 10]
+    assert bitmap.to_ranges() == [(3, 6), (10, 10)]
+    assert LineBitmap.from_ranges([], []).to_ranges() == []
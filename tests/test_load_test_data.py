@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.utils.load_test_data import (
+    LATENCY_BUCKETS_PER_OCTAVE,
+    REGRESSION_Z_THRESHOLD,
+    baseline_position,
+    compare_with_baseline,
+    histogram_percentiles,
+    leak_slope_mb_per_session,
+    merge_latency_histograms,
+    parse_latency_histogram,
+    parse_server_samples,
+    server_samples_frame,
+    steady_state_cpu_per_user,
+)
+
+MAX_RELATIVE_ERROR = 2 ** (1 / LATENCY_BUCKETS_PER_OCTAVE) - 1
+
+
+def _hdr(values: list[float]) -> dict:
+    unique, counts = np.unique(values, return_counts=True)
+    return {"p50": 0, "histogram": {"values": unique.tolist(), "counts": counts.tolist()}}
+
+
+def test_parse_latency_histogram_formats() -> None:
+    assert parse_latency_histogram({"p50": 10.0}) is None
+    assert parse_latency_histogram({"histogram": {"values": [1.0], "counts": [1, 2]}}) is None
+
+    hdr = parse_latency_histogram({"histogram": {"values": [10.0, 10.0, 250.0], "counts": [1, 2, 3]}})
+    bucketed = parse_latency_histogram({"histogram": {"bucket_upper_bounds_ms": [10.0, 250.0], "counts": [3, 3]}})
+
+    assert hdr is not None
+    assert bucketed is not None
+    assert hdr.bucket_indices.dtype == np.int16
+    assert hdr.counts.tolist() == [3, 3]
+    assert hdr.bucket_indices.tolist() == bucketed.bucket_indices.tolist()
+
+
+def test_merged_percentiles_match_the_percentiles_of_all_samples() -> None:
+    rng = np.random.default_rng(0)
+    runs = [rng.lognormal(mean=np.log(200 * (i + 1)), sigma=0.5, size=500).round(1) for i in range(3)]
+
+    merged = merge_latency_histograms([parse_latency_histogram(_hdr(run.tolist())) for run in runs] + [None])
+    percentiles = histogram_percentiles(merged, (50, 95, 99))
+
+    all_samples = np.concatenate(runs)
+    assert merged.sum() == all_samples.size
+    for percentile, value in percentiles.items():
+        expected = np.percentile(all_samples, percentile, method="inverted_cdf")
+        assert value == pytest.approx(expected, rel=MAX_RELATIVE_ERROR)
+
+
+def test_histogram_percentiles_of_empty_histogram_are_nan() -> None:
+    percentiles = histogram_percentiles(merge_latency_histograms([]), (50, 95))
+
+    assert all(np.isnan(value) for value in percentiles.values())
+
+
+def _server_metrics(rss_mb: list[float], completed_sessions: list[int], cpu_percent: list[float]) -> dict:
+    return {
+        "memory_rss_mb_peak": max(rss_mb),
+        "samples": {
+            "elapsed_seconds": [float(i) for i in range(len(rss_mb))],
+            "rss_mb": rss_mb,
+            "cpu_percent": cpu_percent,
+            "completed_sessions": completed_sessions,
+            # Misaligned series are ignored.
+            "thread_count": [1],
+        },
+    }
+
+
+def test_parse_server_samples() -> None:
+    assert parse_server_samples({"memory_rss_mb_peak": 10}) is None
+
+    series = parse_server_samples(_server_metrics([100.0, 101.0], [0, 10], [50.0, 60.0]))
+
+    assert series is not None
+    assert series.rss_mb.dtype == np.float32
+    assert series.rss_mb.tolist() == [100.0, 101.0]
+    assert series.thread_count.size == 0
+    assert series.active_sessions.size == 0
+
+
+def test_leak_slope_and_cpu_per_user() -> None:
+    completed = list(range(0, 100, 10))
+    series = parse_server_samples(
+        _server_metrics([100.0 + 0.5 * sessions for sessions in completed], completed, [10.0] * 2 + [40.0] * 8)
+    )
+
+    assert leak_slope_mb_per_session(series) == pytest.approx(0.5)
+    # The first 20% of the samples are ramp-up.
+    assert steady_state_cpu_per_user(series, concurrent_users=20) == pytest.approx(2.0)
+    assert leak_slope_mb_per_session(parse_server_samples(_server_metrics([1.0, 2.0], [5, 5], [1.0, 1.0]))) is None
+    assert steady_state_cpu_per_user(None, concurrent_users=20) is None
+
+
+def test_server_samples_frame_aligns_runs() -> None:
+    series = parse_server_samples(_server_metrics([100.0, 101.0], [0, 10], [50.0, 60.0]))
+
+    frame = server_samples_frame([("run 1", series), ("run 2", series), ("run 3", None)])
+
+    assert sorted(frame["run"].unique()) == ["run 1", "run 2"]
+    assert sorted(frame["metric"].unique()) == ["completed_sessions", "cpu_percent", "rss_mb"]
+    assert len(frame) == 2 * 3 * 2
+
+
+def test_baseline_position_is_robust_to_outlier_runs() -> None:
+    baseline = np.array([100.0, 102.0, 98.0, 101.0, 99.0, 500.0])
+
+    position = baseline_position(110.0, baseline)
+
+    assert position["median"] == pytest.approx(100.5)
+    assert position["std"] == pytest.approx(1.4826 * 1.5)
+    assert position["z_score"] > REGRESSION_Z_THRESHOLD
+    assert position["percentile"] == pytest.approx(100 * 5 / 6)
+    assert baseline_position(100.0, np.full(5, 100.0))["z_score"] == 0
+    assert baseline_position(101.0, np.full(5, 100.0))["z_score"] == np.inf
+
+
+def test_compare_with_baseline_flags_only_changes_beyond_noise() -> None:
+    baseline_df = pd.DataFrame(
+        {
+            "scenario": ["a"] * 6 + ["b"] * 2,
+            "rerun_p50_ms": [50.0, 52.0, 48.0, 51.0, 49.0, 50.0, 10.0, 11.0],
+            "memory_peak_mb": [200.0, 201.0, 199.0, 200.0, 202.0, 198.0, 100.0, 100.0],
+        }
+    )
+    pr_df = pd.DataFrame(
+        {"scenario": ["a", "b", "c"], "rerun_p50_ms": [52.0, 20.0, 5.0], "memory_peak_mb": [250.0, 90.0, None]}
+    )
+
+    comparison = compare_with_baseline(pr_df, baseline_df, ["rerun_p50_ms", "memory_peak_mb"])
+    verdicts = comparison.set_index(["scenario", "metric"])["verdict"].to_dict()
+
+    assert verdicts == {
+        ("a", "memory_peak_mb"): "Regression",
+        ("a", "rerun_p50_ms"): "Within noise",
+        ("b", "memory_peak_mb"): "Insufficient baseline",
+        ("b", "rerun_p50_ms"): "Insufficient baseline",
+        ("c", "rerun_p50_ms"): "PR only",
+    }
+    row = comparison[(comparison["scenario"] == "a") & (comparison["metric"] == "rerun_p50_ms")].iloc[0]
+    assert row["baseline_runs"] == 6
+    assert row["band_low"] < row["baseline_median"] < row["pr"] < row["band_high"]
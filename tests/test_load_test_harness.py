@@ -0,0 +1,57 @@
+import pytest
+
+from app.utils.load_test_data import (
+    histogram_percentiles,
+    merge_latency_histograms,
+    parse_latency_histogram,
+    parse_server_samples,
+)
+from app.utils.load_test_harness import (
+    ScenarioConfig,
+    ServerSample,
+    SessionResult,
+    build_scenario_result,
+    scenario_name,
+    summarize_timings,
+)
+
+
+def test_scenario_name() -> None:
+    assert scenario_name("issues/gh-10025/app.py") == "gh-10025"
+    assert scenario_name("apps/heavy_dataframe.py") == "heavy_dataframe"
+
+
+def test_summarize_timings_histogram_round_trips() -> None:
+    values = [10.0, 10.04, 20.0, 40.0, 80.0]
+    summary = summarize_timings(values)
+
+    assert summary["histogram"] == {"values": [10.0, 20.0, 40.0, 80.0], "counts": [2, 1, 1, 1]}
+    assert summary["max"] == pytest.approx(80.0)
+    percentiles = histogram_percentiles(merge_latency_histograms([parse_latency_histogram(summary)]), [50])
+    assert percentiles[50] == pytest.approx(20.0, rel=0.05)
+    assert "histogram" not in summarize_timings([])
+
+
+def test_build_scenario_result() -> None:
+    samples = [
+        ServerSample(0.0, 100.0, 10.0, 12, 1, 0),
+        ServerSample(1.0, 110.0, 30.0, 14, 2, 1),
+    ]
+    result = build_scenario_result(
+        ScenarioConfig("issues/gh-10025/app.py", concurrent_users=2),
+        [SessionResult(50.0, [5.0, 6.0], None), SessionResult(None, [], "timeout")],
+        samples,
+        duration_seconds=1.5,
+    )
+
+    assert result["scenario"] == "gh-10025"
+    session_metrics = result["session_metrics"]
+    assert (session_metrics["sessions_completed"], session_metrics["sessions_failed"]) == (1, 1)
+    assert session_metrics["errors"] == ["timeout"]
+    assert session_metrics["initial_load_time_ms"]["p50"] == pytest.approx(50.0)
+    assert result["server_metrics"]["memory_rss_mb_growth"] == pytest.approx(10.0)
+
+    series = parse_server_samples(result["server_metrics"])
+    assert series is not None
+    assert series.completed_sessions.tolist() == [0, 1]
+    assert series.thread_count.tolist() == [12, 14]
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from app.utils.load_test_history import load_expired_runs, load_runs_concurrently, save_expired_runs
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_expired_runs_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "load_tests" / "expired_runs.json"
+    assert load_expired_runs(path) == set()
+
+    save_expired_runs({3, 1, 2}, path)
+
+    assert load_expired_runs(path) == {1, 2, 3}
+    path.write_text("not json", encoding="utf-8")
+    assert load_expired_runs(path) == set()
+
+
+def test_load_runs_concurrently_isolates_failures_and_timeouts() -> None:
+    release = threading.Event()
+    progress: list[tuple[int, int]] = []
+
+    def load(run: dict) -> dict | None:
+        if run["id"] == 2:
+            message = "broken zip"
+            raise ValueError(message)
+        if run["id"] == 3:
+            release.wait(5)
+        return None if run["id"] == 4 else {"run": run["id"]}
+
+    try:
+        results, failures = load_runs_concurrently(
+            [{"id": run_id} for run_id in range(1, 6)],
+            load,
+            max_workers=2,
+            timeout_seconds=0.2,
+            on_progress=lambda finished, total: progress.append((finished, total)),
+        )
+    finally:
+        release.set()
+
+    assert results == {1: {"run": 1}, 5: {"run": 5}}
+    assert failures == {2: "ValueError: broken zip", 3: "Timed out after 0.2s"}
+    assert progress[-1] == (5, 5)
@@ -0,0 +1,56 @@
+import pytest
+
+from app.utils.coverage_parsers import parse_python_coverage_payload
+from app.utils.line_bitmap import LineBitmap
+from app.utils.patch_coverage import added_line_ranges, compute_patch_coverage
+
+PATCH = """@@ -1,4 +1,6 @@
+ import os
++import sys
++
+ def foo():
+-    return 1
++    return 2
+\\ No newline at end of file
+@@ -20,2 +22,3 @@ def bar():
+     x = 1
++    y = 2
+
+     return x"""
+
+
+def test_added_line_ranges() -> None:
+    assert added_line_ranges(PATCH) == [(2, 3), (5, 5), (23, 23)]
+    assert added_line_ranges("@@ -0,0 +1 @@\n+only line") == [(1, 1)]
+
+
+def test_compute_patch_coverage_for_python_and_frontend_paths() -> None:
+    python_coverage = parse_python_coverage_payload(
+        {"files": {"streamlit/foo.py": {"executed_lines": [1, 2, 4, 22, 25], "missing_lines": [5, 23]}}}
+    )
+    frontend_coverage = {
+        "lib/src/foo.ts": {"executed_lines": LineBitmap.from_lines([2, 5]), "missing_lines": LineBitmap()}
+    }
+    pr_files = [
+        {"filename": "lib/streamlit/foo.py", "status": "modified", "patch": PATCH},
+        {"filename": "lib/tests/test_foo.py", "status": "added", "patch": "@@ -0,0 +1 @@\n+x = 1"},
+        {"filename": "frontend/lib/src/foo.ts", "status": "modified", "patch": PATCH},
+        {"filename": "lib/streamlit/removed.py", "status": "removed"},
+    ]
+
+    python_df = compute_patch_coverage(pr_files, python_coverage, path_prefix="lib/")
+    frontend_df = compute_patch_coverage(pr_files, frontend_coverage, path_prefix="frontend/")
+
+    assert python_df.to_dict("records") == [
+        {
+            "path": "lib/streamlit/foo.py",
+            "added_lines": 4,
+            "executable_lines": 3,
+            "covered_lines": 1,
+            "uncovered_lines": 2,
+            "patch_coverage_pct": pytest.approx(100 / 3),
+            "uncovered_line_ranges": "5, 23",
+        }
+    ]
+    assert frontend_df["path"].tolist() == ["frontend/lib/src/foo.ts"]
+    assert frontend_df["patch_coverage_pct"].tolist() == [pytest.approx(100.0)]
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pytest
+
+from app.perf.utils.perf_bisect import bisect_commits, classify_value, get_metric_value
+
+
+def _commits(count: int) -> list[str]:
+    return [f"sha{idx:03d}" for idx in range(count)]
+
+
+def test_bisect_commits_finds_culprit_with_logarithmic_probes() -> None:
+    commits = _commits(200)
+    culprit = 137
+    probed: list[str] = []
+
+    def get_value(commit_hash: str) -> float:
+        probed.append(commit_hash)
+        return 150.0 if int(commit_hash[3:]) >= culprit else 100.0
+
+    result = bisect_commits(commits, get_value)
+
+    assert result["culprit_candidates"] == [commits[culprit]]
+    assert result["last_good_index"] == culprit - 1
+    assert result["first_bad_index"] == culprit
+    # Two endpoints plus ceil(log2(199)) midpoints.
+    assert len(probed) <= 2 + 8
+    assert len(set(probed)) == len(probed)
+
+
+def test_bisect_commits_skips_commits_without_values() -> None:
+    commits = _commits(9)
+    missing = {"sha004", "sha005"}
+
+    def get_value(commit_hash: str) -> float | None:
+        if commit_hash in missing:
+            return None
+        return 10.0 if int(commit_hash[3:]) >= 5 else 1.0
+
+    result = bisect_commits(commits, get_value)
+
+    assert result["culprit_candidates"] == ["sha004", "sha005", "sha006"]
+    assert {step["commit_hash"] for step in result["steps"] if step["verdict"] == "skipped"} == missing
+
+
+def test_bisect_commits_stops_when_endpoint_value_missing() -> None:
+    result = bisect_commits(_commits(5), lambda commit_hash: None if commit_hash == "sha000" else 1.0)
+
+    assert result["good_value"] is None
+    assert len(result["steps"]) == 2
+    assert len(result["culprit_candidates"]) == 4
+
+
+def test_bisect_commits_requires_two_commits() -> None:
+    with pytest.raises(ValueError, match="good and a bad commit"):
+        bisect_commits(["sha000"], lambda _: 1.0)
+
+
+def test_classify_value_works_for_improvements() -> None:
+    assert classify_value(12.0, good_value=50.0, bad_value=10.0) == "bad"
+    assert classify_value(45.0, good_value=50.0, bad_value=10.0) == "good"
+
+
+def test_get_metric_value_returns_mean_or_none() -> None:
+    results = {"st_dataframe": {"long_animation_frames_duration_ms": [1.0, 2.0, 3.0]}}
+
+    assert get_metric_value(results, "st_dataframe", "long_animation_frames_duration_ms") == pytest.approx(2.0)
+    assert get_metric_value(results, "st_dataframe", "unknown") is None
+    assert get_metric_value(None, "st_dataframe", "long_animation_frames_duration_ms") is None
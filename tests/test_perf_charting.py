@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from app.perf.utils.charting import build_gantt_timeline, downsample_gantt_timeline
+
+
+def _trace(update_starts: list[float]) -> dict:
+    return {
+        "capturedTraces": {
+            "profiles": {
+                "stApp": {
+                    "entries": [
+                        {"phase": "update", "startTime": start, "actualDuration": 0.1} for start in update_starts
+                    ],
+                    "totalWrittenEntries": len(update_starts),
+                }
+            },
+            "measure": [
+                {"name": "script-run-cycle", "entryType": "measure", "startTime": 0.0, "duration": 50.0},
+                {"name": "other", "entryType": "measure", "startTime": 0.0, "duration": 5.0},
+            ],
+            "long-animation-frame": [{"entryType": "long-animation-frame", "startTime": 900.0, "duration": 100.0}],
+        }
+    }
+
+
+def test_build_gantt_timeline_collects_all_bar_sources() -> None:
+    timeline = build_gantt_timeline(_trace([10.0, 20.0]))
+
+    assert len(timeline) == 4
+    assert set(timeline["Task"]) == {"update", "script-run-cycle", "long-animation-frame"}
+    lafs = timeline[timeline["Task"] == "long-animation-frame"]
+    assert lafs["finish_ms"].tolist() == [1000.0]
+
+
+def test_downsample_gantt_timeline_merges_sub_pixel_bars() -> None:
+    # 10,000 tiny updates packed into the first 100ms.
+    timeline = build_gantt_timeline(_trace([idx * 0.01 for idx in range(10_000)]))
+
+    overview = downsample_gantt_timeline(timeline, 0.0, 1000.0, width_px=1000)
+
+    updates = overview[overview["Task"] == "update"]
+    assert len(updates) == 1
+    assert updates["merged_count"].item() == 10_000
+    assert int(overview["merged_count"].sum()) == len(timeline)
+
+
+def test_downsample_gantt_timeline_keeps_separate_bars_when_zoomed_in() -> None:
+    timeline = build_gantt_timeline(_trace([10.0, 20.0, 30.0]))
+
+    zoomed = downsample_gantt_timeline(timeline, 0.0, 40.0, width_px=1000)
+    clipped = downsample_gantt_timeline(timeline, 15.0, 25.0, width_px=1000)
+
+    assert len(zoomed[zoomed["Task"] == "update"]) == 3
+    assert clipped[clipped["Task"] == "update"]["start_ms"].tolist() == [20.0]
+    assert downsample_gantt_timeline(timeline, 5000.0, 6000.0).empty
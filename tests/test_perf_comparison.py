@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from app.perf.utils.perf_comparison import (
+    compare_lighthouse_scores,
+    compare_long_frames,
+    phases_to_long_frame,
+    results_to_long_frame,
+)
+
+
+def test_results_to_long_frame_splits_react_metric_keys() -> None:
+    frame = results_to_long_frame(
+        {
+            "st_foo": {
+                "stApp__update__duration_ms": [1.0, 3.0],
+                "long_animation_frames_duration_ms": [10.0],
+            }
+        }
+    )
+
+    assert frame.to_dict("records") == [
+        {"test": "st_foo", "profile": "stApp", "phase": "update", "metric": "duration_ms", "value": 1.0},
+        {"test": "st_foo", "profile": "stApp", "phase": "update", "metric": "duration_ms", "value": 3.0},
+        {"test": "st_foo", "profile": "", "phase": "", "metric": "long_animation_frames_duration_ms", "value": 10.0},
+    ]
+
+
+def test_compare_long_frames_joins_all_metrics_at_once() -> None:
+    baseline = results_to_long_frame(
+        {
+            "st_foo": {"stApp__update__duration_ms": [10.0, 20.0], "stApp__mount__count": [1, 1]},
+            "st_removed": {"stApp__update__count": [2]},
+        }
+    )
+    treatment = results_to_long_frame(
+        {
+            "st_foo": {"stApp__update__duration_ms": [30.0], "stApp__mount__count": [1]},
+            "st_new": {"stApp__update__count": [4]},
+        }
+    )
+
+    comparison = compare_long_frames(baseline, treatment).set_index(["test", "profile", "phase", "metric"])
+
+    update = comparison.loc["st_foo", "stApp", "update", "duration_ms"]
+    assert update["baseline"] == pytest.approx(15.0)
+    assert update["treatment"] == pytest.approx(30.0)
+    assert update["difference_pct"] == pytest.approx(100.0)
+    assert comparison.loc[("st_foo", "stApp", "mount", "count"), "difference"] == pytest.approx(0.0)
+    assert comparison.loc[("st_removed", "stApp", "update", "count"), "treatment"] == pytest.approx(0.0)
+    assert math.isnan(comparison.loc[("st_new", "stApp", "update", "count"), "difference_pct"])
+
+
+def test_phases_to_long_frame_uses_duration_and_count() -> None:
+    frame = phases_to_long_frame({"stApp": {"mount": {"actualDuration": 5.0, "baseDuration": 4.0, "count": 1}}})
+
+    assert frame[["metric", "value"]].to_dict("records") == [
+        {"metric": "duration_ms", "value": 5.0},
+        {"metric": "count", "value": 1},
+    ]
+
+
+def test_compare_lighthouse_scores_against_baseline() -> None:
+    comparison = compare_lighthouse_scores(
+        {12: {"hello_mobile": 0.8, "new_app_mobile": 0.5}, 7: {"hello_mobile": 0.95}},
+        {"hello_mobile": 0.9},
+    )
+
+    records = comparison.to_dict("records")
+    assert [(r["pr"], r["app_name"]) for r in records] == [
+        (7, "hello_mobile"),
+        (12, "hello_mobile"),
+        (12, "new_app_mobile"),
+    ]
+    assert records[0]["delta"] == pytest.approx(5.0)
+    assert records[1]["delta"] == pytest.approx(-10.0)
+    assert math.isnan(records[2]["baseline_score"])
+    assert math.isnan(records[2]["delta"])
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from app.perf.utils.perf_run_index import (
+    RunIndex,
+    get_refresh_since,
+    load_run_index,
+    merge_runs_into_index,
+    save_run_index,
+)
+
+
+def _run(run_id: int, sha: str, status: str = "completed", created_at: str = "2025-01-01T00:00:00Z") -> dict:
+    return {
+        "id": run_id,
+        "head_sha": sha,
+        "status": status,
+        "created_at": created_at,
+        "run_started_at": created_at,
+        "html_url": f"https://github.com/streamlit/streamlit/actions/runs/{run_id}",
+    }
+
+
+def test_merge_runs_keeps_latest_run_and_known_artifacts() -> None:
+    index: RunIndex = {"workflow_id": 1, "runs": {}}
+    merge_runs_into_index(index, [_run(2, "sha1"), _run(1, "sha1"), _run(3, "sha2", status="in_progress")])
+    index["runs"]["sha1"]["artifacts"] = [{"name": "a", "archive_download_url": "url", "expired": False}]
+
+    merge_runs_into_index(index, [_run(2, "sha1"), _run(3, "sha2")])
+
+    assert index["runs"]["sha1"]["run_id"] == 2
+    assert index["runs"]["sha1"]["artifacts"] == [{"name": "a", "archive_download_url": "url", "expired": False}]
+    assert index["runs"]["sha2"]["status"] == "completed"
+    assert index["runs"]["sha2"]["artifacts"] is None
+
+
+def test_get_refresh_since() -> None:
+    now = datetime(2025, 4, 1, tzinfo=UTC)
+    index: RunIndex = {"workflow_id": 1, "runs": {}}
+    assert get_refresh_since(index, now) == "2025-01-01T00:00:00Z"
+
+    merge_runs_into_index(
+        index,
+        [
+            _run(1, "sha1", created_at="2025-03-01T00:00:00Z"),
+            _run(2, "sha2", status="queued", created_at="2025-03-02T00:00:00Z"),
+            _run(3, "sha3", created_at="2025-03-03T00:00:00Z"),
+        ],
+    )
+    # The oldest pending run needs to be listed again.
+    assert get_refresh_since(index, now) == "2025-03-02T00:00:00Z"
+
+
+def test_run_index_round_trip(tmp_path) -> None:
+    path = tmp_path / "index.json"
+    assert load_run_index(path) == {"workflow_id": None, "runs": {}}
+
+    index = merge_runs_into_index({"workflow_id": 7, "runs": {}}, [_run(1, "sha1")])
+    save_run_index(index, path)
+
+    assert load_run_index(path) == index
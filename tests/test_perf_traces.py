@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import io
+import json
+
+import numpy as np
+import pytest
+
+from app.perf.utils.perf_traces import (
+    aggregate_phase_stats,
+    calculate_phases_for_all_profiles,
+    get_phases,
+    get_phases_for_all_profiles,
+    get_profile_entries_table,
+    load_files,
+    load_files_from_aggregates,
+    load_files_from_dicts,
+    load_trace_aggregates,
+    sum_long_animation_frames,
+)
+
+
+def _entry(phase: str, actual_duration: float, start_time: float) -> dict:
+    return {
+        "phase": phase,
+        "actualDuration": actual_duration,
+        "baseDuration": actual_duration,
+        "startTime": start_time,
+        "commitTime": start_time + actual_duration,
+    }
+
+
+def _frame(start_time: float, duration: float) -> dict:
+    return {
+        "name": "long-animation-frame",
+        "entryType": "long-animation-frame",
+        "startTime": start_time,
+        "duration": duration,
+        "scripts": [{"name": "script", "entryType": "script", "startTime": start_time, "duration": 1.0}],
+    }
+
+
+def _trace(mount_start: float) -> dict:
+    return {
+        "metrics": [{"name": "heap_mb", "value": 12}],
+        "capturedTraces": {
+            "measure": [{"name": "script-run-cycle", "entryType": "measure", "startTime": 1.0, "duration": 2.0}],
+            "long-animation-frame": [_frame(1.0, 60.0), _frame(mount_start + 5, 80.0), _frame(500.0, 55.0)],
+            "profiles": {
+                "stApp": {
+                    "entries": [
+                        _entry("mount", 10.0, mount_start),
+                        _entry("update", 2.5, mount_start + 20),
+                        _entry("update", 1.5, mount_start + 40),
+                    ],
+                    "totalWrittenEntries": 3,
+                },
+                "stSidebar": {
+                    "entries": [_entry("nested-update", 4.0, mount_start + 50)],
+                    "totalWrittenEntries": 1,
+                },
+                "empty": {"entries": [], "totalWrittenEntries": 0},
+            },
+        },
+    }
+
+
+def test_load_trace_aggregates_matches_per_profile_functions() -> None:
+    trace = _trace(mount_start=100.0)
+
+    aggregates = load_trace_aggregates(io.BytesIO(json.dumps(trace).encode()))
+
+    assert aggregates["phases"] == calculate_phases_for_all_profiles(trace)
+    assert aggregates["first_mount_time"] == pytest.approx(100.0)
+    assert aggregates["metrics"] == trace["metrics"]
+    assert aggregates["raw"] is None
+    assert sum(aggregates["long_animation_frame_durations"]) == pytest.approx(sum_long_animation_frames(trace))
+
+
+def test_load_trace_aggregates_include_raw_returns_parsed_json() -> None:
+    trace = _trace(mount_start=100.0)
+
+    aggregates = load_trace_aggregates(io.StringIO(json.dumps(trace)), include_raw=True)
+
+    assert aggregates["raw"] == trace
+    assert aggregates["phases"] == calculate_phases_for_all_profiles(trace)
+
+
+def test_load_files_from_aggregates_matches_dict_loader() -> None:
+    traces = [("20250101000000_st_foo.json", _trace(100.0)), ("20250101000001_st_bar.json", _trace(50.0))]
+
+    from_dicts = load_files_from_dicts(traces)
+    from_stream = load_files_from_aggregates(
+        (name, load_trace_aggregates(io.BytesIO(json.dumps(trace).encode()))) for name, trace in traces
+    )
+
+    assert from_stream == from_dicts
+    # Frames before the (cumulative) first mount time are filtered out.
+    assert from_dicts["all_long_animation_frames"] == [pytest.approx(135.0), pytest.approx(135.0)]
+    assert from_dicts["first_mount_time"] == pytest.approx(50.0)
+
+
+def test_load_files_reads_directory(tmp_path) -> None:
+    (tmp_path / "20250101000000_st_foo.json").write_text(json.dumps(_trace(100.0)))
+
+    output = load_files(str(tmp_path))
+
+    assert output["filenames"] == ["20250101000000_st_foo.json"]
+    assert output["all_phases"] == [calculate_phases_for_all_profiles(_trace(100.0))]
+    assert output["all_metrics"] == [[{"name": "heap_mb", "value": 12}]]
+
+
+def test_aggregate_phase_stats_matches_numpy_percentiles() -> None:
+    durations = [5.0, 1.0, 3.0, 9.0, 7.0]
+    trace = {
+        "capturedTraces": {
+            "profiles": {
+                "stApp": {
+                    "entries": [_entry("update", d, idx) for idx, d in enumerate(durations)]
+                    + [_entry("mount", 2.0, 0.0)],
+                    "totalWrittenEntries": 6,
+                },
+                "stSidebar": {"entries": [_entry("mount", 4.0, 1.0)], "totalWrittenEntries": 1},
+                "empty": {"entries": [], "totalWrittenEntries": 0},
+            }
+        }
+    }
+
+    stats = aggregate_phase_stats(get_profile_entries_table(trace))
+
+    assert list(stats) == ["stApp", "stSidebar", "empty"]
+    # Phases keep the order of first occurrence within each profile.
+    assert list(stats["stApp"]) == ["update", "mount"]
+    assert stats["empty"] == {}
+    update = stats["stApp"]["update"]
+    assert update["count"] == 5
+    assert update["duration_ms"] == pytest.approx(sum(durations))
+    assert update["p50_ms"] == pytest.approx(np.percentile(durations, 50))
+    assert update["p95_ms"] == pytest.approx(np.percentile(durations, 95))
+    assert stats["stSidebar"]["mount"]["p95_ms"] == pytest.approx(4.0)
+
+
+def test_get_phases_for_all_profiles_matches_single_profile_variant() -> None:
+    trace = _trace(mount_start=100.0)
+
+    phases = get_phases_for_all_profiles(trace)
+
+    for profile_name in trace["capturedTraces"]["profiles"]:
+        expected = get_phases(trace, profile_name)
+        assert {
+            phase: {key: values[key] for key in ("actualDuration", "baseDuration", "count")}
+            for phase, values in phases[profile_name].items()
+        } == expected
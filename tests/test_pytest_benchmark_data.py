@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from app.perf.utils.pytest_benchmark_data import (
+    SUMMARY_STATS,
+    TIME_STATS,
+    UNKNOWN_FINGERPRINT,
+    BenchmarkRun,
+    benchmark_samples_frame,
+    benchmark_summary_frame,
+    build_benchmark_run_table,
+    calibration_factors,
+    compare_latest_by_fingerprint,
+    machine_fingerprint,
+    rescale_by_calibration,
+    sample_quantiles,
+)
+
+
+def _benchmark(name: str, median: float, data: list[float] | None = None) -> dict:
+    stats = dict.fromkeys(SUMMARY_STATS, median)
+    if data is not None:
+        stats["data"] = data
+    return {"name": name, "stats": stats}
+
+
+def _machine_info(cpu_brand: str) -> dict:
+    return {
+        "node": "runner-123",
+        "python_implementation": "CPython",
+        "python_version": "3.12.1",
+        "cpu": {"brand_raw": cpu_brand, "count": 4},
+    }
+
+
+def _run(commit_hash: str, benchmarks: list[dict], cpu_brand: str | None = None) -> BenchmarkRun:
+    output: dict = {"benchmarks": benchmarks}
+    if cpu_brand is not None:
+        output["machine_info"] = _machine_info(cpu_brand)
+    return BenchmarkRun(f"ts-{commit_hash}", commit_hash, build_benchmark_run_table(output))
+
+
+def test_build_benchmark_run_table_stores_samples_as_float32() -> None:
+    table = build_benchmark_run_table(
+        {"benchmarks": [_benchmark("test_a", 1.0, [0.1, 0.2, 0.3]), _benchmark("test_b", 2.0)]}
+    )
+
+    assert table.test_names == ["test_a", "test_b"]
+    assert table.summary["median"].tolist() == [1.0, 2.0]
+    assert table.sample_values.dtype == np.float32
+    assert table.sample_offsets.tolist() == [0, 3, 3]
+
+
+def test_benchmark_frames_and_quantiles() -> None:
+    runs = [
+        _run("aaaaaaaaaa", [_benchmark("test_a", 1.0, [1.0, 2.0, 3.0, 4.0, 5.0]), _benchmark("test_b", 2.0)]),
+        _run("bbbbbbbbbb", [_benchmark("test_a", 1.5, [2.0, 4.0])]),
+    ]
+
+    summary = benchmark_summary_frame(runs)
+    assert summary["test_name"].tolist() == ["test_a", "test_b", "test_a"]
+    assert summary["run_index"].tolist() == [0, 0, 1]
+    assert summary["commit_hash"].tolist() == ["aaaaaaa", "aaaaaaa", "bbbbbbb"]
+
+    samples = benchmark_samples_frame(runs)
+    assert samples["value"].dtype == np.float32
+    assert samples["run_index"].tolist() == [0, 0, 0, 0, 0, 1, 1]
+
+    quantiles = sample_quantiles(samples)
+    assert quantiles["test_name"].tolist() == ["test_a", "test_a"]
+    assert quantiles["samples"].tolist() == [5, 2]
+    assert quantiles["median"].tolist() == [pytest.approx(3.0), pytest.approx(3.0)]
+    assert quantiles["p95"].iloc[0] == pytest.approx(np.percentile([1.0, 2.0, 3.0, 4.0, 5.0], 95))
+
+
+def test_benchmark_frames_without_runs_are_empty() -> None:
+    assert benchmark_summary_frame([]).empty
+    assert sample_quantiles(benchmark_samples_frame([])).empty
+
+
+def test_machine_fingerprint_ignores_the_hostname() -> None:
+    assert machine_fingerprint(_machine_info("AMD EPYC 7763")) == "AMD EPYC 7763 · 4 cores · CPython 3.12.1"
+    assert machine_fingerprint({**_machine_info("AMD EPYC 7763"), "node": "other"}) == machine_fingerprint(
+        _machine_info("AMD EPYC 7763")
+    )
+    assert machine_fingerprint(None) == UNKNOWN_FINGERPRINT
+
+
+def test_calibration_rescales_runs_relative_to_the_calibration_benchmark() -> None:
+    runs = [
+        _run("run0", [_benchmark("calibration", 1.0), _benchmark("test_a", 2.0)], "fast"),
+        _run("run1", [_benchmark("calibration", 2.0), _benchmark("test_a", 4.0)], "slow"),
+        _run("run2", [_benchmark("test_a", 3.0)], "slow"),
+    ]
+    summary = benchmark_summary_frame(runs)
+
+    rescaled = rescale_by_calibration(summary, calibration_factors(summary, "calibration"), TIME_STATS)
+
+    test_a = rescaled[rescaled["test_name"] == "test_a"]
+    # The run without the calibration benchmark is dropped.
+    assert test_a["run_index"].tolist() == [0, 1]
+    assert test_a["median"].tolist() == [pytest.approx(2.0), pytest.approx(2.0)]
+    assert test_a["iterations"].tolist() == [pytest.approx(2.0), pytest.approx(4.0)]
+
+
+def test_compare_latest_by_fingerprint_only_uses_the_same_runner() -> None:
+    runs = [
+        _run("run0", [_benchmark("test_a", 1.0)], "fast"),
+        _run("run1", [_benchmark("test_a", 5.0)], "slow"),
+        _run("run2", [_benchmark("test_a", 1.0)], "fast"),
+        _run("run3", [_benchmark("test_a", 1.5), _benchmark("test_b", 1.0)], "fast"),
+    ]
+
+    comparison = compare_latest_by_fingerprint(benchmark_summary_frame(runs))
+
+    assert comparison["test_name"].tolist() == ["test_a", "test_b"]
+    test_a, test_b = comparison.to_dict("records")
+    assert test_a["baseline"] == pytest.approx(1.0)
+    assert test_a["baseline_runs"] == 2
+    assert test_a["change_pct"] == pytest.approx(50.0)
+    assert test_b["baseline_runs"] == 0
+    assert np.isnan(test_b["change_pct"])
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import io
+import urllib.error
+import urllib.request
+import zipfile
+
+import pytest
+
+from app.utils.report_server import CoverageReportServer
+
+
+def _zip(files: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+        for path, content in files.items():
+            zip_file.writestr(path, content)
+    return buffer.getvalue()
+
+
+def test_report_server_serves_files_from_the_zip_with_caching_headers() -> None:
+    server = CoverageReportServer(max_reports=1)
+    try:
+        url = server.add_report("123", _zip({"index.html": b"<h1>Coverage</h1>", "css/style.css": b"body {}"}))
+        assert url == f"{server.base_url}/123/index.html"
+
+        with urllib.request.urlopen(f"{server.base_url}/123/") as response:
+            assert response.read() == b"<h1>Coverage</h1>"
+            assert response.headers["Content-Type"] == "text/html"
+            assert "immutable" in response.headers["Cache-Control"]
+            etag = response.headers["ETag"]
+        with urllib.request.urlopen(f"{server.base_url}/123/css/style.css") as response:
+            assert response.read() == b"body {}"
+            assert response.headers["Content-Type"] == "text/css"
+
+        with pytest.raises(urllib.error.HTTPError) as not_modified:
+            urllib.request.urlopen(urllib.request.Request(url, headers={"If-None-Match": etag}))
+        assert not_modified.value.code == 304
+        with pytest.raises(urllib.error.HTTPError) as missing_file:
+            urllib.request.urlopen(f"{server.base_url}/123/missing.html")
+        assert missing_file.value.code == 404
+
+        server.add_report("456", _zip({"index.html": b"<h1>Other</h1>"}))
+        assert server.report_url("123") is None
+        assert server.report_url("456") == f"{server.base_url}/456/index.html"
+    finally:
+        server.close()
+
+
+def test_report_server_keeps_evicted_reports_readable_for_handlers_that_got_them() -> None:
+    server = CoverageReportServer(max_reports=1)
+    try:
+        server.add_report("123", _zip({"index.html": b"<h1>Coverage</h1>"}))
+        zip_file = server.get_report("123")
+        assert zip_file is not None
+
+        server.add_report("456", _zip({"index.html": b"<h1>Other</h1>"}))
+        assert server.get_report("123") is None
+        assert zip_file.read("index.html") == b"<h1>Coverage</h1>"
+    finally:
+        server.close()
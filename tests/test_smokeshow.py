@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import zipfile
+from typing import TYPE_CHECKING
+
+import httpx
+
+from app.utils import smokeshow
+from app.utils.smokeshow import (
+    ReportFile,
+    rewrite_asset_references,
+    rewrite_stylesheet_references,
+    upload_to_smokeshow,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def _zip(files: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        for path, content in files.items():
+            zip_file.writestr(path, content)
+    return buffer.getvalue()
+
+
+def test_rewrite_asset_references_resolves_relative_links() -> None:
+    html = b'<link href="../base.css"><script src="sorter.js?v=1"></script><a href="index.html">'
+    asset_urls = {"base.css": "https://assets/a.css", "src/sorter.js": "https://assets/b.js"}
+
+    rewritten = rewrite_asset_references(html, "src/foo.ts.html", asset_urls)
+
+    assert (
+        rewritten
+        == b'<link href="https://assets/a.css"><script src="https://assets/b.js?v=1"></script><a href="index.html">'
+    )
+
+
+def test_rewrite_stylesheet_references_resolves_relative_urls() -> None:
+    css = b".sorter { background: url(sort-arrow-sprite.png) } .x { background: url('img/a.svg#i') url(data:x) }"
+    asset_urls = {"lcov/sort-arrow-sprite.png": "https://assets/c.png", "lcov/img/a.svg": "https://assets/d.svg"}
+
+    rewritten = rewrite_stylesheet_references(css, "lcov/base.css", asset_urls)
+
+    assert rewritten == (
+        b".sorter { background: url(https://assets/c.png) } .x { background: url('https://assets/d.svg#i') url(data:x) }"
+    )
+
+
+def _mock_smokeshow(monkeypatch: pytest.MonkeyPatch, requests: list[tuple[str, bytes]]) -> None:
+    created_sites = iter(range(1, 10))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((str(request.url), request.content))
+        if request.url.path == "/create/":
+            site = next(created_sites)
+            return httpx.Response(200, json={"url": f"https://site{site}/", "secret_key": f"key{site}"})
+        return httpx.Response(200)
+
+    monkeypatch.setattr(smokeshow.st, "secrets", {"smokeshow_auth_key": "auth"})
+    monkeypatch.setattr(smokeshow.httpx, "AsyncHTTPTransport", lambda retries: httpx.MockTransport(handler))
+
+
+def test_upload_to_smokeshow_skips_uploaded_reports_and_assets(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    requests: list[tuple[str, bytes]] = []
+    _mock_smokeshow(monkeypatch, requests)
+    state_path = tmp_path / "state.json"
+    report = {"index.html": b'<link href="style.css">', "style.css": b"body {}"}
+
+    url = asyncio.run(upload_to_smokeshow(_zip(report), state_path))
+
+    assert url == "https://site2/"
+    asset_url = (
+        f"https://site1/{smokeshow.shared_asset_path(ReportFile('style.css', hashlib.sha256(b'body {}').hexdigest()))}"
+    )
+    assert sorted(requests[2:]) == sorted(
+        [(asset_url, b"body {}"), ("https://site2/index.html", f'<link href="{asset_url}">'.encode())]
+    )
+
+    requests.clear()
+    assert asyncio.run(upload_to_smokeshow(_zip(report), state_path)) == url
+    assert requests == []
+
+    changed_url = asyncio.run(upload_to_smokeshow(_zip({**report, "index.html": b"<p>changed</p>"}), state_path))
+    assert changed_url == "https://site3/"
+    assert [request_url for request_url, _ in requests] == [
+        f"{smokeshow.SMOKESHOW_ROOT_URL}/create/",
+        "https://site3/index.html",
+    ]
+
+
+def test_upload_to_smokeshow_rewrites_images_of_shared_stylesheets(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    requests: list[tuple[str, bytes]] = []
+    _mock_smokeshow(monkeypatch, requests)
+    report = {
+        "index.html": b'<link href="base.css">',
+        "base.css": b".sorter { background: url(sort-arrow-sprite.png) }",
+        "sort-arrow-sprite.png": b"png",
+    }
+
+    asyncio.run(upload_to_smokeshow(_zip(report), tmp_path / "state.json"))
+
+    uploads = dict(requests[2:])
+    image_url = f"https://site1/{hashlib.sha256(b'png').hexdigest()[:32]}.png"
+    assert uploads[image_url] == b"png"
+    css = f".sorter {{ background: url({image_url}) }}".encode()
+    css_url = f"https://site1/{hashlib.sha256(css).hexdigest()[:32]}.css"
+    assert uploads[css_url] == css
+    assert uploads["https://site2/index.html"] == f'<link href="{css_url}">'.encode()
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import io
+import json
+import zipfile
+from datetime import date, datetime
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from app.utils import workflow_metrics
+from app.utils.workflow_metrics import (
+    BUNDLE_ENTRY_GZIP,
+    BUNDLE_TOTAL_GZIP,
+    FRONTEND_COVERAGE,
+    PYTHON_COVERAGE,
+    WHEEL_SIZE,
+    extract_js_tests_metrics,
+    extract_pr_preview_metrics,
+    load_workflow_metrics,
+    metric_window,
+    record_run_metrics,
+    record_workflow_metrics,
+    sync_workflow_metrics,
+    window_boundary_runs,
+    workflow_metrics_frame,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def _zip(files: dict[str, object]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        for name, content in files.items():
+            zip_file.writestr(name, json.dumps(content))
+    return buffer.getvalue()
+
+
+def _run(run_id: int, created_at: str) -> dict:
+    return {"id": run_id, "created_at": created_at}
+
+
+def test_record_workflow_metrics_keeps_known_values(tmp_path: Path) -> None:
+    path = tmp_path / "workflow_metrics" / "metrics.parquet"
+    assert load_workflow_metrics(path).empty
+
+    record_workflow_metrics(
+        workflow_metrics_frame("python-tests.yml", [1], [datetime(2026, 1, 1)], {PYTHON_COVERAGE: [90.0]}), path
+    )
+    metrics = record_workflow_metrics(
+        workflow_metrics_frame(
+            "python-tests.yml", [1, 2], [datetime(2026, 1, 1), datetime(2026, 1, 2)], {PYTHON_COVERAGE: [0.0, 91.5]}
+        ),
+        path,
+    )
+
+    assert metrics.equals(load_workflow_metrics(path))
+    assert metrics[["run_id", "value"]].to_numpy().tolist() == [[1, 90.0], [2, 91.5]]
+
+
+def test_record_run_metrics_normalizes_page_frames(tmp_path: Path) -> None:
+    path = tmp_path / "metrics.parquet"
+    runs = pd.DataFrame(
+        {
+            "run_id": [7, 8],
+            "created_at": pd.to_datetime(["2026-01-01T10:00:00Z", "2026-01-02T10:00:00Z"]),
+            "total_gzip": [1000, 1100],
+            "entry_gzip": [300, 280],
+        }
+    )
+
+    record_run_metrics("pr-preview.yml", runs, {BUNDLE_TOTAL_GZIP: "total_gzip", BUNDLE_ENTRY_GZIP: "entry_gzip"}, path)
+
+    metrics = load_workflow_metrics(path)
+    assert len(metrics) == 4
+    assert metrics["created_at"].dt.tz is None
+    assert metric_window(metrics, BUNDLE_ENTRY_GZIP, date(2025, 12, 31)) == (280.0, -20.0)
+
+
+def test_metric_window() -> None:
+    metrics = workflow_metrics_frame(
+        "pr-preview.yml",
+        [1, 2, 3, 4],
+        [datetime(2026, 1, 1), datetime(2026, 1, 5), datetime(2026, 1, 6), datetime(2026, 1, 7)],
+        {WHEEL_SIZE: [100.0, 110.0, np.nan, 125.0]},
+    )
+
+    assert metric_window(metrics, WHEEL_SIZE, date(2026, 1, 4)) == (125.0, 15.0)
+    # Runs of the `since` day itself are not in the window, like with `created:>since`.
+    assert metric_window(metrics, WHEEL_SIZE, date(2026, 1, 1)) == (125.0, 15.0)
+    # Runs without a value are skipped at the window start too.
+    assert metric_window(metrics, WHEEL_SIZE, date(2026, 1, 5)) == (125.0, 0.0)
+    assert metric_window(metrics, WHEEL_SIZE, date(2026, 2, 1)) == (125.0, 0.0)
+    assert metric_window(metrics, PYTHON_COVERAGE, date(2026, 1, 1)) is None
+
+
+def test_window_boundary_runs_selects_first_run_of_each_day_and_latest_run() -> None:
+    runs = [
+        _run(5, "2026-01-02T18:00:00Z"),
+        _run(4, "2026-01-02T09:00:00Z"),
+        _run(3, "2026-01-01T20:00:00Z"),
+        _run(2, "2026-01-01T12:00:00Z"),
+        _run(1, "2026-01-01T08:00:00Z"),
+    ]
+
+    assert sorted(run["id"] for run in window_boundary_runs(runs)) == [1, 4, 5]
+    assert window_boundary_runs([]) == []
+
+
+def test_extractors(monkeypatch: pytest.MonkeyPatch) -> None:
+    contents = {
+        "bundle": _zip({"bundle.json": [{"gzipSize": 10, "isEntry": True}, {"gzipSize": 5}]}),
+        "vitest": _zip(
+            {
+                "coverage/coverage-final.json": {},
+                "coverage/coverage-summary.json": {"total": {"lines": {"pct": 87.5}}, "a.ts": {}},
+            }
+        ),
+    }
+    monkeypatch.setattr(workflow_metrics, "download_artifact", contents.get)
+
+    assert extract_pr_preview_metrics(
+        [
+            {"name": "whl_file", "size_in_bytes": 42},
+            {"name": "bundle_analysis_json", "archive_download_url": "bundle"},
+        ]
+    ) == {WHEEL_SIZE: 42, BUNDLE_TOTAL_GZIP: 15, BUNDLE_ENTRY_GZIP: 10}
+    assert extract_js_tests_metrics([{"name": "vitest_coverage_json", "archive_download_url": "vitest"}]) == {
+        FRONTEND_COVERAGE: 87.5
+    }
+    # Missing artifacts are recorded as missing values, failed downloads are retried later.
+    assert np.isnan(extract_js_tests_metrics([])[FRONTEND_COVERAGE])
+    assert extract_js_tests_metrics([{"name": "vitest_coverage_json", "archive_download_url": "gone"}]) is None
+
+
+def test_sync_workflow_metrics_extracts_missing_boundary_runs_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "metrics.parquet"
+    runs = [
+        _run(3, "2026-01-10T09:00:00Z"),
+        _run(2, "2026-01-09T12:00:00Z"),
+        _run(1, "2026-01-09T08:00:00Z"),
+    ]
+    coverage = {1: 90.0, 3: 91.0}
+    fetched_artifacts: list[int] = []
+
+    def fake_fetch_artifacts(run_id: int) -> list[dict]:
+        fetched_artifacts.append(run_id)
+        return [{"name": "run", "id": run_id}]
+
+    monkeypatch.setattr(workflow_metrics, "fetch_workflow_runs", lambda workflow, limit, since=None: runs)
+    monkeypatch.setattr(workflow_metrics, "fetch_artifacts", fake_fetch_artifacts)
+    monkeypatch.setitem(
+        workflow_metrics.WORKFLOW_METRIC_EXTRACTORS,
+        "python-tests.yml",
+        lambda artifacts: {PYTHON_COVERAGE: coverage[artifacts[0]["id"]]},
+    )
+
+    assert sync_workflow_metrics("python-tests.yml", today=date(2026, 1, 10), path=path) == (2, {})
+    assert sync_workflow_metrics("python-tests.yml", today=date(2026, 1, 10), path=path) == (0, {})
+
+    assert sorted(fetched_artifacts) == [1, 3]
+    assert metric_window(load_workflow_metrics(path), PYTHON_COVERAGE, date(2026, 1, 8)) == (91.0, 1.0)